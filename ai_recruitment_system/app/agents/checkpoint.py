@@ -0,0 +1,93 @@
+"""
+Durable LangGraph checkpointing backed by a local SQLite file.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from ..core.config import Config
+
+
+class SQLiteCheckpointSaver(SqliteSaver):
+    """LangGraph's SqliteSaver on a database file, usable from sync and async runs.
+    
+    ``SqliteSaver`` only implements the sync interface; batch applications run
+    their graphs on an event loop, so the async methods run the same short
+    local queries in a worker thread. Threads of finished applications should
+    be deleted with ``delete_thread`` so the store only holds work in progress.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Database file, ':memory:' for a process-local store
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        super().__init__(conn)
+        self.setup()
+    
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+    
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        checkpoints = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint in checkpoints:
+            yield checkpoint
+    
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+    
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+    
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+
+
+_default_saver: Optional[SQLiteCheckpointSaver] = None
+_default_saver_lock = threading.Lock()
+
+
+def get_checkpointer() -> Optional[SQLiteCheckpointSaver]:
+    """Return the process-wide checkpoint saver configured in Config, None if disabled."""
+    global _default_saver
+    with _default_saver_lock:
+        if _default_saver is None and Config.CHECKPOINT_PATH:
+            _default_saver = SQLiteCheckpointSaver(Config.CHECKPOINT_PATH)
+        return _default_saver
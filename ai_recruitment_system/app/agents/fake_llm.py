@@ -0,0 +1,145 @@
+"""
+Deterministic offline chat model for development, tests and benchmarks.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Any, Iterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+EXPERIENCE_LEVELS = ("Entry-Level", "Mid-Level", "Senior-Level")
+SKILL_MATCHES = ("Strong Match", "Partial Match", "No Match")
+
+
+class DeterministicChatModel(BaseChatModel):
+    """Local stand-in for a chat model with simulated latency.
+    
+    Answers are derived from a hash of the prompt, so the same prompt always
+    gets the same answer and the same latency. Replies follow the formats the
+    recruitment node prompts ask for (name, experience level, skill match,
+    score, JSON evaluation or free-text recommendations).
+    """
+    
+    latency: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
+    model_name: str = "deterministic-fake"
+    
+    @property
+    def _llm_type(self) -> str:
+        return "deterministic-fake"
+    
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt, rng = self._prepare(messages)
+        delay = self._delay(rng)
+        if delay:
+            time.sleep(delay)
+        return self._result(prompt, rng)
+    
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt, rng = self._prepare(messages)
+        delay = self._delay(rng)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._result(prompt, rng)
+    
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        # Same reply as _generate, word by word with the latency spread over the words
+        prompt, rng = self._prepare(messages)
+        delay = self._delay(rng)
+        message = self._result(prompt, rng).generations[0].message
+        words = re.findall(r"\S+\s*|\s+", message.content) or [""]
+        for i, word in enumerate(words):
+            if delay:
+                time.sleep(delay / len(words))
+            usage = message.usage_metadata if i == len(words) - 1 else None
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=word, usage_metadata=usage))
+            if run_manager:
+                run_manager.on_llm_new_token(word, chunk=chunk)
+            yield chunk
+    
+    def _prepare(self, messages: List[BaseMessage]):
+        """Join the prompt text and seed a generator from it."""
+        prompt = "\n".join(str(message.content) for message in messages)
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode("utf-8")).digest()
+        return prompt, random.Random(int.from_bytes(digest[:8], "big"))
+    
+    def _delay(self, rng: random.Random) -> float:
+        """Simulated call latency in seconds."""
+        return max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter))
+    
+    def _result(self, prompt: str, rng: random.Random) -> ChatResult:
+        reply = self._reply(prompt, rng)
+        usage = {
+            "input_tokens": len(prompt) // 4,
+            "output_tokens": max(1, len(reply) // 4),
+            "total_tokens": len(prompt) // 4 + max(1, len(reply) // 4),
+        }
+        message = AIMessage(content=reply, usage_metadata=usage)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+    
+    def _reply(self, prompt: str, rng: random.Random) -> str:
+        """Answer in the format requested by the prompt."""
+        name = self._guess_name(prompt)
+        experience = rng.choice(EXPERIENCE_LEVELS)
+        skills = rng.choice(SKILL_MATCHES)
+        score = rng.randint(1, 10)
+        
+        if "format_instructions" in prompt or '"properties"' in prompt:
+            return json.dumps({
+                "candidate_name": name,
+                "experience_level": experience,
+                "skill_match": skills,
+                "technical_score": score,
+            })
+        if "learning recommendations" in prompt:
+            return (
+                "1. Complete an advanced course in the core technologies of this role.\n"
+                "2. Build and publish a portfolio project that uses them end to end.\n"
+                "3. Contribute to an open-source project to gain collaborative experience."
+            )
+        if "candidate's name" in prompt:
+            return name
+        if "technical competency" in prompt:
+            return str(score)
+        if "experience level" in prompt:
+            return experience
+        if "skill match" in prompt:
+            return skills
+        return "OK"
+    
+    @staticmethod
+    def _guess_name(prompt: str) -> str:
+        """Use the first short capitalized line of the CV as the candidate name."""
+        match = re.search(r"(?:CV:|the name:)(.*)", prompt, re.S)
+        for line in (match.group(1) if match else prompt).splitlines():
+            line = line.strip()
+            if 1 < len(line.split()) <= 4 and all(word[:1].isupper() for word in line.split()):
+                return line
+        return "Unknown Candidate"
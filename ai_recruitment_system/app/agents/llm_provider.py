@@ -0,0 +1,69 @@
+"""
+Chat model provider selection.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from ..core.config import Config
+from ..core.exceptions import ConfigurationError
+
+
+def create_chat_model(provider: Optional[str] = None, model: Optional[str] = None) -> BaseChatModel:
+    """
+    Create the chat model for a provider.
+    
+    Args:
+        provider: 'openai' or 'fake' (defaults to Config.LLM_PROVIDER)
+        model: Model name (defaults to Config.OPENAI_MODEL)
+        
+    Returns:
+        Configured chat model
+        
+    Raises:
+        ConfigurationError: If the provider is unknown
+    """
+    provider = provider or Config.LLM_PROVIDER
+    model = model or Config.OPENAI_MODEL
+    if provider == "openai":
+        from langchain_openai import ChatOpenAI
+        # Retries are handled by the shared LLM scheduler
+        return ChatOpenAI(model=model, api_key=Config.OPENAI_API_KEY, max_retries=0)
+    if provider == "fake":
+        from .fake_llm import DeterministicChatModel
+        return DeterministicChatModel(
+            latency=Config.FAKE_LLM_LATENCY,
+            jitter=Config.FAKE_LLM_JITTER,
+            seed=Config.FAKE_LLM_SEED
+        )
+    raise ConfigurationError(f"Unknown LLM provider '{provider}', expected one of {', '.join(Config.LLM_PROVIDERS)}")
+
+
+_shared_models: Dict[Tuple[str, str], BaseChatModel] = {}
+_shared_models_lock = threading.Lock()
+
+
+def get_chat_model(provider: Optional[str] = None, model: Optional[str] = None) -> BaseChatModel:
+    """
+    Return the process-wide chat model for a provider and model name.
+    
+    Chat models are thread-safe, so one instance (and its keep-alive HTTP
+    connection pool) is shared by every agent and session in the process.
+    
+    Args:
+        provider: 'openai' or 'fake' (defaults to Config.LLM_PROVIDER)
+        model: Model name (defaults to Config.OPENAI_MODEL)
+        
+    Returns:
+        Shared chat model
+        
+    Raises:
+        ConfigurationError: If the provider is unknown
+    """
+    key = (provider or Config.LLM_PROVIDER, model or Config.OPENAI_MODEL)
+    with _shared_models_lock:
+        if key not in _shared_models:
+            _shared_models[key] = create_chat_model(*key)
+        return _shared_models[key]
@@ -2,90 +2,319 @@
 Workflow nodes for the recruitment agent.
 """
 
-from langchain_openai import ChatOpenAI
+import hashlib
+import json
+
 from langchain_core.prompts import ChatPromptTemplate
-from typing import Dict, Any
+from langchain_core.output_parsers import BaseOutputParser, PydanticOutputParser
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.prompt_values import PromptValue
+from langgraph.config import get_stream_writer
+from typing import Dict, Any, Optional
 
 from ..models.application_state import ApplicationState
+from ..models.evaluation import CandidateEvaluation
+from ..core.cache import CacheBackend, get_llm_cache, make_cache_key
 from ..core.config import Config
+from ..core.exceptions import AgentWorkflowError
+from ..core.metrics import record_fallback, record_llm_call
+from ..core.scheduler import LLMScheduler, get_llm_scheduler
+from ..services.cv_sections import build_node_contexts
+from ..services.prescreen import experience_level_from_years, guess_candidate_name, prescreen
+from .llm_provider import get_chat_model
+from .routing import route_application
+
+
+# Prompts as (static instructions, variable part). Instructions and the job
+# posting come first so every candidate screened for the same job shares a
+# stable prompt prefix that providers can cache; the CV always comes last.
+PROMPTS = {
+    "extract_info": (
+        "Extract the candidate's name from this CV. Return only the name.",
+        "CV: {cv_text}"
+    ),
+    "categorize_experience": (
+        "Categorize experience level based on CV and job posting.\n"
+        "Reply ONLY with: 'Entry-Level', 'Mid-Level', or 'Senior-Level'",
+        "Job: {job_posting}\n\nCV: {cv_text}"
+    ),
+    "assess_skills": (
+        "Assess skill match between CV and job requirements.\n"
+        "Reply ONLY with: 'Strong Match', 'Partial Match', or 'No Match'",
+        "Job: {job_posting}\n\nCV: {cv_text}"
+    ),
+    "technical_evaluation": (
+        "Rate technical competency 1-10. Reply ONLY with the number.",
+        "Experience: {experience_level}\nSkills: {skill_match}\n\nCV: {cv_text}"
+    ),
+    "evaluate_candidate": (
+        "Evaluate this candidate against the job posting.\n"
+        "Extract the candidate's name, categorize their experience level,\n"
+        "assess the skill match and rate technical competency 1-10.\n\n"
+        "{format_instructions}",
+        "Job: {job_posting}\n\nCV: {cv_text}"
+    ),
+    "reject_with_feedback": (
+        "Create learning recommendations for this rejected candidate.\n"
+        "Be encouraging and specific about courses, projects, and skills to develop.",
+        "Job: {job_posting}\n\n"
+        "Candidate: {candidate_name}\n"
+        "Experience: {experience_level}\n"
+        "Skills: {skill_match}\n"
+        "Score: {technical_score}"
+    ),
+}
+
+
+def _write_chunk(node: str, text: str) -> None:
+    """Send generated text to the custom stream of the running graph, if any."""
+    if not text:
+        return
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        # Node called directly, outside a graph run
+        return
+    writer({"node": node, "text": text})
 
 
 class RecruitmentNodes:
     """Collection of workflow nodes for the recruitment process."""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(model=Config.OPENAI_MODEL, api_key=Config.OPENAI_API_KEY)
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        cache: Optional[CacheBackend] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        model: Optional[str] = None,
+        prescreen_mode: Optional[str] = None,
+        prescreen_reject_below: Optional[float] = None,
+        prescreen_low_priority_below: Optional[float] = None
+    ):
+        self._llm = llm
+        self._model = model
+        # Fixed at construction, so a graph, its decisions and its stored-result key agree
+        self.prescreen_mode = prescreen_mode or Config.PRESCREEN_MODE
+        self.prescreen_reject_below = (
+            Config.PRESCREEN_REJECT_BELOW if prescreen_reject_below is None else prescreen_reject_below
+        )
+        self.prescreen_low_priority_below = (
+            Config.PRESCREEN_LOW_PRIORITY_BELOW if prescreen_low_priority_below is None
+            else prescreen_low_priority_below
+        )
+        self.cache = cache if cache is not None else get_llm_cache()
+        self.scheduler = scheduler or get_llm_scheduler()
+        self.evaluation_parser = PydanticOutputParser(pydantic_object=CandidateEvaluation)
+        # Templates are parsed once here rather than on every node call
+        self.prompts: Dict[str, ChatPromptTemplate] = {
+            name: ChatPromptTemplate.from_messages([("system", instructions), ("human", body)])
+            for name, (instructions, body) in PROMPTS.items()
+        }
+        self.prompts["evaluate_candidate"] = self.prompts["evaluate_candidate"].partial(
+            format_instructions=self.evaluation_parser.get_format_instructions()
+        )
+        # Template identity for cache keys, including partially applied variables
+        self._prompt_keys = {
+            name: prompt.pretty_repr() + json.dumps(prompt.partial_variables, sort_keys=True)
+            for name, prompt in self.prompts.items()
+        }
+        # Short hash of the templates, so stored results can be tied to a prompt version
+        self.prompt_version = hashlib.sha256(
+            json.dumps(self._prompt_keys, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+    
+    @property
+    def llm(self) -> BaseChatModel:
+        """Chat model, resolved on first use so construction stays cheap."""
+        if self._llm is None:
+            self._llm = get_chat_model(model=self._model)
+        return self._llm
+    
+    @property
+    def model_id(self) -> str:
+        """Identifier of the chat model, used to namespace cached responses."""
+        return getattr(self.llm, "model_name", None) or self.llm._llm_type
+    
+    def _invoke(
+        self,
+        name: str,
+        inputs: Dict[str, Any],
+        parser: Optional[BaseOutputParser] = None,
+        stream: bool = False
+    ) -> Any:
+        """
+        Run a prompt through the LLM, serving repeated requests from the cache.
+        
+        Calls go through the shared scheduler, which enforces the rate limit
+        budgets and retries rate-limited or transiently failing requests.
+        
+        Args:
+            name: Key of the prompt in ``self.prompts``
+            inputs: Template variables
+            parser: Optional parser applied to the response text
+            stream: Write response chunks to the graph's custom stream as
+                they are generated
+                
+        Returns:
+            Response text, or the parsed value when a parser is given
+        """
+        key = None
+        if self.cache is not None:
+            key = make_cache_key(self.model_id, self._prompt_keys[name], inputs)
+            cached = self.cache.get(key)
+            if cached is not None:
+                record_llm_call(self.model_id, cache_hit=True)
+                if stream:
+                    _write_chunk(name, cached)
+                return parser.parse(cached) if parser else cached
+        
+        prompt_value = self.prompts[name].invoke(inputs)
+        # Rough token estimate (~4 characters per token) reserved up front;
+        # the scheduler corrects it with the reported usage
+        estimated_tokens = len(prompt_value.to_string()) // 4 + Config.LLM_COMPLETION_TOKENS_ESTIMATE
+        if stream:
+            message = self.scheduler.call(lambda: self._stream(name, prompt_value), estimated_tokens)
+        else:
+            message = self.scheduler.call(lambda: self.llm.invoke(prompt_value), estimated_tokens)
+        record_llm_call(self.model_id, getattr(message, "usage_metadata", None))
+        content = message.content
+        # Parse before caching so unusable responses are never replayed
+        value = parser.parse(content) if parser else content
+        if key is not None:
+            self.cache.set(key, content)
+        return value
+    
+    def segment_cv(self, state: ApplicationState) -> ApplicationState:
+        """Split the CV into sections once and build every node's token-budgeted context."""
+        return {"cv_context": build_node_contexts(state['cv_text'])}
+    
+    @staticmethod
+    def _cv_context(state: ApplicationState, node: str) -> str:
+        """CV context of a node, segmenting on the spot for states that skipped segmentation."""
+        contexts = state.get('cv_context') or build_node_contexts(state['cv_text'])
+        return contexts[node]
+    
+    def _stream(self, name: str, prompt_value: PromptValue) -> BaseMessage:
+        """Generate a response chunk by chunk, writing each chunk to the graph's stream."""
+        message = None
+        try:
+            for chunk in self.llm.stream(prompt_value):
+                _write_chunk(name, chunk.text)
+                # Models without native streaming yield their whole response once
+                message = chunk if message is None else message + chunk
+        except Exception as e:
+            if message is None:
+                raise
+            # Chunks already sent cannot be taken back, so a retry would repeat them
+            raise AgentWorkflowError(f"Streaming {name} failed after partial output: {e}") from e
+        return message if message is not None else AIMessage(content="")
+    
+    def prescreen_candidate(self, state: ApplicationState) -> ApplicationState:
+        """Match required skills locally before any LLM call."""
+        result = prescreen(
+            state['cv_text'],
+            state.get('required_skills') or [],
+            self.prescreen_mode,
+            self.prescreen_reject_below,
+            self.prescreen_low_priority_below
+        )
+        update = {
+            "matched_skills": result.matched_skills,
+            "prescreen_score": result.score,
+            "years_experience": result.years_experience,
+            "prescreen_decision": result.decision
+        }
+        if result.decision == "reject":
+            # Rejections skip the LLM evaluation, so fill its fields locally
+            update.update({
+                "candidate_name": guess_candidate_name(state['cv_text']),
+                "experience_level": experience_level_from_years(result.years_experience),
+                "skill_match": "No Match",
+                "technical_score": str(max(1, round(result.score * 10)))
+            })
+        return update
     
     def extract_candidate_info(self, state: ApplicationState) -> ApplicationState:
         """Extract candidate name from CV text."""
         try:
-            prompt = ChatPromptTemplate.from_template(
-                "Extract the candidate's name from this CV. Return only the name: {cv_text}"
-            )
-            chain = prompt | self.llm
-            result = chain.invoke({"cv_text": state['cv_text'][:1000]})
-            return {"candidate_name": result.content.strip()}
+            result = self._invoke("extract_info", {"cv_text": self._cv_context(state, "extract_info")})
+            return {"candidate_name": result.strip()}
         except Exception:
+            record_fallback()
             return {"candidate_name": "Unknown Candidate"}
     
     def categorize_experience(self, state: ApplicationState) -> ApplicationState:
         """Categorize candidate experience level."""
         try:
-            prompt = ChatPromptTemplate.from_template("""
-            Categorize experience level based on CV and job posting.
-            Reply ONLY with: 'Entry-Level', 'Mid-Level', or 'Senior-Level'
-            
-            CV: {cv_text}
-            Job: {job_posting}
-            """)
-            chain = prompt | self.llm
-            result = chain.invoke({
-                "cv_text": state['cv_text'][:1500],
-                "job_posting": state['job_posting'][:1000]
+            result = self._invoke("categorize_experience", {
+                "cv_text": self._cv_context(state, "categorize_experience"),
+                "job_posting": state['job_posting']
             })
-            return {"experience_level": result.content.strip()}
+            return {"experience_level": result.strip()}
         except Exception:
+            record_fallback()
             return {"experience_level": "Mid-Level"}
     
     def assess_skills(self, state: ApplicationState) -> ApplicationState:
         """Assess skill match between CV and job requirements."""
         try:
-            prompt = ChatPromptTemplate.from_template("""
-            Assess skill match between CV and job requirements.
-            Reply ONLY with: 'Strong Match', 'Partial Match', or 'No Match'
-            
-            CV: {cv_text}
-            Job: {job_posting}
-            """)
-            chain = prompt | self.llm
-            result = chain.invoke({
-                "cv_text": state['cv_text'][:1500],
-                "job_posting": state['job_posting'][:1000]
+            result = self._invoke("assess_skills", {
+                "cv_text": self._cv_context(state, "assess_skills"),
+                "job_posting": state['job_posting']
             })
-            return {"skill_match": result.content.strip()}
+            return {"skill_match": result.strip()}
         except Exception:
+            record_fallback()
             return {"skill_match": "Partial Match"}
     
     def technical_evaluation(self, state: ApplicationState) -> ApplicationState:
         """Evaluate technical competency score."""
         try:
-            prompt = ChatPromptTemplate.from_template("""
-            Rate technical competency 1-10. Reply ONLY with the number.
-            
-            CV: {cv_text}
-            Experience: {experience_level}
-            Skills: {skill_match}
-            """)
-            chain = prompt | self.llm
-            result = chain.invoke({
-                "cv_text": state['cv_text'][:1500],
+            result = self._invoke("technical_evaluation", {
+                "cv_text": self._cv_context(state, "technical_evaluation"),
                 "experience_level": state['experience_level'],
                 "skill_match": state['skill_match']
             })
-            return {"technical_score": result.content.strip()}
+            return {"technical_score": result.strip()}
         except Exception:
+            record_fallback()
             return {"technical_score": "5"}
     
+    def _evaluate(self, state: ApplicationState) -> Dict[str, str]:
+        """Run the structured evaluation prompt and return its fields."""
+        evaluation = self._invoke("evaluate_candidate", {
+            "cv_text": self._cv_context(state, "evaluate_candidate"),
+            "job_posting": state['job_posting']
+        }, self.evaluation_parser)
+        return {
+            "candidate_name": evaluation.candidate_name.strip(),
+            "experience_level": evaluation.experience_level,
+            "skill_match": evaluation.skill_match,
+            "technical_score": str(evaluation.technical_score)
+        }
+    
+    def evaluate_candidate(self, state: ApplicationState) -> ApplicationState:
+        """Extract name, experience, skill match and score in one structured call."""
+        try:
+            return self._evaluate(state)
+        except Exception:
+            record_fallback()
+            return {
+                "candidate_name": "Unknown Candidate",
+                "experience_level": "Mid-Level",
+                "skill_match": "Partial Match",
+                "technical_score": "5"
+            }
+    
+    def review_evaluation(self, state: ApplicationState) -> ApplicationState:
+        """Re-evaluate a borderline first pass, keeping it if this call fails too."""
+        try:
+            return self._evaluate(state)
+        except Exception:
+            record_fallback()
+            return {}
+    
     def schedule_interview(self, state: ApplicationState) -> ApplicationState:
         """Generate interview scheduling response."""
         return {
@@ -101,30 +330,20 @@ class RecruitmentNodes:
     def reject_with_feedback(self, state: ApplicationState) -> ApplicationState:
         """Generate rejection response with learning recommendations."""
         try:
-            prompt = ChatPromptTemplate.from_template("""
-            Create learning recommendations for this rejected candidate.
-            Be encouraging and specific about courses, projects, and skills to develop.
-            
-            Candidate: {candidate_name}
-            Experience: {experience_level}
-            Skills: {skill_match}
-            Score: {technical_score}
-            Job: {job_posting}
-            """)
-            chain = prompt | self.llm
-            result = chain.invoke({
+            result = self._invoke("reject_with_feedback", {
                 "candidate_name": state['candidate_name'],
                 "experience_level": state['experience_level'],
                 "skill_match": state['skill_match'],
                 "technical_score": state['technical_score'],
-                "job_posting": state['job_posting'][:1000]
-            })
+                "job_posting": state['job_posting']
+            }, stream=True)
             
             return {
                 "response": f"Thank you for your interest, {state['candidate_name']}. While you weren't selected for this position, we believe in your potential.",
-                "learning_recommendations": result.content
+                "learning_recommendations": result
             }
         except Exception:
+            record_fallback()
             return {
                 "response": f"Thank you for your interest, {state['candidate_name']}. Please continue developing your skills.",
                 "learning_recommendations": "Focus on building relevant experience and skills for this role."
@@ -132,13 +351,4 @@ class RecruitmentNodes:
     
     def route_application(self, state: ApplicationState) -> str:
         """Route application based on evaluation results."""
-        try:
-            score = float(state['technical_score'])
-            if score >= 7:
-                return 'schedule_interview'
-            elif state['experience_level'] == 'Senior-Level' and score >= 6:
-                return 'escalate_to_recruiter'
-            else:
-                return 'reject_with_feedback'
-        except Exception:
-            return 'reject_with_feedback'
+        return route_application(state)
@@ -0,0 +1,58 @@
+"""
+Routing decisions for evaluated applications.
+
+Kept free of LangChain/LangGraph imports so routing can be used and tested
+without loading the LLM stack.
+"""
+
+from typing import Mapping, Any
+
+# Technical scores needed for an interview, and for escalation of senior candidates
+INTERVIEW_SCORE = 7
+ESCALATION_SCORE = 6
+
+
+def route_application(state: Mapping[str, Any]) -> str:
+    """Route application based on evaluation results."""
+    try:
+        score = float(state['technical_score'])
+        if score >= INTERVIEW_SCORE:
+            return 'schedule_interview'
+        elif state['experience_level'] == 'Senior-Level' and score >= ESCALATION_SCORE:
+            return 'escalate_to_recruiter'
+        else:
+            return 'reject_with_feedback'
+    except Exception:
+        return 'reject_with_feedback'
+
+
+def route_prescreen(state: Mapping[str, Any]) -> str:
+    """Send pre-screen rejections straight to feedback, everything else to evaluation."""
+    if state.get('prescreen_decision') == 'reject':
+        return 'reject_with_feedback'
+    return 'evaluate'
+
+
+def needs_review(state: Mapping[str, Any], margin: float) -> bool:
+    """
+    Decide whether a first-pass evaluation should be repeated by a stronger model.
+    
+    Args:
+        state: Workflow state after the first-pass evaluation
+        margin: Scores in [threshold - margin, threshold + margin) of a
+            routing threshold that applies to the candidate are borderline
+            
+    Returns:
+        True if the score is borderline or unusable, or a node fell back
+        to its default answer
+    """
+    if any(node.get('fallback') for node in (state.get('metrics') or {}).values()):
+        return True
+    try:
+        score = float(state['technical_score'])
+    except (KeyError, TypeError, ValueError):
+        return True
+    thresholds = [INTERVIEW_SCORE]
+    if state.get('experience_level') == 'Senior-Level':
+        thresholds.append(ESCALATION_SCORE)
+    return any(threshold - margin <= score < threshold + margin for threshold in thresholds)
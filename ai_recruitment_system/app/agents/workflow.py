@@ -2,67 +2,309 @@
 LangGraph workflow for the recruitment agent.
 """
 
+import functools
+import hashlib
+import json
+import time
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, START, END
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterator, Optional, Tuple, Union
 
 from ..models.application_state import ApplicationState
+from ..models.job_posting import JobPosting
+from ..models.progress_event import ProgressEvent
+from ..core.cache import CacheBackend
+from ..core.config import Config
+from ..core.exceptions import ConfigurationError
+from ..core.metrics import MetricsAggregator, NodeMetrics, get_metrics_aggregator, instrument_node
+from ..core.scheduler import Priority, priority_scope
+from ..core.tokens import truncate_to_tokens
+from ..services.result_store import make_result_key
+from .checkpoint import get_checkpointer
 from .nodes import RecruitmentNodes
+from .routing import needs_review, route_prescreen
 
 
 class RecruitmentWorkflow:
     """Main workflow orchestrator for the recruitment process."""
     
-    def __init__(self):
-        self.nodes = RecruitmentNodes()
+    # Independent nodes that run concurrently before technical evaluation
+    EVALUATION_NODES = ("extract_info", "categorize_experience", "assess_skills")
+    # Nodes whose answers a cascade review replaces
+    FIRST_PASS_NODES = (*EVALUATION_NODES, "technical_evaluation", "evaluate_candidate")
+    
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        evaluation_mode: Optional[str] = None,
+        cache: Optional[CacheBackend] = None,
+        metrics: Optional[MetricsAggregator] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        cascade_llm: Optional[BaseChatModel] = None
+    ):
+        self.evaluation_mode = evaluation_mode or Config.EVALUATION_MODE
+        if self.evaluation_mode not in Config.EVALUATION_MODES:
+            raise ConfigurationError(
+                f"Unknown evaluation mode '{self.evaluation_mode}', "
+                f"expected one of {', '.join(Config.EVALUATION_MODES)}"
+            )
+        self.prescreen_mode = Config.PRESCREEN_MODE
+        if self.prescreen_mode not in Config.PRESCREEN_MODES:
+            raise ConfigurationError(
+                f"Unknown pre-screen mode '{self.prescreen_mode}', "
+                f"expected one of {', '.join(Config.PRESCREEN_MODES)}"
+            )
+        self.metrics = metrics or get_metrics_aggregator()
+        # Pre-screen settings are read once, so the graph, its decisions and
+        # the prompt version below all come from the same values
+        self.nodes = RecruitmentNodes(
+            llm,
+            cache,
+            prescreen_mode=self.prescreen_mode,
+            prescreen_reject_below=Config.PRESCREEN_REJECT_BELOW,
+            prescreen_low_priority_below=Config.PRESCREEN_LOW_PRIORITY_BELOW
+        )
+        # Cascade: borderline first passes are re-evaluated by a stronger model
+        self.review_nodes = None
+        if cascade_llm is not None or Config.CASCADE_MODEL:
+            self.review_nodes = RecruitmentNodes(cascade_llm, cache, model=Config.CASCADE_MODEL or None)
+        cascade = None
+        if self.review_nodes is not None:
+            review_model = self.review_nodes.model_id if cascade_llm is not None else Config.CASCADE_MODEL
+            cascade = [review_model, Config.CASCADE_SCORE_MARGIN]
+        # Identifies everything besides the inputs and the model that shapes a result
+        self.prompt_version = hashlib.sha256(json.dumps([
+            self.nodes.prompt_version, self.evaluation_mode, self.prescreen_mode,
+            self.nodes.prescreen_reject_below, self.nodes.prescreen_low_priority_below,
+            Config.JOB_PROMPT_MAX_TOKENS, Config.CV_CONTEXT_MAX_TOKENS, cascade
+        ]).encode("utf-8")).hexdigest()[:12]
         self.workflow = StateGraph(ApplicationState)
         self._setup_workflow()
-        self.app = self.workflow.compile()
+        # With a checkpointer every completed step is persisted per application,
+        # so an interrupted run resumes after its last completed node
+        self.checkpointer = checkpointer if checkpointer is not None else get_checkpointer()
+        self.app = self.workflow.compile(checkpointer=self.checkpointer)
     
     def _setup_workflow(self):
         """Setup the workflow graph with nodes and edges."""
-        # Add nodes
-        self.workflow.add_node("extract_info", self.nodes.extract_candidate_info)
-        self.workflow.add_node("categorize_experience", self.nodes.categorize_experience)
-        self.workflow.add_node("assess_skills", self.nodes.assess_skills)
-        self.workflow.add_node("technical_evaluation", self.nodes.technical_evaluation)
-        self.workflow.add_node("schedule_interview", self.nodes.schedule_interview)
-        self.workflow.add_node("escalate_to_recruiter", self.nodes.escalate_to_recruiter)
-        self.workflow.add_node("reject_with_feedback", self.nodes.reject_with_feedback)
+        # Add evaluation nodes
+        if self.evaluation_mode == "fused":
+            scoring_node = self._setup_fused_evaluation()
+        else:
+            scoring_node = self._setup_parallel_evaluation()
         
-        # Add edges
-        self.workflow.add_edge(START, "extract_info")
-        self.workflow.add_edge("extract_info", "categorize_experience")
-        self.workflow.add_edge("categorize_experience", "assess_skills")
-        self.workflow.add_edge("assess_skills", "technical_evaluation")
+        # Add decision nodes
+        self._add_node("schedule_interview", self.nodes.schedule_interview)
+        self._add_node("escalate_to_recruiter", self.nodes.escalate_to_recruiter)
+        self._add_node("reject_with_feedback", self.nodes.reject_with_feedback)
         
         # Add conditional edges
-        self.workflow.add_conditional_edges(
-            "technical_evaluation",
-            self.nodes.route_application,
-            {
-                "schedule_interview": "schedule_interview",
-                "escalate_to_recruiter": "escalate_to_recruiter",
-                "reject_with_feedback": "reject_with_feedback"
-            }
-        )
+        destinations = {
+            "schedule_interview": "schedule_interview",
+            "escalate_to_recruiter": "escalate_to_recruiter",
+            "reject_with_feedback": "reject_with_feedback"
+        }
+        if self.review_nodes is not None:
+            scoring_node = self._add_review(scoring_node, destinations)
+        self.workflow.add_conditional_edges(scoring_node, self.nodes.route_application, destinations)
         
         # Add final edges
         self.workflow.add_edge("schedule_interview", END)
         self.workflow.add_edge("escalate_to_recruiter", END)
         self.workflow.add_edge("reject_with_feedback", END)
     
-    def process_application(self, cv_text: str, job_posting: str) -> Dict[str, Any]:
+    def _add_review(self, scoring_node: str, destinations: Dict[str, str]) -> str:
+        """Route borderline first passes through the stronger model and return the new scoring node."""
+        self._add_node("review_evaluation", self.review_nodes.review_evaluation)
+        
+        def after_scoring(state: ApplicationState) -> str:
+            if needs_review(state, Config.CASCADE_SCORE_MARGIN):
+                return "review_evaluation"
+            return self.nodes.route_application(state)
+        
+        self.workflow.add_conditional_edges(scoring_node, after_scoring, [*destinations, "review_evaluation"])
+        return "review_evaluation"
+    
+    def _add_node(self, name: str, node: Callable[[ApplicationState], Dict[str, Any]]):
+        """Add a node wrapped with latency, token and fallback instrumentation."""
+        self.workflow.add_node(name, instrument_node(name, self._with_priority(node), self.metrics))
+    
+    @staticmethod
+    def _with_priority(node: Callable[[ApplicationState], Dict[str, Any]]) -> Callable[[ApplicationState], Dict[str, Any]]:
+        """Run the node's LLM calls at batch priority for weak pre-screen matches."""
+        @functools.wraps(node)
+        def wrapper(state):
+            if state.get("prescreen_decision") == "low_priority":
+                with priority_scope(Priority.BATCH):
+                    return node(state)
+            return node(state)
+        
+        return wrapper
+    
+    def _add_entry(self, nodes: Tuple[str, ...]):
+        """Segment the CV, then start the evaluation at the given nodes, behind the pre-screen when enabled."""
+        # Sections are cut and budgeted once, so the evaluation nodes only read their share
+        self._add_node("segment_cv", self.nodes.segment_cv)
+        self.workflow.add_edge(START, "segment_cv")
+        if self.prescreen_mode == "off":
+            for node in nodes:
+                self.workflow.add_edge("segment_cv", node)
+            return
+        
+        self._add_node("prescreen", self.nodes.prescreen_candidate)
+        self.workflow.add_edge("segment_cv", "prescreen")
+        
+        def after_prescreen(state: ApplicationState):
+            if route_prescreen(state) == "reject_with_feedback":
+                return "reject_with_feedback"
+            return list(nodes)
+        
+        self.workflow.add_conditional_edges("prescreen", after_prescreen, [*nodes, "reject_with_feedback"])
+    
+    def _setup_parallel_evaluation(self) -> str:
+        """Add one node per evaluation field and return the scoring node."""
+        self._add_node("extract_info", self.nodes.extract_candidate_info)
+        self._add_node("categorize_experience", self.nodes.categorize_experience)
+        self._add_node("assess_skills", self.nodes.assess_skills)
+        self._add_node("technical_evaluation", self.nodes.technical_evaluation)
+        
+        # Fan out: the three evaluation nodes only read the CV and job posting,
+        # so they run as one parallel superstep
+        self._add_entry(self.EVALUATION_NODES)
+        
+        # Fan in: technical evaluation waits for all parallel branches
+        self.workflow.add_edge(list(self.EVALUATION_NODES), "technical_evaluation")
+        return "technical_evaluation"
+    
+    def _setup_fused_evaluation(self) -> str:
+        """Add the single structured evaluation node and return it."""
+        self._add_node("evaluate_candidate", self.nodes.evaluate_candidate)
+        self._add_entry(("evaluate_candidate",))
+        return "evaluate_candidate"
+    
+    def process_application(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Dict[str, Any]:
         """
         Process a job application through the complete workflow.
         
         Args:
             cv_text: Extracted text from candidate's CV
-            job_posting: Job posting text
+            job_posting: Job posting or its text
+            
+        Returns:
+            Dictionary containing evaluation results
+        """
+        started = time.perf_counter()
+        state = self._initial_state(cv_text, job_posting)
+        if self.checkpointer is None:
+            return self._record_application(self.app.invoke(state), started)
+        config = self._thread_config(cv_text, job_posting)
+        resume = bool(self.app.get_state(config).next)
+        result = self.app.invoke(None if resume else state, config, durability="sync")
+        self.checkpointer.delete_thread(config["configurable"]["thread_id"])
+        return self._record_application(result, started)
+    
+    async def aprocess_application(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Dict[str, Any]:
+        """
+        Asynchronously process a job application through the complete workflow.
+        
+        Args:
+            cv_text: Extracted text from candidate's CV
+            job_posting: Job posting or its text
             
         Returns:
             Dictionary containing evaluation results
         """
-        initial_state = {
+        started = time.perf_counter()
+        state = self._initial_state(cv_text, job_posting)
+        if self.checkpointer is None:
+            return self._record_application(await self.app.ainvoke(state), started)
+        config = self._thread_config(cv_text, job_posting)
+        resume = bool((await self.app.aget_state(config)).next)
+        result = await self.app.ainvoke(None if resume else state, config, durability="sync")
+        await self.checkpointer.adelete_thread(config["configurable"]["thread_id"])
+        return self._record_application(result, started)
+    
+    def stream_application(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Iterator[ProgressEvent]:
+        """
+        Process a job application, reporting progress while the workflow runs.
+        
+        Args:
+            cv_text: Extracted text from candidate's CV
+            job_posting: Job posting or its text
+            
+        Yields:
+            A ``node`` event as each node finishes, ``token`` events while
+            streaming nodes generate text, and a final ``result`` event with
+            the dictionary ``process_application`` would return
+        """
+        started = time.perf_counter()
+        state = self._initial_state(cv_text, job_posting)
+        config, options = None, {}
+        if self.checkpointer is not None:
+            config = self._thread_config(cv_text, job_posting)
+            if self.app.get_state(config).next:
+                state = None
+            options = {"durability": "sync"}
+        result: Dict[str, Any] = {}
+        for mode, chunk in self.app.stream(state, config, stream_mode=["updates", "custom", "values"], **options):
+            if mode == "values":
+                result = chunk
+            elif mode == "custom":
+                yield ProgressEvent("token", node=chunk["node"], text=chunk["text"])
+            else:
+                for node, update in chunk.items():
+                    yield ProgressEvent("node", node=node, update=update or {})
+        if self.checkpointer is not None:
+            self.checkpointer.delete_thread(config["configurable"]["thread_id"])
+        yield ProgressEvent("result", update=self._record_application(result, started))
+    
+    def thread_id(self, cv_text: str, job_posting: Union[str, JobPosting]) -> str:
+        """Checkpoint thread of an application; the same inputs always map to the same thread."""
+        key = make_result_key(cv_text, job_posting, self.nodes.model_id, self.prompt_version)
+        return hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()[:32]
+    
+    def _thread_config(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Dict[str, Any]:
+        return {"configurable": {"thread_id": self.thread_id(cv_text, job_posting)}}
+    
+    def _record_application(self, result: Dict[str, Any], started: float) -> Dict[str, Any]:
+        """Add whole-application totals to the result metrics and the aggregator."""
+        metrics = result.get("metrics", {})
+        nodes = list(metrics.values())
+        # A successful review supersedes the first pass, default answers included
+        superseded = ()
+        if metrics.get("review_evaluation", {}).get("fallback") is False:
+            superseded = self.FIRST_PASS_NODES
+        total = NodeMetrics(
+            node="application",
+            wall_ms=(time.perf_counter() - started) * 1000,
+            llm_calls=sum(n["llm_calls"] for n in nodes),
+            cache_hits=sum(n["cache_hits"] for n in nodes),
+            prompt_tokens=sum(n["prompt_tokens"] for n in nodes),
+            completion_tokens=sum(n["completion_tokens"] for n in nodes),
+            cost_usd=sum(n["cost_usd"] for n in nodes),
+            retries=sum(n["retries"] for n in nodes),
+            fallback=any(n["fallback"] for name, n in metrics.items() if name not in superseded)
+        )
+        self.metrics.record(total)
+        self.metrics.increment("applications")
+        if self.review_nodes is not None and any(name in metrics for name in self.FIRST_PASS_NODES):
+            self.metrics.increment("cascade_evaluations")
+            self.metrics.increment("cascade_escalations", int("review_evaluation" in metrics))
+        result["metrics"] = {**metrics, "application": total.to_dict()}
+        return result
+    
+    @staticmethod
+    def _initial_state(cv_text: str, job_posting: Union[str, JobPosting]) -> ApplicationState:
+        """Build the empty workflow state for one application."""
+        required_skills = []
+        if isinstance(job_posting, JobPosting):
+            required_skills = sorted(job_posting.skill_set)
+            job_posting = job_posting.prompt_text()
+        else:
+            job_posting = truncate_to_tokens(job_posting, Config.JOB_PROMPT_MAX_TOKENS)
+        return {
             "cv_text": cv_text,
             "job_posting": job_posting,
             "candidate_name": "",
@@ -70,6 +312,12 @@ class RecruitmentWorkflow:
             "skill_match": "",
             "technical_score": "",
             "response": "",
-            "learning_recommendations": ""
+            "learning_recommendations": "",
+            "required_skills": required_skills,
+            "matched_skills": [],
+            "prescreen_score": 1.0,
+            "years_experience": None,
+            "prescreen_decision": "",
+            "cv_context": {},
+            "metrics": {}
         }
-        return self.app.invoke(initial_state)
@@ -0,0 +1,214 @@
+"""
+Headless command-line entry point for batch CV screening.
+
+Parses a directory or glob of CVs, evaluates them against one job posting and
+writes one JSON line per CV. This module must not import Streamlit.
+
+Usage:
+    python cli.py cvs/ --job "Python Developer" -o results.jsonl
+    python cli.py "cvs/**/*.pdf" --job-file job.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .core.config import Config
+from .core.exceptions import RecruitmentSystemError
+from .models.job_posting import JobPosting
+from .services.cv_parser import CVParser
+from .services.job_service import JobService
+from .services.recruitment_agent import RecruitmentAgent
+
+# State fields echoed back as inputs, not results
+_INPUT_FIELDS = ("cv_text", "job_posting")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="ai-recruitment",
+        description="Screen a batch of CVs against a job posting and write JSONL results."
+    )
+    parser.add_argument("inputs", nargs="*", help="CV files, directories or glob patterns")
+    job = parser.add_mutually_exclusive_group()
+    job.add_argument("--job", help="Key of a sample job (see --list-jobs)")
+    job.add_argument("--job-file", help="JSON file with JobPosting fields")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    parser.add_argument(
+        "--concurrency", type=int, default=Config.BATCH_CONCURRENCY,
+        help="Applications evaluated at once"
+    )
+    parser.add_argument(
+        "--parse-workers", type=int, default=os.cpu_count() or 1,
+        help="Processes used to extract CV text"
+    )
+    parser.add_argument(
+        "--shortlist", type=int, default=0, metavar="K",
+        help="Print the K best-ranked candidates to stderr when done"
+    )
+    parser.add_argument(
+        "--batch-id", metavar="NAME",
+        help="Record progress under NAME in the batch manifest (requires CHECKPOINT_PATH)"
+    )
+    parser.add_argument("--list-jobs", action="store_true", help="List sample job keys and exit")
+    return parser
+
+
+def resolve_inputs(inputs: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into supported CV paths."""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = [os.path.join(root, name) for root, _, names in os.walk(item) for name in names]
+        elif os.path.isfile(item):
+            candidates = [item]
+        else:
+            candidates = glob.glob(item, recursive=True)
+        paths.extend(path for path in candidates if CVParser.guess_file_type(path))
+    return sorted(set(paths))
+
+
+def load_job(args: argparse.Namespace) -> JobPosting:
+    """Load the job posting selected on the command line."""
+    if args.job_file:
+        with open(args.job_file, encoding="utf-8") as f:
+            return JobPosting(**json.load(f))
+    return JobService.get_job_by_key(JobService.get_sample_jobs(), args.job)
+
+
+def _parse_cv(path: str) -> Tuple[str, Optional[str], Optional[str], float]:
+    """Extract CV text in a worker process, returning (path, text, error, parse_ms)."""
+    started = time.perf_counter()
+    try:
+        text = "".join(CVParser.iter_text_chunks(path, max_chars=Config.CV_MAX_CHARS)).strip()
+        error = None if text else "No text could be extracted"
+    except RecruitmentSystemError as e:
+        text, error = None, str(e)
+    return path, text, error, (time.perf_counter() - started) * 1000
+
+
+def parse_files(paths: List[str], workers: int) -> Iterator[Tuple[str, Optional[str], Optional[str], float]]:
+    """Parse CV files in a process pool, yielding results in input order."""
+    if workers <= 1 or len(paths) <= 1:
+        yield from map(_parse_cv, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_parse_cv, paths, chunksize=max(1, len(paths) // (workers * 4)))
+
+
+def _record(
+    path: str,
+    job: JobPosting,
+    timings: Dict[str, float],
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build one JSONL output record."""
+    record: Dict[str, Any] = {"file": path, "job": str(job), "status": "error" if error else "ok"}
+    if error:
+        record["error"] = error
+    if result:
+        record.update({k: v for k, v in result.items() if k not in _INPUT_FIELDS})
+    record["timings"] = {name: round(ms, 1) for name, ms in timings.items()}
+    return record
+
+
+def run(args: argparse.Namespace, out: TextIO, agent: Optional[RecruitmentAgent] = None) -> Tuple[int, int]:
+    """
+    Screen the CVs selected by ``args`` and write JSONL records to ``out``.
+    
+    Returns:
+        Tuple of (succeeded, failed) counts
+    """
+    job = load_job(args)
+    paths = resolve_inputs(args.inputs)
+    
+    # Stage 1: extract text in parallel; parse failures are reported immediately
+    parsed: List[Tuple[str, str, float]] = []
+    failed = 0
+    for path, text, error, parse_ms in parse_files(paths, args.parse_workers):
+        if error:
+            out.write(json.dumps(_record(path, job, {"parse_ms": parse_ms}, error=error)) + "\n")
+            failed += 1
+        else:
+            parsed.append((path, text, parse_ms))
+    
+    # Stage 2: evaluate in parallel, writing records as they complete
+    agent = agent or RecruitmentAgent()
+    succeeded = 0
+    evaluated: List[Tuple[str, Dict[str, Any]]] = []
+    applications = ((text, job) for _, text, _ in parsed)
+    for item in agent.process_batch(applications, max_concurrency=args.concurrency, batch_id=args.batch_id):
+        path, _, parse_ms = parsed[item.index]
+        timings = {"parse_ms": parse_ms, "evaluate_ms": item.elapsed_ms}
+        error = str(item.error) if item.error else None
+        out.write(json.dumps(_record(path, job, timings, item.result, error)) + "\n")
+        out.flush()
+        if item.ok:
+            succeeded += 1
+            evaluated.append((path, item.result))
+        else:
+            failed += 1
+    if args.shortlist and evaluated:
+        print_shortlist(evaluated, job, args.shortlist)
+    return succeeded, failed
+
+
+def print_shortlist(evaluated: List[Tuple[str, Dict[str, Any]]], job: JobPosting, top_k: int) -> None:
+    """Rank the evaluated CVs and print the best ``top_k`` to stderr."""
+    # Imported here so plain screening runs do not load pandas
+    from .services.ranking import build_feature_frame, rank_candidates
+    
+    frame = build_feature_frame((result for _, result in evaluated), ids=(path for path, _ in evaluated))
+    shortlist = rank_candidates(frame, top_k=top_k, job_level=job.experience_level)
+    print(f"Top {len(shortlist)} candidates for {job}:", file=sys.stderr)
+    for path, row in shortlist.iterrows():
+        print(f"{row['rank']:>3}. {row['score']:.3f}  {row['candidate_name']}  ({path})", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None, agent: Optional[RecruitmentAgent] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    if args.list_jobs:
+        for key, job in JobService.get_sample_jobs().items():
+            print(f"{key}\t{job}")
+        return 0
+    if not (args.job or args.job_file):
+        parser.error("one of --job or --job-file is required")
+    if not args.inputs:
+        parser.error("no CV inputs given")
+    if agent is None:
+        error_message = Config.get_error_message()
+        if error_message:
+            print(error_message, file=sys.stderr)
+            return 2
+    
+    started = time.perf_counter()
+    try:
+        if args.output == "-":
+            succeeded, failed = run(args, sys.stdout, agent)
+        else:
+            with open(args.output, "w", encoding="utf-8") as out:
+                succeeded, failed = run(args, out, agent)
+    except (ValueError, OSError, TypeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    
+    print(
+        f"Screened {succeeded + failed} CVs: {succeeded} ok, {failed} failed "
+        f"in {time.perf_counter() - started:.1f}s",
+        file=sys.stderr
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Content-addressed cache backends for LLM responses and other derived text.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .config import Config
+from .exceptions import ConfigurationError
+
+
+def make_cache_key(model: str, template: str, inputs: Dict[str, Any]) -> str:
+    """Build a stable cache key from a model name, prompt template and inputs."""
+    payload = json.dumps(
+        {"model": model, "template": template, "inputs": inputs},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters for a cache backend."""
+    
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(ABC):
+    """Base class for string caches with TTL and max-size eviction."""
+    
+    def __init__(self, max_size: int = 10000, ttl: float = 0):
+        """
+        Args:
+            max_size: Maximum number of entries before the least recently
+                used ones are evicted
+            ttl: Seconds an entry stays valid, 0 for no expiry
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            value = self._get(key, time.time())
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return value
+    
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, evicting old entries if needed."""
+        with self._lock:
+            expires_at = time.time() + self.ttl if self.ttl else 0
+            self.stats.evictions += self._set(key, value, expires_at)
+    
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._clear()
+            self.stats = CacheStats()
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet purged."""
+    
+    @abstractmethod
+    def _get(self, key: str, now: float) -> Optional[str]:
+        """Look up a live entry and mark it as recently used."""
+    
+    @abstractmethod
+    def _set(self, key: str, value: str, expires_at: float) -> int:
+        """Store an entry and return the number of entries evicted."""
+    
+    @abstractmethod
+    def _clear(self) -> None:
+        """Remove every entry."""
+
+
+class InMemoryCache(CacheBackend):
+    """Process-local LRU cache."""
+    
+    def __init__(self, max_size: int = 10000, ttl: float = 0):
+        super().__init__(max_size, ttl)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _get(self, key: str, now: float) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at and expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def _set(self, key: str, value: str, expires_at: float) -> int:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+    
+    def _clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCache(CacheBackend):
+    """On-disk LRU cache shared by every process using the same file.
+    
+    The size is counted on open and when eviction is due, and estimated in
+    between, so inserts do not scan the table; entries added by other
+    processes are picked up at the next count. Once full, the least recently
+    used tenth of the entries is evicted at once.
+    """
+    
+    def __init__(self, path: str, max_size: int = 10000, ttl: float = 0):
+        super().__init__(max_size, ttl)
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+        self._estimated_size = self._count()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+    
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+    
+    def _get(self, key: str, now: float) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at and expires_at <= now:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return None
+        self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return value
+    
+    def _set(self, key: str, value: str, expires_at: float) -> int:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, value, expires_at, time.time())
+        )
+        # Replacing a key also counts, so the estimate never falls behind this process's inserts
+        self._estimated_size += 1
+        if self._estimated_size <= self.max_size:
+            return 0
+        count = self._count()
+        if count <= self.max_size:
+            self._estimated_size = count
+            return 0
+        target = self.max_size - self.max_size // 10
+        self._conn.execute(
+            "DELETE FROM cache WHERE key IN "
+            "(SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+            (count - target,)
+        )
+        self._estimated_size = target
+        return count - target
+    
+    def _clear(self) -> None:
+        self._conn.execute("DELETE FROM cache")
+        self._estimated_size = 0
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+_default_cache: Optional[CacheBackend] = None
+_default_cache_lock = threading.Lock()
+
+
+def create_cache(backend: str, path: str = "", max_size: int = 10000, ttl: float = 0) -> Optional[CacheBackend]:
+    """
+    Create a cache backend by name.
+    
+    Args:
+        backend: 'none', 'memory' or 'sqlite'
+        path: Database file for the sqlite backend
+        max_size: Maximum number of entries
+        ttl: Entry lifetime in seconds, 0 for no expiry
+        
+    Returns:
+        The cache backend, or None when caching is disabled
+        
+    Raises:
+        ConfigurationError: If the backend name is unknown
+    """
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryCache(max_size=max_size, ttl=ttl)
+    if backend == "sqlite":
+        return SQLiteCache(path, max_size=max_size, ttl=ttl)
+    raise ConfigurationError(f"Unknown cache backend '{backend}', expected none, memory or sqlite")
+
+
+def get_llm_cache() -> Optional[CacheBackend]:
+    """Return the process-wide LLM response cache configured in Config."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None and Config.LLM_CACHE_BACKEND != "none":
+            _default_cache = create_cache(
+                Config.LLM_CACHE_BACKEND,
+                path=Config.LLM_CACHE_PATH,
+                max_size=Config.LLM_CACHE_MAX_SIZE,
+                ttl=Config.LLM_CACHE_TTL
+            )
+        return _default_cache
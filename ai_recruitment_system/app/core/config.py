@@ -13,10 +13,70 @@ load_dotenv()
 class Config:
     """Application configuration class."""
     
+    # LLM Provider Configuration
+    # 'openai' or 'fake' (deterministic offline model for development and benchmarks)
+    LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai")
+    LLM_PROVIDERS: tuple = ("openai", "fake")
+    FAKE_LLM_LATENCY: float = float(os.getenv("FAKE_LLM_LATENCY", "0.0"))  # seconds per call
+    FAKE_LLM_JITTER: float = float(os.getenv("FAKE_LLM_JITTER", "0.0"))  # +/- seconds
+    FAKE_LLM_SEED: int = int(os.getenv("FAKE_LLM_SEED", "0"))
+    
     # OpenAI Configuration
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
+    # USD per 1M (input, output) tokens, used for cost metrics
+    MODEL_PRICING: dict = {
+        "gpt-4o-mini": (0.15, 0.60),
+        "gpt-4o": (2.50, 10.00),
+        "gpt-4.1-mini": (0.40, 1.60),
+        "gpt-4.1": (2.00, 8.00)
+    }
+    
+    # Workflow Configuration
+    # 'parallel': one LLM call per evaluation node, run concurrently
+    # 'fused': a single structured-output call covers all evaluation fields
+    EVALUATION_MODE: str = os.getenv("EVALUATION_MODE", "parallel")
+    EVALUATION_MODES: tuple = ("parallel", "fused")
+    # Token budget of the job posting summary included in node prompts
+    JOB_PROMPT_MAX_TOKENS: int = int(os.getenv("JOB_PROMPT_MAX_TOKENS", "250"))
+    # Token budget of the CV sections sent to each evaluation node
+    CV_CONTEXT_MAX_TOKENS: int = int(os.getenv("CV_CONTEXT_MAX_TOKENS", "350"))
+    
+    # Model Cascade Configuration
+    # Stronger model re-evaluating borderline first passes of OPENAI_MODEL, '' = disabled
+    CASCADE_MODEL: str = os.getenv("CASCADE_MODEL", "")
+    # Distance from a routing threshold (7 interview, 6 senior escalation) that counts as borderline
+    CASCADE_SCORE_MARGIN: float = float(os.getenv("CASCADE_SCORE_MARGIN", "1.0"))
+    
+    # Pre-screen Configuration
+    # 'off', 'flag' (low-priority marking only) or 'reject' (also short-circuit non-matches)
+    PRESCREEN_MODE: str = os.getenv("PRESCREEN_MODE", "flag")
+    PRESCREEN_MODES: tuple = ("off", "flag", "reject")
+    # Share of required skills found in the CV below which it is rejected / deprioritized
+    PRESCREEN_REJECT_BELOW: float = float(os.getenv("PRESCREEN_REJECT_BELOW", "0.15"))
+    PRESCREEN_LOW_PRIORITY_BELOW: float = float(os.getenv("PRESCREEN_LOW_PRIORITY_BELOW", "0.5"))
+    
+    # Batch Processing Configuration
+    BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "8"))
+    
+    # LLM Response Cache Configuration
+    # 'none', 'memory' (per-process LRU) or 'sqlite' (shared on-disk file)
+    LLM_CACHE_BACKEND: str = os.getenv("LLM_CACHE_BACKEND", "none")
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+    LLM_CACHE_MAX_SIZE: int = int(os.getenv("LLM_CACHE_MAX_SIZE", "10000"))
+    LLM_CACHE_TTL: float = float(os.getenv("LLM_CACHE_TTL", "0"))  # seconds, 0 = never expire
+    
+    # LLM Rate Limit Configuration
+    # Budgets shared by every LLM call in the process, 0 = unlimited
+    LLM_REQUESTS_PER_MINUTE: float = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "0"))
+    LLM_TOKENS_PER_MINUTE: float = float(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "4"))
+    LLM_BACKOFF_BASE: float = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))  # seconds
+    LLM_BACKOFF_MAX: float = float(os.getenv("LLM_BACKOFF_MAX", "30"))  # seconds
+    # Completion tokens reserved per call before actual usage is known
+    LLM_COMPLETION_TOKENS_ESTIMATE: int = int(os.getenv("LLM_COMPLETION_TOKENS_ESTIMATE", "256"))
+    
     # Application Configuration
     APP_TITLE: str = "AI Recruitment System"
     APP_ICON: str = "🤖"
@@ -26,9 +86,51 @@ class Config:
     ALLOWED_FILE_TYPES: list = ['pdf', 'docx', 'txt']
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     
+    # CV Extraction Configuration
+    # Extraction stops once either budget is met; prompts only use the start of the CV
+    CV_MAX_CHARS: int = int(os.getenv("CV_MAX_CHARS", "20000"))
+    PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", "20"))
+    # PDFs with at least this many pages to read are extracted in a process pool
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+    PDF_PAGES_PER_TASK: int = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+    PDF_WORKERS: int = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+    
+    # Parsed CV Store Configuration
+    DOCUMENT_STORE_MEMORY_SIZE: int = int(os.getenv("DOCUMENT_STORE_MEMORY_SIZE", "128"))
+    DOCUMENT_STORE_PATH: str = os.getenv("DOCUMENT_STORE_PATH", ".cache/parsed_cvs.sqlite3")  # '' = memory only
+    DOCUMENT_STORE_MAX_SIZE: int = int(os.getenv("DOCUMENT_STORE_MAX_SIZE", "5000"))
+    
+    # Result Store Configuration
+    # Evaluations are reused when CV, job, model and prompt version all match
+    RESULT_STORE_PATH: str = os.getenv("RESULT_STORE_PATH", ".cache/results.sqlite3")  # '' = disabled
+    
+    # Checkpoint Configuration
+    # SQLite file persisting every completed workflow step, so interrupted
+    # applications resume where they stopped; it also holds the batch manifest
+    CHECKPOINT_PATH: str = os.getenv("CHECKPOINT_PATH", "")  # '' = disabled
+    
+    # Semantic Matching Configuration
+    # 'hashed' (local hashed term frequencies, no network) or 'openai' (embeddings API)
+    EMBEDDING_ENCODER: str = os.getenv("EMBEDDING_ENCODER", "hashed")
+    EMBEDDING_ENCODERS: tuple = ("hashed", "openai")
+    EMBEDDING_DIM: int = int(os.getenv("EMBEDDING_DIM", "1024"))
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    VECTOR_INDEX_DIR: str = os.getenv("VECTOR_INDEX_DIR", ".cache/vectors")  # '' = memory only
+    
+    # Near-duplicate CV Detection Configuration
+    NEAR_DUPLICATE_INDEX_PATH: str = os.getenv("NEAR_DUPLICATE_INDEX_PATH", ".cache/near_duplicates.u32")  # '' = disabled
+    # Estimated Jaccard similarity of word shingles at which a CV is flagged as a near-duplicate
+    NEAR_DUPLICATE_THRESHOLD: float = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.8"))
+    # Similarity at which the near-duplicate's stored evaluation is reused instead of re-evaluating
+    NEAR_DUPLICATE_REUSE_THRESHOLD: float = float(os.getenv("NEAR_DUPLICATE_REUSE_THRESHOLD", "0.9"))
+    MINHASH_PERMUTATIONS: int = int(os.getenv("MINHASH_PERMUTATIONS", "128"))
+    LSH_BANDS: int = int(os.getenv("LSH_BANDS", "16"))
+    
     @classmethod
     def validate_config(cls) -> bool:
         """Validate that required configuration is present."""
+        if cls.LLM_PROVIDER == "fake":
+            return True
         if not cls.OPENAI_API_KEY or cls.OPENAI_API_KEY == "your_openai_api_key_here":
             return False
         return True
@@ -0,0 +1,207 @@
+"""
+Per-node latency, token and cost instrumentation for the recruitment workflow.
+"""
+
+import contextvars
+import functools
+import json
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .config import Config
+
+
+@dataclass
+class NodeMetrics:
+    """Measurements for a single execution of one workflow node."""
+    
+    node: str
+    wall_ms: float = 0.0
+    llm_calls: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    retries: int = 0
+    fallback: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for the workflow state."""
+        return asdict(self)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate the USD cost of a call from Config.MODEL_PRICING, 0 if unknown."""
+    pricing = Config.MODEL_PRICING.get(model)
+    if not pricing:
+        return 0.0
+    input_price, output_price = pricing
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+# Derived rates reported by the aggregator, as (numerator, denominator) counters
+COUNTER_RATES = {
+    "cascade_escalation_rate": ("cascade_escalations", "cascade_evaluations"),
+}
+
+_current_node: contextvars.ContextVar[Optional[NodeMetrics]] = contextvars.ContextVar(
+    "current_node_metrics", default=None
+)
+
+
+def record_llm_call(model: str, usage: Optional[Dict[str, Any]] = None, cache_hit: bool = False) -> None:
+    """Attribute one LLM call (or cache hit) to the node currently running."""
+    metrics = _current_node.get()
+    if metrics is None:
+        return
+    if cache_hit:
+        metrics.cache_hits += 1
+        return
+    usage = usage or {}
+    prompt_tokens = int(usage.get("input_tokens", 0))
+    completion_tokens = int(usage.get("output_tokens", 0))
+    metrics.llm_calls += 1
+    metrics.prompt_tokens += prompt_tokens
+    metrics.completion_tokens += completion_tokens
+    metrics.cost_usd += estimate_cost(model, prompt_tokens, completion_tokens)
+
+
+def record_retry() -> None:
+    """Count a retried LLM call against the node currently running."""
+    metrics = _current_node.get()
+    if metrics is not None:
+        metrics.retries += 1
+
+
+def record_fallback() -> None:
+    """Mark that the node currently running served its default answer."""
+    metrics = _current_node.get()
+    if metrics is not None:
+        metrics.fallback = True
+
+
+def instrument_node(
+    name: str,
+    func: Callable[[Any], Dict[str, Any]],
+    aggregator: Optional["MetricsAggregator"] = None
+) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Wrap a workflow node so its measurements are added to the state update.
+    
+    The wrapped node returns ``{"metrics": {name: NodeMetrics}}`` merged into
+    its usual update, and each execution is recorded in the aggregator.
+    """
+    aggregator = aggregator or get_metrics_aggregator()
+    
+    @functools.wraps(func)
+    def wrapper(state):
+        metrics = NodeMetrics(node=name)
+        token = _current_node.set(metrics)
+        started = time.perf_counter()
+        try:
+            update = func(state)
+        finally:
+            metrics.wall_ms = (time.perf_counter() - started) * 1000
+            _current_node.reset(token)
+        aggregator.record(metrics)
+        return {**update, "metrics": {name: metrics.to_dict()}}
+    
+    return wrapper
+
+
+def merge_metrics(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """State reducer combining metrics written by parallel nodes."""
+    return {**(left or {}), **(right or {})}
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class MetricsAggregator:
+    """Thread-safe in-process aggregate of node metrics and counters."""
+    
+    def __init__(self, window: int = 10000):
+        """
+        Args:
+            window: Latency samples kept per node for percentile estimates
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Discard all samples and counters."""
+        with self._lock:
+            self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+            self._totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+            self.counters: Dict[str, float] = defaultdict(float)
+    
+    def record(self, metrics: NodeMetrics) -> None:
+        """Add one node execution."""
+        with self._lock:
+            self._latencies[metrics.node].append(metrics.wall_ms)
+            totals = self._totals[metrics.node]
+            totals["count"] += 1
+            for field in ("llm_calls", "cache_hits", "prompt_tokens", "completion_tokens", "cost_usd", "retries"):
+                totals[field] += getattr(metrics, field)
+            totals["fallbacks"] += int(metrics.fallback)
+    
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increase a named counter."""
+        with self._lock:
+            self.counters[name] += value
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize everything recorded so far.
+        
+        Returns:
+            JSON-serializable dict with per-node p50/p95/mean latency, token,
+            cost, retry and fallback totals, plus the named counters and the
+            rates derived from them
+        """
+        with self._lock:
+            nodes = {}
+            for node, samples in self._latencies.items():
+                totals = dict(self._totals[node])
+                count = totals["count"]
+                nodes[node] = {
+                    "count": int(count),
+                    "p50_ms": round(percentile(list(samples), 50), 2),
+                    "p95_ms": round(percentile(list(samples), 95), 2),
+                    "mean_ms": round(sum(samples) / len(samples), 2),
+                    "llm_calls": int(totals["llm_calls"]),
+                    "cache_hits": int(totals["cache_hits"]),
+                    "prompt_tokens": int(totals["prompt_tokens"]),
+                    "completion_tokens": int(totals["completion_tokens"]),
+                    "cost_usd": round(totals["cost_usd"], 6),
+                    "retries": int(totals["retries"]),
+                    "fallbacks": int(totals["fallbacks"]),
+                    "fallback_rate": round(totals["fallbacks"] / count, 4),
+                }
+            rates = {
+                name: round(self.counters.get(numerator, 0) / self.counters[denominator], 4)
+                for name, (numerator, denominator) in COUNTER_RATES.items()
+                if self.counters.get(denominator)
+            }
+            return {"nodes": nodes, "counters": dict(self.counters), "rates": rates}
+    
+    def to_json(self) -> str:
+        """Export the snapshot as JSON."""
+        return json.dumps(self.snapshot(), indent=2)
+
+
+_default_aggregator = MetricsAggregator()
+
+
+def get_metrics_aggregator() -> MetricsAggregator:
+    """Return the process-wide metrics aggregator."""
+    return _default_aggregator
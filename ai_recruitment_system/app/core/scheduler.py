@@ -0,0 +1,297 @@
+"""
+Rate-limit-aware scheduler shared by every LLM call.
+
+Calls wait for capacity in request-per-minute and token-per-minute token
+buckets, are served in priority order (interactive before batch), and are
+retried with jittered exponential backoff when the provider rate-limits or
+fails transiently.
+"""
+
+import contextlib
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from .config import Config
+from .metrics import percentile, record_retry
+
+T = TypeVar("T")
+
+# HTTP statuses and client exception names worth retrying
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = {
+    "RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError", "Timeout"
+}
+
+
+class Priority(IntEnum):
+    """Scheduling priority; lower values are served first."""
+    
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "llm_priority", default=Priority.INTERACTIVE
+)
+
+
+def get_priority() -> Priority:
+    """Priority of LLM calls made from the current context."""
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def priority_scope(priority: Priority) -> Iterator[None]:
+    """Run the enclosed LLM calls at the given priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+    
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (after a refill)."""
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate) if missing > 0 else 0.0
+    
+    def consume(self, amount: float) -> None:
+        """Take tokens; the balance may go negative when usage is corrected upward."""
+        self.tokens -= min(amount, self.capacity)
+    
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the provider reports a rate limit."""
+        self.tokens = min(self.tokens, 0.0)
+
+
+@dataclass
+class SchedulerStats:
+    """Counters describing scheduler load."""
+    
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    max_queue_depth: int = 0
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an LLM call failure is transient and worth retrying."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status in RETRYABLE_STATUS_CODES or type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the provider asked us to wait, if it sent a Retry-After header."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMScheduler:
+    """Thread-safe admission control, prioritization and retries for LLM calls."""
+    
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        burst_seconds: float = 60.0
+    ):
+        """
+        Args:
+            requests_per_minute: Request budget, 0 for unlimited
+            tokens_per_minute: Prompt plus completion token budget, 0 for unlimited
+            max_retries: Retries for transient failures before giving up
+            backoff_base: First backoff ceiling in seconds, doubled per attempt
+            backoff_max: Upper bound for a single backoff
+            burst_seconds: Seconds of budget that may be spent in one burst
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._buckets: Dict[str, TokenBucket] = {}
+        if requests_per_minute:
+            self._buckets["requests"] = TokenBucket(
+                max(1.0, requests_per_minute * burst_seconds / 60), requests_per_minute / 60
+            )
+        if tokens_per_minute:
+            self._buckets["tokens"] = TokenBucket(
+                max(1.0, tokens_per_minute * burst_seconds / 60), tokens_per_minute / 60
+            )
+        self.stats = SchedulerStats()
+        self._waits: List[float] = []
+        self._queue: List[tuple] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+    
+    @property
+    def queue_depth(self) -> int:
+        """Calls currently waiting for capacity."""
+        with self._condition:
+            return len(self._queue)
+    
+    def call(
+        self,
+        func: Callable[[], T],
+        estimated_tokens: int = 0,
+        priority: Optional[Priority] = None
+    ) -> T:
+        """
+        Run an LLM call once capacity is available, retrying transient failures.
+        
+        Args:
+            func: Zero-argument callable performing the request
+            estimated_tokens: Expected prompt plus completion tokens
+            priority: Scheduling priority (defaults to the context priority)
+            
+        Returns:
+            The callable's result
+            
+        Raises:
+            Exception: The last error once retries are exhausted, or any
+                non-retryable error immediately
+        """
+        priority = get_priority() if priority is None else priority
+        with self._condition:
+            self.stats.submitted += 1
+        for attempt in range(self.max_retries + 1):
+            self._acquire(estimated_tokens, priority)
+            try:
+                result = func()
+            except Exception as e:
+                if not is_retryable(e) or attempt == self.max_retries:
+                    with self._condition:
+                        self.stats.failed += 1
+                    raise
+                self._backoff(e, attempt)
+                continue
+            self._settle(result, estimated_tokens)
+            return result
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth, wait-time percentiles and counters."""
+        with self._condition:
+            waits = list(self._waits)
+            return {
+                "queue_depth": len(self._queue),
+                "submitted": self.stats.submitted,
+                "completed": self.stats.completed,
+                "failed": self.stats.failed,
+                "retries": self.stats.retries,
+                "rate_limited": self.stats.rate_limited,
+                "max_queue_depth": self.stats.max_queue_depth,
+                "wait_p50_ms": round(percentile(waits, 50) * 1000, 2) if waits else 0.0,
+                "wait_p95_ms": round(percentile(waits, 95) * 1000, 2) if waits else 0.0,
+            }
+    
+    def _acquire(self, estimated_tokens: int, priority: Priority) -> None:
+        """Block until this call is first in line and the buckets have capacity."""
+        started = time.monotonic()
+        with self._condition:
+            ticket = (int(priority), next(self._sequence))
+            heapq.heappush(self._queue, ticket)
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, len(self._queue))
+            try:
+                while True:
+                    timeout = None
+                    if self._queue[0] == ticket:
+                        timeout = self._wait_time(estimated_tokens)
+                        if timeout == 0:
+                            self._consume(estimated_tokens)
+                            heapq.heappop(self._queue)
+                            break
+                    self._condition.wait(timeout)
+            except BaseException:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                raise
+            finally:
+                self._condition.notify_all()
+            self._waits.append(time.monotonic() - started)
+            if len(self._waits) > 10000:
+                del self._waits[:5000]
+    
+    def _wait_time(self, estimated_tokens: int) -> float:
+        """Seconds until every bucket can admit the call."""
+        now = time.monotonic()
+        wait = 0.0
+        for name, bucket in self._buckets.items():
+            bucket.refill(now)
+            wait = max(wait, bucket.wait_time(1 if name == "requests" else estimated_tokens))
+        return wait
+    
+    def _consume(self, estimated_tokens: int) -> None:
+        for name, bucket in self._buckets.items():
+            bucket.consume(1 if name == "requests" else estimated_tokens)
+    
+    def _settle(self, result: Any, estimated_tokens: int) -> None:
+        """Correct the token bucket with actual usage and count the completion."""
+        usage = getattr(result, "usage_metadata", None) or {}
+        with self._condition:
+            self.stats.completed += 1
+            bucket = self._buckets.get("tokens")
+            actual = usage.get("total_tokens")
+            if bucket is not None and actual is not None:
+                bucket.tokens -= actual - min(estimated_tokens, bucket.capacity)
+            self._condition.notify_all()
+    
+    def _backoff(self, error: Exception, attempt: int) -> None:
+        """Sleep before a retry; rate limits also pause every other caller."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        with self._condition:
+            self.stats.retries += 1
+            if getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError":
+                self.stats.rate_limited += 1
+                for bucket in self._buckets.values():
+                    bucket.drain()
+                delay = max(delay, _retry_after(error) or 0.0)
+        record_retry()
+        time.sleep(delay)
+
+
+_default_scheduler: Optional[LLMScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Return the process-wide LLM scheduler configured in Config."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = LLMScheduler(
+                requests_per_minute=Config.LLM_REQUESTS_PER_MINUTE,
+                tokens_per_minute=Config.LLM_TOKENS_PER_MINUTE,
+                max_retries=Config.LLM_MAX_RETRIES,
+                backoff_base=Config.LLM_BACKOFF_BASE,
+                backoff_max=Config.LLM_BACKOFF_MAX
+            )
+        return _default_scheduler
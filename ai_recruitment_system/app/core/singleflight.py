@@ -0,0 +1,143 @@
+"""
+Single-flight deduplication of identical concurrent calls.
+
+While a call for a key is running, later calls for the same key wait for
+it and share its outcome instead of starting their own. Sync and async
+callers share one registry, so a batch worker on an event loop and a UI
+session on a thread coalesce too.
+"""
+
+import asyncio
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Generator, Hashable, Optional, Tuple, TypeVar
+
+from .metrics import MetricsAggregator, get_metrics_aggregator
+
+T = TypeVar("T")
+Y = TypeVar("Y")
+
+
+class _Abandoned(Exception):
+    """The running call was cancelled or interrupted; waiting callers start over."""
+
+
+class SingleFlight:
+    """Registry of in-flight calls keyed by the identity of their inputs.
+    
+    The first caller of a key runs the work; callers arriving before it
+    finishes receive a deep copy of its result, or its exception. If the
+    running call is cancelled, one of the waiting callers takes over.
+    Nothing is cached: once the call completes the key is free again.
+    """
+    
+    def __init__(self, metrics: Optional[MetricsAggregator] = None):
+        """
+        Args:
+            metrics: Aggregator counting coalesced calls (defaults to the shared one)
+        """
+        self.metrics = metrics or get_metrics_aggregator()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls)
+    
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        """Return the call's future and whether the caller must run it."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.metrics.increment("coalesced_requests")
+                return future, False
+            future = self._calls[key] = Future()
+            # A running future cannot be cancelled, so a waiter giving up
+            # (asyncio.wrap_future cancels on its way out) leaves it intact
+            future.set_running_or_notify_cancel()
+            return future, True
+    
+    def _finish(self, key: Hashable, future: Future, result: Any = None, error: Optional[BaseException] = None):
+        """Publish the outcome to waiting callers and free the key."""
+        with self._lock:
+            del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` unless a call for ``key`` is in flight, and return its result or the running call's."""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return copy.deepcopy(future.result())
+            except _Abandoned:
+                continue
+        try:
+            result = func()
+        except Exception as e:
+            self._finish(key, future, error=e)
+            raise
+        except BaseException:
+            self._finish(key, future, error=_Abandoned())
+            raise
+        self._finish(key, future, result)
+        return result
+    
+    async def ado(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Async version of ``do``; ``func`` returns the awaitable doing the work."""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return copy.deepcopy(await asyncio.wrap_future(future))
+            except _Abandoned:
+                continue
+        try:
+            result = await func()
+        except Exception as e:
+            self._finish(key, future, error=e)
+            raise
+        except BaseException:
+            self._finish(key, future, error=_Abandoned())
+            raise
+        self._finish(key, future, result)
+        return result
+    
+    def stream(self, key: Hashable, func: Callable[[], Generator[Y, None, T]]) -> Generator[Y, None, T]:
+        """Generator version of ``do`` for work that reports progress.
+        
+        Only the caller running ``func`` yields its items; every caller returns
+        its value. Closing the running generator hands the call to a waiter.
+        """
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return copy.deepcopy(future.result())
+            except _Abandoned:
+                continue
+        try:
+            result = yield from func()
+        except Exception as e:
+            self._finish(key, future, error=e)
+            raise
+        except BaseException:
+            self._finish(key, future, error=_Abandoned())
+            raise
+        self._finish(key, future, result)
+        return result
+
+
+_default_flights = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide single-flight registry."""
+    return _default_flights
@@ -0,0 +1,61 @@
+"""
+Token counting helpers for prompt budgets.
+"""
+
+import functools
+from typing import Any, Optional
+
+from .config import Config
+
+# Average characters per token of English text for OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+# Encoding used when the configured model is unknown to tiktoken
+DEFAULT_ENCODING = "o200k_base"
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the number of tokens in text from its length."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(model: Optional[str] = None) -> Optional[Any]:
+    """
+    Return the tiktoken encoding of a model, or None if it cannot be loaded.
+    
+    tiktoken downloads encoding files on first use, so offline machines
+    without a cached copy fall back to length-based estimates.
+    
+    Args:
+        model: Model name (defaults to Config.OPENAI_MODEL)
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model or Config.OPENAI_MODEL)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the model's tokenizer, estimating when it is unavailable."""
+    encoding = get_encoding()
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Keep the longest prefix of text that fits in ``max_tokens``."""
+    encoding = get_encoding()
+    if encoding is None:
+        return text[:max(0, max_tokens) * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max(0, max_tokens)])
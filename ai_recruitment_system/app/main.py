@@ -3,15 +3,16 @@ Main Streamlit application for the AI Recruitment System.
 """
 
 import streamlit as st
-from typing import Dict, Any
+from typing import Iterator
 
 from .core.config import Config
 from .core.exceptions import ConfigurationError, AgentWorkflowError
-from .services.recruitment_agent import RecruitmentAgent
+from .models.progress_event import ProgressEvent
+from .services.recruitment_agent import RecruitmentAgent, get_recruitment_agent
 from .services.job_service import JobService
 from .ui.components.job_display import render_job_details, render_job_sidebar
 from .ui.components.file_upload import render_file_upload, render_submit_button
-from .ui.components.results_display import render_results, render_processing_spinner, render_error_message
+from .ui.components.results_display import render_results_stream, render_error_message
 
 
 def setup_page():
@@ -34,31 +35,33 @@ def render_header():
     """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_agent() -> RecruitmentAgent:
+    """Agent shared by all sessions, so its graph and LLM client are built once per process."""
+    return get_recruitment_agent()
+
+
 def initialize_session_state():
     """Initialize Streamlit session state variables."""
-    if 'agent' not in st.session_state:
-        st.session_state.agent = RecruitmentAgent()
     if 'jobs' not in st.session_state:
         st.session_state.jobs = JobService.get_sample_jobs()
     if 'selected_job' not in st.session_state:
         st.session_state.selected_job = list(st.session_state.jobs.keys())[0]
 
 
-def process_application(cv_text: str, selected_job: str) -> Dict[str, Any]:
+def stream_application(cv_text: str, selected_job: str) -> Iterator[ProgressEvent]:
     """
-    Process job application through the AI workflow.
+    Process job application through the AI workflow, streaming its progress.
     
     Args:
         cv_text: Extracted CV text
         selected_job: Selected job key
         
     Returns:
-        Evaluation results
+        Progress events ending with the evaluation results
     """
     job = st.session_state.jobs[selected_job]
-    job_text = job.to_text()
-    
-    return st.session_state.agent.process_application(cv_text, job_text)
+    return get_agent().stream_application(cv_text, job)
 
 
 def main():
@@ -101,14 +104,13 @@ def main():
         # Submit button
         if render_submit_button(cv_text, st.session_state.selected_job):
             if cv_text and st.session_state.selected_job:
-                with render_processing_spinner():
-                    try:
-                        result = process_application(cv_text, st.session_state.selected_job)
-                        render_results(result)
-                    except AgentWorkflowError as e:
-                        render_error_message(str(e))
-                    except Exception as e:
-                        render_error_message(f"Unexpected error: {str(e)}")
+                # Results fill in node by node instead of after the whole run
+                try:
+                    render_results_stream(stream_application(cv_text, st.session_state.selected_job))
+                except AgentWorkflowError as e:
+                    render_error_message(str(e))
+                except Exception as e:
+                    render_error_message(f"Unexpected error: {str(e)}")
 
 
 if __name__ == "__main__":
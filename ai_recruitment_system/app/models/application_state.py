@@ -2,7 +2,9 @@
 Application state model for the recruitment workflow.
 """
 
-from typing import TypedDict
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
+
+from ..core.metrics import merge_metrics
 
 
 class ApplicationState(TypedDict):
@@ -16,3 +18,13 @@ class ApplicationState(TypedDict):
     technical_score: str
     response: str
     learning_recommendations: str
+    # Local pre-screen against the posting's normalized required skills
+    required_skills: List[str]
+    matched_skills: List[str]
+    prescreen_score: float
+    years_experience: Optional[int]
+    prescreen_decision: str
+    # Token-budgeted CV sections per evaluation node
+    cv_context: Dict[str, str]
+    # Per-node measurements, merged across parallel branches
+    metrics: Annotated[Dict[str, Dict[str, Any]], merge_metrics]
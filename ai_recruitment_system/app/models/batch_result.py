@@ -0,0 +1,23 @@
+"""
+Batch processing result model.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from ..core.exceptions import AgentWorkflowError
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one application in a batch run."""
+    
+    index: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[AgentWorkflowError] = None
+    elapsed_ms: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the application was evaluated successfully."""
+        return self.error is None
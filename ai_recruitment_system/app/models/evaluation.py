@@ -0,0 +1,20 @@
+"""
+Structured evaluation schema for the fused evaluation mode.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class CandidateEvaluation(BaseModel):
+    """All evaluation fields produced by a single LLM call."""
+    
+    candidate_name: str = Field(description="The candidate's full name as written in the CV")
+    experience_level: Literal["Entry-Level", "Mid-Level", "Senior-Level"] = Field(
+        description="Experience level relative to the job posting"
+    )
+    skill_match: Literal["Strong Match", "Partial Match", "No Match"] = Field(
+        description="How well the CV skills match the job requirements"
+    )
+    technical_score: int = Field(ge=1, le=10, description="Technical competency score from 1 to 10")
@@ -2,13 +2,24 @@
 Job posting data model.
 """
 
-from dataclasses import dataclass
-from typing import List
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from ..core.config import Config
+from ..core.tokens import count_tokens, truncate_to_tokens
+from .skills import normalize_skills
 
 
 @dataclass
 class JobPosting:
-    """Represents a job posting with all relevant details."""
+    """Represents a job posting with all relevant details.
+    
+    Derived values (prompt text, summary, skill set, content hash) are computed
+    once and cached. The cache is keyed on a fingerprint of the fields, so it
+    is invalidated whenever a field is reassigned or a list is changed in place.
+    """
     
     title: str
     company: str
@@ -19,13 +30,81 @@ class JobPosting:
     location: str
     salary_range: str
     job_type: str
+    _derived: Dict[Any, Tuple[int, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def _fingerprint(self) -> int:
+        """Cheap hash of every field, used to detect changes."""
+        return hash((
+            self.title, self.company, self.description, tuple(self.requirements),
+            self.experience_level, tuple(self.skills_required),
+            self.location, self.salary_range, self.job_type
+        ))
+    
+    def _cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return a derived value, recomputing it if any field has changed."""
+        fingerprint = self._fingerprint()
+        entry = self._derived.get(key)
+        if entry is None or entry[0] != fingerprint:
+            entry = (fingerprint, compute())
+            self._derived[key] = entry
+        return entry[1]
     
     def to_text(self) -> str:
         """Convert job posting to text format for AI processing."""
-        return f"""Title: {self.title}
+        return self._cached("text", lambda: f"""Title: {self.title}
 Company: {self.company}
 Description: {self.description}
-Requirements: {' '.join(self.requirements)}"""
+Requirements: {' '.join(self.requirements)}""")
+
+    def prompt_text(self, max_tokens: Optional[int] = None) -> str:
+        """
+        Summary of the posting for LLM prompts, kept within a token budget.
+        
+        Requirements are listed one per line and dropped whole from the end
+        when the summary would exceed the budget, so none is cut mid-item;
+        an over-long description is cut at the budget.
+        
+        Args:
+            max_tokens: Token budget (defaults to Config.JOB_PROMPT_MAX_TOKENS)
+            
+        Returns:
+            Canonical prompt text for this posting
+        """
+        budget = max_tokens or Config.JOB_PROMPT_MAX_TOKENS
+        return self._cached(("prompt", budget), lambda: self._build_prompt_text(budget))
+    
+    def _build_prompt_text(self, budget: int) -> str:
+        header = (
+            f"Title: {self.title}\n"
+            f"Company: {self.company}\n"
+            f"Level: {self.experience_level}\n"
+            f"Description: {self.description}"
+        )
+        if self.skills_required:
+            header += f"\nSkills: {', '.join(self.skills_required)}"
+        lines = [f"- {requirement}" for requirement in self.requirements]
+        while lines:
+            text = header + "\nRequirements:\n" + "\n".join(lines)
+            if count_tokens(text) <= budget:
+                return text
+            lines.pop()
+        return truncate_to_tokens(header, budget)
+    
+    @property
+    def skill_set(self) -> FrozenSet[str]:
+        """Required skills, lowercased and folded onto canonical names."""
+        return self._cached("skills", lambda: normalize_skills(self.skills_required))
+    
+    @property
+    def content_hash(self) -> str:
+        """Stable SHA-256 of the posting's fields, identifying it across processes."""
+        return self._cached("hash", lambda: hashlib.sha256(json.dumps([
+            self.title, self.company, self.description, self.requirements,
+            self.experience_level, self.skills_required,
+            self.location, self.salary_range, self.job_type
+        ]).encode("utf-8")).hexdigest())
     
     def __str__(self) -> str:
         return f"{self.title} at {self.company}"
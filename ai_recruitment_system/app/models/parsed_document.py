@@ -0,0 +1,26 @@
+"""
+Parsed CV document model.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class ParsedDocument:
+    """Text extracted from an uploaded CV file, keyed by its content hash."""
+    
+    content_hash: str
+    file_type: str
+    text: str
+    char_count: int
+    page_count: int
+    
+    def to_json(self) -> str:
+        """Serialize the document for storage."""
+        return json.dumps(asdict(self))
+    
+    @classmethod
+    def from_json(cls, payload: str) -> "ParsedDocument":
+        """Deserialize a document produced by ``to_json``."""
+        return cls(**json.loads(payload))
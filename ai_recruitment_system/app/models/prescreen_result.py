@@ -0,0 +1,19 @@
+"""
+Pre-screen result model.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class PrescreenResult:
+    """Outcome of local skill matching of a CV against a job posting."""
+    
+    # Share of required skills found in the CV, 1.0 when none are required
+    score: float
+    matched_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+    years_experience: Optional[int] = None
+    # 'pass', 'low_priority' or 'reject'
+    decision: str = "pass"
@@ -0,0 +1,21 @@
+"""
+Progress event model for streamed application processing.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+
+@dataclass
+class ProgressEvent:
+    """One step of a streamed evaluation.
+    
+    ``node`` events carry the state update of a finished workflow node,
+    ``token`` events a chunk of text generated by a streaming node, and the
+    final ``result`` event the complete evaluation result.
+    """
+    
+    kind: str
+    node: str = ""
+    update: Dict[str, Any] = field(default_factory=dict)
+    text: str = ""
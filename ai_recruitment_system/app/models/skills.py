@@ -0,0 +1,58 @@
+"""
+Skill name normalization shared by job postings and CV matching.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable
+
+# Alternative spellings folded onto one canonical (lowercase) skill name
+SKILL_ALIASES: Dict[str, str] = {
+    "py": "python",
+    "python3": "python",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "react.js": "react",
+    "reactjs": "react",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "tf": "tensorflow",
+    "torch": "pytorch",
+    "sklearn": "scikit-learn",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "rest": "rest api",
+    "rest apis": "rest api",
+    "restful api": "rest api",
+    "restful apis": "rest api",
+    "amazon web services": "aws",
+    "google cloud": "gcp",
+    "google cloud platform": "gcp",
+    "microsoft azure": "azure",
+    "drf": "django rest framework",
+    "cicd": "ci/cd",
+}
+
+# Skill names and aliases that are also ordinary words ("let's go", "CV",
+# "the rest"); they only count when listed in a CV's skills section
+AMBIGUOUS_SKILL_TERMS: FrozenSet[str] = frozenset({"go", "rest", "cv", "node", "torch"})
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_skill(name: str) -> str:
+    """Lowercase a skill name, collapse whitespace and fold known aliases."""
+    key = _WHITESPACE.sub(" ", name.strip().lower())
+    return SKILL_ALIASES.get(key, key)
+
+
+def normalize_skills(names: Iterable[str]) -> FrozenSet[str]:
+    """Normalized set of non-empty skill names."""
+    return frozenset(skill for skill in map(normalize_skill, names) if skill)
@@ -0,0 +1,34 @@
+"""
+Persisted evaluation result model.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, NamedTuple
+
+
+class ResultKey(NamedTuple):
+    """Identity of an evaluation: same key, same inputs and evaluation logic."""
+    
+    cv_hash: str
+    job_hash: str
+    model: str
+    prompt_version: str
+
+
+@dataclass
+class StoredResult:
+    """An evaluation result as kept in the result store."""
+    
+    key: ResultKey
+    result: Dict[str, Any]
+    elapsed_ms: float
+    created_at: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flatten to a JSON-serializable record."""
+        return {
+            **self.key._asdict(),
+            "elapsed_ms": self.elapsed_ms,
+            "created_at": self.created_at,
+            "result": self.result,
+        }
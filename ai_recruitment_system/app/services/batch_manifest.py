@@ -0,0 +1,115 @@
+"""
+Manifest of batch runs recording which applications are done.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from ..core.config import Config
+
+STATUSES = ("running", "done", "failed")
+
+
+class BatchManifest:
+    """SQLite record of the applications of named batch runs.
+    
+    Items are identified by their workflow thread id, so a re-run of the same
+    batch finds the same entries even if the inputs are listed in another
+    order. Items left ``running`` were interrupted and resume from their last
+    checkpoint when the batch is run again.
+    """
+    
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: Database file, ':memory:' for a process-local manifest
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS batch_manifest ("
+            "batch_id TEXT NOT NULL, item_key TEXT NOT NULL, item_index INTEGER NOT NULL, "
+            "status TEXT NOT NULL, error TEXT, elapsed_ms REAL, updated_at REAL NOT NULL, "
+            "PRIMARY KEY (batch_id, item_key))"
+        )
+    
+    def mark(
+        self,
+        batch_id: str,
+        item_key: str,
+        index: int,
+        status: str,
+        error: Optional[str] = None,
+        elapsed_ms: Optional[float] = None
+    ) -> None:
+        """
+        Record the status of one item.
+        
+        Args:
+            batch_id: Name of the batch run
+            item_key: Workflow thread id of the application
+            index: Position of the application in the batch input
+            status: 'running', 'done' or 'failed'
+            error: Failure message for failed items
+            elapsed_ms: Evaluation time of finished items
+            
+        Raises:
+            ValueError: If the status is unknown
+        """
+        if status not in STATUSES:
+            raise ValueError(f"Unknown batch item status '{status}', expected one of {', '.join(STATUSES)}")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO batch_manifest VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (batch_id, item_key, index, status, error, elapsed_ms, time.time())
+            )
+    
+    def status(self, batch_id: str) -> Dict[str, str]:
+        """Status of every recorded item of a batch, by item key."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item_key, status FROM batch_manifest WHERE batch_id = ?", (batch_id,)
+            ).fetchall()
+        return dict(rows)
+    
+    def summary(self, batch_id: str) -> Dict[str, int]:
+        """Number of items of a batch in each status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM batch_manifest WHERE batch_id = ? GROUP BY status", (batch_id,)
+            ).fetchall()
+        return {**{status: 0 for status in STATUSES}, **dict(rows)}
+    
+    def unfinished(self, batch_id: str) -> List[int]:
+        """Input positions of items that were interrupted or failed."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item_index FROM batch_manifest WHERE batch_id = ? AND status != 'done' "
+                "ORDER BY item_index", (batch_id,)
+            ).fetchall()
+        return [index for (index,) in rows]
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+_default_manifest: Optional[BatchManifest] = None
+_default_manifest_lock = threading.Lock()
+
+
+def get_batch_manifest() -> Optional[BatchManifest]:
+    """Return the process-wide manifest, kept in the checkpoint database; None if disabled."""
+    global _default_manifest
+    with _default_manifest_lock:
+        if _default_manifest is None and Config.CHECKPOINT_PATH:
+            _default_manifest = BatchManifest(Config.CHECKPOINT_PATH)
+        return _default_manifest
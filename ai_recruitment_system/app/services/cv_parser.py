@@ -2,13 +2,55 @@
 CV parsing service for extracting text from various file formats.
 """
 
-import streamlit as st
 import PyPDF2
 import docx
-from io import BytesIO
-from typing import Union
+import multiprocessing
+import os
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, TextIOWrapper
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 
+from ..core.config import Config
 from ..core.exceptions import CVParseError
+from ..models.parsed_document import ParsedDocument
+
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TEXT_TYPE = "text/plain"
+
+# File extensions mapped to the MIME types the parser understands
+EXTENSION_TYPES = {
+    ".pdf": PDF_TYPE,
+    ".docx": DOCX_TYPE,
+    ".txt": TEXT_TYPE
+}
+
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool used for large PDFs."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # Spawned workers, as forking the multithreaded app process can
+            # copy locks held by other threads and deadlock the child
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=Config.PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pdf_pool
+
+
+def _extract_pdf_pages(file_content: bytes, start: int, stop: int) -> List[str]:
+    """Extract the text of pages ``start`` to ``stop`` (runs in a worker process)."""
+    pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
+    return [pdf_reader.pages[i].extract_text() or "" for i in range(start, stop)]
 
 
 class CVParser:
@@ -30,11 +72,11 @@ class CVParser:
             CVParseError: If file parsing fails
         """
         try:
-            if file_type == "application/pdf":
+            if file_type == PDF_TYPE:
                 return CVParser._extract_from_pdf(file_content)
-            elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+            elif file_type == DOCX_TYPE:
                 return CVParser._extract_from_docx(file_content)
-            elif file_type == "text/plain":
+            elif file_type == TEXT_TYPE:
                 return file_content.decode('utf-8')
             else:
                 raise CVParseError(f"Unsupported file type: {file_type}")
@@ -42,29 +84,194 @@ class CVParser:
             raise CVParseError(f"Error parsing CV: {str(e)}")
     
     @staticmethod
-    def _extract_from_pdf(file_content: bytes) -> str:
-        """Extract text from PDF file."""
+    def parse_document(file_content: bytes, file_type: str, content_hash: str = "") -> ParsedDocument:
+        """
+        Extract text from file content together with document statistics.
+        
+        Args:
+            file_content: Raw file content as bytes
+            file_type: MIME type of the file
+            content_hash: Optional content hash to record on the document
+            
+        Returns:
+            ParsedDocument with the text, its length and the page count
+            (PDF pages, or 1 for DOCX and TXT files which have no fixed pages)
+            
+        Raises:
+            CVParseError: If file parsing fails
+        """
+        try:
+            if file_type == PDF_TYPE:
+                text, page_count = CVParser._read_pdf(file_content)
+            else:
+                text, page_count = CVParser.extract_text_from_file(file_content, file_type), 1
+        except CVParseError:
+            raise
+        except Exception as e:
+            raise CVParseError(f"Error parsing CV: {str(e)}")
+        return ParsedDocument(
+            content_hash=content_hash,
+            file_type=file_type,
+            text=text,
+            char_count=len(text),
+            page_count=page_count
+        )
+    
+    @staticmethod
+    def iter_text_chunks(
+        source: Union[str, os.PathLike, BinaryIO],
+        file_type: Optional[str] = None,
+        max_chars: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Lazily extract text from a CV file, one page or paragraph at a time.
+        
+        Each chunk ends with a newline, so ``"".join(chunks)`` rebuilds the
+        document text. Iteration stops once ``max_chars`` characters have been
+        produced, truncating the last chunk.
+        
+        Args:
+            source: Path to the file or a binary file-like object
+            file_type: MIME type; guessed from the file name when omitted
+            max_chars: Optional limit on the total characters yielded
+            
+        Yields:
+            Text chunks in document order
+            
+        Raises:
+            CVParseError: If the type is unsupported or parsing fails
+        """
+        if file_type is None:
+            file_type = CVParser.guess_file_type(
+                os.fspath(source) if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+            )
+        if not CVParser.validate_file_type(file_type):
+            raise CVParseError(f"Unsupported file type: {file_type}")
+        
+        remaining = max_chars if max_chars is not None else float("inf")
+        if remaining <= 0:
+            return
+        try:
+            with CVParser._open_source(source) as stream:
+                for chunk in CVParser._iter_raw_chunks(stream, file_type):
+                    if len(chunk) >= remaining:
+                        yield chunk[:int(remaining)]
+                        return
+                    remaining -= len(chunk)
+                    yield chunk
+        except CVParseError:
+            raise
+        except Exception as e:
+            raise CVParseError(f"Error parsing CV: {str(e)}")
+    
+    @staticmethod
+    def guess_file_type(file_name: str) -> str:
+        """Guess the MIME type of a CV from its file name, or return '' if unknown."""
+        return EXTENSION_TYPES.get(os.path.splitext(file_name)[1].lower(), "")
+    
+    @staticmethod
+    def _open_source(source: Union[str, os.PathLike, BinaryIO]):
+        """Open a path for binary reading, or wrap a stream so it is left open."""
+        if isinstance(source, (str, os.PathLike)):
+            return open(source, "rb")
+        return nullcontext(source)
+    
+    @staticmethod
+    def _iter_raw_chunks(stream: BinaryIO, file_type: str) -> Iterator[str]:
+        """Yield newline-terminated chunks from an open binary stream."""
+        if file_type == PDF_TYPE:
+            pdf_reader = PyPDF2.PdfReader(stream)
+            for page in pdf_reader.pages[:Config.PDF_MAX_PAGES]:
+                yield (page.extract_text() or "") + "\n"
+        elif file_type == DOCX_TYPE:
+            for paragraph in docx.Document(stream).paragraphs:
+                yield paragraph.text + "\n"
+        else:
+            text_stream = TextIOWrapper(stream, encoding="utf-8")
+            try:
+                paragraph = []
+                for line in text_stream:
+                    paragraph.append(line)
+                    if not line.strip():
+                        yield "".join(paragraph)
+                        paragraph = []
+                if paragraph:
+                    yield "".join(paragraph)
+            finally:
+                # Leave the underlying stream open for its owner
+                text_stream.detach()
+    
+    @staticmethod
+    def _extract_from_pdf(
+        file_content: bytes,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> str:
+        """
+        Extract text from PDF file within a page and character budget.
+        
+        Pages are read in order until ``max_pages`` pages or ``max_chars``
+        characters have been collected. Documents with many pages to read are
+        split into page ranges extracted in a process pool.
+        """
+        return CVParser._read_pdf(file_content, max_pages, max_chars)[0]
+    
+    @staticmethod
+    def _read_pdf(
+        file_content: bytes,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> Tuple[str, int]:
+        """Extract budgeted PDF text and return it with the document's page count."""
+        max_pages = max_pages or Config.PDF_MAX_PAGES
+        max_chars = max_chars or Config.CV_MAX_CHARS
         pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
+        total_pages = len(pdf_reader.pages)
+        page_count = min(total_pages, max_pages)
+        
+        if page_count >= Config.PDF_PARALLEL_MIN_PAGES:
+            pages = CVParser._extract_pdf_pages_parallel(file_content, page_count, max_chars)
+        else:
+            pages = []
+            collected = 0
+            for page in pdf_reader.pages[:page_count]:
+                pages.append(page.extract_text() or "")
+                collected += len(pages[-1]) + 1
+                if collected >= max_chars:
+                    break
+        return "\n".join(pages).strip()[:max_chars], total_pages
+    
+    @staticmethod
+    def _extract_pdf_pages_parallel(file_content: bytes, page_count: int, max_chars: int) -> List[str]:
+        """Extract page ranges in worker processes, stopping at the character budget."""
+        step = max(1, Config.PDF_PAGES_PER_TASK)
+        futures = [
+            _get_pdf_pool().submit(_extract_pdf_pages, file_content, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        pages: List[str] = []
+        collected = 0
+        try:
+            # Consume ranges in page order so the budget keeps the start of the document
+            for future in futures:
+                for text in future.result():
+                    pages.append(text)
+                    collected += len(text) + 1
+                if collected >= max_chars:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+        return pages
     
     @staticmethod
     def _extract_from_docx(file_content: bytes) -> str:
         """Extract text from DOCX file."""
         doc = docx.Document(BytesIO(file_content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text.strip()
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
     
     @staticmethod
     def validate_file_type(file_type: str) -> bool:
         """Validate if file type is supported."""
-        supported_types = [
-            "application/pdf",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "text/plain"
-        ]
-        return file_type in supported_types
+        return file_type in (PDF_TYPE, DOCX_TYPE, TEXT_TYPE)
+
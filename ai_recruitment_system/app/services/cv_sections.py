@@ -0,0 +1,147 @@
+"""
+Local CV segmentation into sections and token-budgeted per-node contexts.
+
+Instead of sending the first N characters of a CV to every node, the CV is
+split once into its sections and each node receives only the sections
+relevant to its question, fitted to a token budget.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import Config
+from ..core.tokens import count_tokens, truncate_to_tokens
+
+# Heading spellings of each section; anything before the first heading is the header
+SECTION_HEADINGS = {
+    "summary": ("summary", "professional summary", "profile", "about me", "objective", "career objective"),
+    "experience": (
+        "experience", "work experience", "professional experience", "employment",
+        "employment history", "work history", "career history"
+    ),
+    "skills": (
+        "skills", "technical skills", "key skills", "core competencies", "competencies",
+        "technologies", "tech stack", "tools"
+    ),
+    "education": ("education", "academic background", "qualifications", "certifications", "training"),
+    "projects": ("projects", "personal projects", "selected projects", "key projects", "portfolio"),
+}
+
+# Sections given to each node, most relevant first, and the token budget
+# (None = Config.CV_CONTEXT_MAX_TOKENS). The header carries name and contacts.
+NODE_CONTEXTS: Dict[str, Tuple[Tuple[str, ...], Optional[int]]] = {
+    "extract_info": (("header",), 64),
+    "categorize_experience": (("summary", "experience", "education"), None),
+    "assess_skills": (("skills", "projects", "experience"), None),
+    "technical_evaluation": (("skills", "projects", "experience"), None),
+    "evaluate_candidate": (("header", "summary", "skills", "experience", "projects", "education"), None),
+}
+
+_ALIASES = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+# A heading is a line holding only a known title, or a title followed by a colon
+# and inline content ("Skills: Python, SQL")
+_HEADING = re.compile(
+    r"^[ \t]*(?:#+[ \t]*)?(?P<title>"
+    + "|".join(sorted((re.escape(alias) for alias in _ALIASES), key=len, reverse=True))
+    + r")[ \t]*(?::[ \t]*(?P<rest>.*?))?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def segment_cv(cv_text: str) -> Dict[str, str]:
+    """
+    Split a CV into its sections.
+    
+    Args:
+        cv_text: Extracted CV text
+        
+    Returns:
+        Section name to text, in document order; repeated sections are
+        concatenated and text before the first heading is the ``header``
+    """
+    sections: Dict[str, List[str]] = {}
+    name, start = "header", 0
+    for match in _HEADING.finditer(cv_text):
+        sections.setdefault(name, []).append(cv_text[start:match.start()])
+        name = _ALIASES[match.group("title").lower()]
+        rest = match.group("rest")
+        sections.setdefault(name, []).append(rest + "\n" if rest else "")
+        start = match.end()
+    sections.setdefault(name, []).append(cv_text[start:])
+    segmented = {name: "\n".join(p.strip() for p in parts if p.strip()) for name, parts in sections.items()}
+    return {name: text for name, text in segmented.items() if text}
+
+
+def _allocate(sizes: Sequence[int], budget: int) -> List[int]:
+    """Split a budget so small parts are kept whole and large ones share the rest evenly."""
+    allocation = [0] * len(sizes)
+    remaining = budget
+    pending = sorted(range(len(sizes)), key=lambda i: sizes[i])
+    while pending:
+        share = remaining // len(pending)
+        if sizes[pending[0]] > share:
+            for i in pending:
+                allocation[i] = share
+            break
+        i = pending.pop(0)
+        allocation[i] = sizes[i]
+        remaining -= sizes[i]
+    return allocation
+
+
+def _fit_lines(text: str, budget: int) -> str:
+    """Keep whole leading lines of text within a token budget."""
+    if count_tokens(text) <= budget:
+        return text
+    kept, used = [], 0
+    for line in text.splitlines():
+        tokens = count_tokens(line) + 1
+        if used + tokens > budget:
+            if not kept:
+                kept.append(truncate_to_tokens(line, budget))
+            break
+        kept.append(line)
+        used += tokens
+    return "\n".join(kept)
+
+
+def build_context(sections: Dict[str, str], names: Sequence[str], budget: int, cv_text: str = "") -> str:
+    """
+    Compose a CV context from the named sections within a token budget.
+    
+    Args:
+        sections: Output of segment_cv
+        names: Sections to include, in order
+        budget: Maximum tokens of the context
+        cv_text: Full CV, used when none of the requested sections was found
+        
+    Returns:
+        Labelled sections trimmed to whole lines, or the start of the CV
+    """
+    present = [name for name in names if name in sections]
+    if not present or (len(names) > 1 and present == ["header"]):
+        return truncate_to_tokens(cv_text or "\n".join(sections.values()), budget)
+    blocks = [sections[name] if name == "header" else f"{name.upper()}:\n{sections[name]}" for name in present]
+    # Each block also pays for the blank line separating it from the next
+    sizes = [count_tokens(block) + 1 for block in blocks]
+    fitted = [_fit_lines(block, share) for block, share in zip(blocks, _allocate(sizes, budget))]
+    return "\n\n".join(block for block in fitted if block)
+
+
+def build_node_contexts(cv_text: str, max_tokens: Optional[int] = None) -> Dict[str, str]:
+    """
+    Segment a CV once and build the budgeted context of every node.
+    
+    Args:
+        cv_text: Extracted CV text
+        max_tokens: Budget of the evaluation nodes (defaults to Config.CV_CONTEXT_MAX_TOKENS)
+        
+    Returns:
+        Node name to CV context
+    """
+    sections = segment_cv(cv_text)
+    default_budget = max_tokens or Config.CV_CONTEXT_MAX_TOKENS
+    return {
+        node: build_context(sections, names, budget or default_budget, cv_text)
+        for node, (names, budget) in NODE_CONTEXTS.items()
+    }
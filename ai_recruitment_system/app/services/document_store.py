@@ -0,0 +1,108 @@
+"""
+Parsed CV store that avoids re-parsing identical uploads.
+"""
+
+import hashlib
+import threading
+from typing import Optional
+
+from ..core.cache import CacheBackend, InMemoryCache, SQLiteCache
+from ..core.config import Config
+from ..models.parsed_document import ParsedDocument
+from .cv_parser import CVParser
+
+
+class DocumentStore:
+    """Two-tier store of parsed CVs keyed by a hash of the file bytes and type.
+    
+    Lookups hit an in-process LRU first and an optional SQLite file second;
+    both tiers evict their least recently used entries once full. Entries
+    are also keyed by the extraction budget, so text truncated under an
+    earlier PDF_MAX_PAGES or CV_MAX_CHARS is not served after a change.
+    """
+    
+    def __init__(
+        self,
+        memory_size: int = 128,
+        disk_path: Optional[str] = None,
+        disk_max_size: int = 5000
+    ):
+        """
+        Args:
+            memory_size: Documents kept in process memory
+            disk_path: SQLite file for the persistent tier, None to disable it
+            disk_max_size: Documents kept on disk
+        """
+        self.memory: CacheBackend = InMemoryCache(max_size=memory_size)
+        self.disk: Optional[CacheBackend] = (
+            SQLiteCache(disk_path, max_size=disk_max_size) if disk_path else None
+        )
+    
+    @staticmethod
+    def content_hash(file_content: bytes, file_type: str) -> str:
+        """Hash file bytes together with their MIME type."""
+        digest = hashlib.sha256(file_type.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(file_content)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _key(content_hash: str) -> str:
+        """Storage key of a document parsed under the current extraction budget."""
+        return f"{content_hash}:{Config.PDF_MAX_PAGES}:{Config.CV_MAX_CHARS}"
+    
+    def get(self, content_hash: str) -> Optional[ParsedDocument]:
+        """Return a stored document, promoting disk hits into memory."""
+        key = self._key(content_hash)
+        payload = self.memory.get(key)
+        if payload is None and self.disk is not None:
+            payload = self.disk.get(key)
+            if payload is not None:
+                self.memory.set(key, payload)
+        return ParsedDocument.from_json(payload) if payload is not None else None
+    
+    def put(self, document: ParsedDocument) -> None:
+        """Store a parsed document in every tier."""
+        key = self._key(document.content_hash)
+        payload = document.to_json()
+        self.memory.set(key, payload)
+        if self.disk is not None:
+            self.disk.set(key, payload)
+    
+    def parse(self, file_content: bytes, file_type: str) -> ParsedDocument:
+        """
+        Return the parsed document for file content, parsing it only once.
+        
+        Args:
+            file_content: Raw file content as bytes
+            file_type: MIME type of the file
+            
+        Returns:
+            ParsedDocument for the file
+            
+        Raises:
+            CVParseError: If file parsing fails
+        """
+        content_hash = self.content_hash(file_content, file_type)
+        document = self.get(content_hash)
+        if document is None:
+            document = CVParser.parse_document(file_content, file_type, content_hash)
+            self.put(document)
+        return document
+
+
+_default_store: Optional[DocumentStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_document_store() -> DocumentStore:
+    """Return the process-wide document store configured in Config."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = DocumentStore(
+                memory_size=Config.DOCUMENT_STORE_MEMORY_SIZE,
+                disk_path=Config.DOCUMENT_STORE_PATH or None,
+                disk_max_size=Config.DOCUMENT_STORE_MAX_SIZE
+            )
+        return _default_store
@@ -0,0 +1,143 @@
+"""
+Text encoders producing L2-normalized embedding vectors.
+
+The default hashed term-frequency encoder runs locally with no model
+download or network access; a provider-backed encoder can be plugged in
+instead.
+"""
+
+import math
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from ..core.config import Config
+from ..core.exceptions import ConfigurationError
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+
+class Encoder(ABC):
+    """Maps texts to unit-length float32 vectors of a fixed dimension."""
+    
+    dim: int
+    
+    @property
+    def identity(self) -> str:
+        """Encoder name and settings; vectors of encoders with different identities are not comparable."""
+        return f"{type(self).__name__}:{self.dim}"
+    
+    @abstractmethod
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as an (n, dim) float32 array with unit-length rows."""
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+class HashedTfidfEncoder(Encoder):
+    """Sublinear TF-IDF over hashed unigrams and bigrams.
+    
+    Terms are hashed with CRC32 into ``dim`` buckets with a random sign, so
+    vectors are identical across processes and no vocabulary is stored.
+    IDF weights are optional: call ``fit`` on a representative corpus, or
+    leave them out for plain hashed TF.
+    """
+    
+    def __init__(self, dim: int = 1024, bigrams: bool = True, idf: Optional[np.ndarray] = None):
+        """
+        Args:
+            dim: Number of hash buckets (vector dimension)
+            bigrams: Whether to add adjacent word pairs as terms
+            idf: Per-bucket IDF weights from a previous ``fit``
+        """
+        self.dim = dim
+        self.bigrams = bigrams
+        self.idf = idf
+    
+    @property
+    def identity(self) -> str:
+        terms = "bigrams" if self.bigrams else "unigrams"
+        weights = "tf" if self.idf is None else f"idf-{zlib.crc32(self.idf.tobytes()):08x}"
+        return f"hashed:{self.dim}:{terms}:{weights}"
+    
+    def _terms(self, text: str) -> List[str]:
+        words = _TOKEN.findall(text.lower())
+        if self.bigrams:
+            return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        return words
+    
+    def _buckets(self, text: str):
+        """Bucket indices, signs and sublinear term frequencies of a text."""
+        counts = Counter(self._terms(text))
+        hashes = np.fromiter((zlib.crc32(term.encode("utf-8")) for term in counts), dtype=np.uint32, count=len(counts))
+        tf = np.fromiter((1.0 + math.log(c) for c in counts.values()), dtype=np.float32, count=len(counts))
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+        return (hashes % self.dim).astype(np.int64), signs, tf
+    
+    def fit(self, texts: Sequence[str]) -> "HashedTfidfEncoder":
+        """Learn smoothed IDF weights per bucket from a corpus."""
+        df = np.zeros(self.dim, dtype=np.float64)
+        for text in texts:
+            buckets, _, _ = self._buckets(text)
+            df[np.unique(buckets)] += 1
+        self.idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+        return self
+    
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            buckets, signs, tf = self._buckets(text)
+            np.add.at(vectors[row], buckets, signs * tf)
+        if self.idf is not None:
+            vectors *= self.idf
+        return _normalize(vectors)
+
+
+class LangChainEncoder(Encoder):
+    """Adapter for a LangChain ``Embeddings`` model such as OpenAIEmbeddings."""
+    
+    def __init__(self, embeddings: Any, dim: int):
+        self.embeddings = embeddings
+        self.dim = dim
+    
+    @property
+    def identity(self) -> str:
+        return f"{type(self.embeddings).__name__}:{getattr(self.embeddings, 'model', '')}:{self.dim}"
+    
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        vectors = np.asarray(self.embeddings.embed_documents(list(texts)), dtype=np.float32)
+        return _normalize(vectors)
+
+
+def create_encoder(name: Optional[str] = None) -> Encoder:
+    """
+    Create the text encoder.
+    
+    Args:
+        name: 'hashed' or 'openai' (defaults to Config.EMBEDDING_ENCODER)
+        
+    Returns:
+        Configured encoder
+        
+    Raises:
+        ConfigurationError: If the encoder is unknown
+    """
+    name = name or Config.EMBEDDING_ENCODER
+    if name == "hashed":
+        return HashedTfidfEncoder(dim=Config.EMBEDDING_DIM)
+    if name == "openai":
+        from langchain_openai import OpenAIEmbeddings
+        embeddings = OpenAIEmbeddings(
+            model=Config.EMBEDDING_MODEL, dimensions=Config.EMBEDDING_DIM, api_key=Config.OPENAI_API_KEY
+        )
+        return LangChainEncoder(embeddings, Config.EMBEDDING_DIM)
+    raise ConfigurationError(f"Unknown embedding encoder '{name}', expected one of {', '.join(Config.EMBEDDING_ENCODERS)}")
@@ -0,0 +1,211 @@
+"""
+Near-duplicate CV detection with MinHash signatures and LSH banding.
+
+Each CV is reduced to the set of its word shingles, summarized by a MinHash
+signature whose matching positions estimate the Jaccard similarity of two
+shingle sets. Signatures are split into bands; CVs sharing any identical
+band are candidates, and only those are compared, so a lookup touches a
+handful of rows regardless of how many CVs are indexed.
+"""
+
+import re
+import threading
+import zlib
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.config import Config
+from .vector_index import VectorIndex
+
+Match = Tuple[str, float]
+
+# Words per shingle; one edited word changes at most this many shingles
+SHINGLE_SIZE = 3
+# Prime just above 2**32 for the universal hash family of the permutations
+_PRIME = np.uint64(4294967311)
+_MASK32 = np.uint64(0xFFFFFFFF)
+# Rows appended since the last sort that are scanned directly instead of searched
+_MAX_UNSORTED = 4096
+_TOKEN = re.compile(r"\w+")
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    Hash the distinct word shingles of a text.
+    
+    Args:
+        text: Document text; case and punctuation are ignored
+        size: Words per shingle
+        
+    Returns:
+        Sorted unique 32-bit shingle hashes as uint64, empty for a text without words
+    """
+    tokens = np.fromiter(
+        (zlib.crc32(token.encode("utf-8")) for token in _TOKEN.findall(text.lower())), dtype=np.uint64
+    )
+    if len(tokens) == 0:
+        return tokens
+    size = min(size, len(tokens))
+    count = len(tokens) - size + 1
+    combined = np.zeros(count, dtype=np.uint64)
+    # Polynomial combination of consecutive word hashes, wrapping at 64 bits
+    for offset in range(size):
+        combined = combined * np.uint64(1000003) + tokens[offset:offset + count]
+    return np.unique((combined >> np.uint64(32)) ^ (combined & _MASK32))
+
+
+class DuplicateCheck(NamedTuple):
+    """Signature of a CV and the indexed CVs similar to it."""
+    
+    id: str
+    signature: np.ndarray
+    matches: List[Match]
+
+
+class NearDuplicateIndex:
+    """MinHash signatures of indexed CVs with an LSH band index over them.
+    
+    Signatures are kept in a ``VectorIndex`` of uint32 rows, memory-mapped
+    when a path is given. The band hashes are rebuilt from the signatures on
+    load and kept as one sorted array per band plus a short unsorted tail of
+    recent additions, so lookups are binary searches over compact arrays.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None,
+        seed: int = 1
+    ):
+        """
+        Args:
+            path: Signature matrix file, or None for an in-memory index
+            num_perm: Signature length (defaults to Config.MINHASH_PERMUTATIONS)
+            bands: LSH bands, must divide num_perm (defaults to Config.LSH_BANDS)
+            seed: Seed of the permutations; indexes are only comparable with equal seeds
+            
+        Raises:
+            ValueError: If bands does not divide num_perm
+        """
+        self.num_perm = num_perm or Config.MINHASH_PERMUTATIONS
+        self.bands = bands or Config.LSH_BANDS
+        if self.num_perm % self.bands:
+            raise ValueError(f"{self.bands} bands do not divide a signature of {self.num_perm} values")
+        self.rows = self.num_perm // self.bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 32, size=(self.num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 2 ** 32, size=(self.num_perm, 1), dtype=np.uint64)
+        self._band_weights = rng.integers(1, 2 ** 63, size=self.rows, dtype=np.uint64) | np.uint64(1)
+        self._lock = threading.Lock()
+        self.signatures = VectorIndex(self.num_perm, path, dtype=np.uint32, encoder=f"minhash:{seed}")
+        self._band_keys = self._hash_bands(self.signatures.vectors)
+        self._sort()
+    
+    def __len__(self) -> int:
+        return len(self.signatures)
+    
+    def __contains__(self, id_: str) -> bool:
+        return id_ in self.signatures
+    
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of a text, None if it has no words."""
+        shingles = shingle_hashes(text)
+        if len(shingles) == 0:
+            return None
+        hashed = (self._a * shingles + self._b) % _PRIME
+        return (hashed.min(axis=1) & _MASK32).astype(np.uint32)
+    
+    def _hash_bands(self, signatures: np.ndarray) -> np.ndarray:
+        """(n, bands) uint64 keys, one per band of each signature."""
+        banded = np.asarray(signatures, dtype=np.uint64).reshape(len(signatures), self.bands, self.rows)
+        return (banded * self._band_weights).sum(axis=2, dtype=np.uint64)
+    
+    def _sort(self) -> None:
+        """Merge the unsorted tail into the per-band sorted arrays."""
+        keys = np.ascontiguousarray(self._band_keys[:len(self.signatures)].T)
+        self._sorted_rows = np.argsort(keys, axis=1)
+        self._sorted_keys = np.take_along_axis(keys, self._sorted_rows, axis=1)
+    
+    def add(self, ids: Sequence[str], signatures: np.ndarray) -> None:
+        """Index CV signatures by id, replacing those of ids already present."""
+        signatures = np.asarray(signatures, dtype=np.uint32).reshape(len(ids), self.num_perm)
+        with self._lock:
+            replaced = any(id_ in self.signatures for id_ in ids)
+            start = len(self.signatures)
+            self.signatures.add(ids, signatures)
+            count = len(self.signatures)
+            if count > len(self._band_keys):
+                grown = np.zeros((max(count, 2 * len(self._band_keys)), self.bands), dtype=np.uint64)
+                grown[:start] = self._band_keys[:start]
+                self._band_keys = grown
+            if replaced:
+                self._band_keys[:count] = self._hash_bands(self.signatures.vectors)
+                self._sort()
+                return
+            self._band_keys[start:count] = self._hash_bands(self.signatures.vectors[start:count])
+            if count - self._sorted_rows.shape[1] > _MAX_UNSORTED:
+                self._sort()
+    
+    def query(self, signature: np.ndarray, threshold: Optional[float] = None) -> List[Match]:
+        """
+        Find indexed CVs similar to a signature.
+        
+        Args:
+            signature: MinHash signature from ``signature``
+            threshold: Minimum estimated Jaccard similarity
+                (defaults to Config.NEAR_DUPLICATE_THRESHOLD)
+                
+        Returns:
+            (id, similarity) pairs at or above the threshold, most similar first
+        """
+        threshold = Config.NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold
+        keys = self._hash_bands(signature[None])[0]
+        with self._lock:
+            candidates = [
+                rows[np.searchsorted(band, key, "left"):np.searchsorted(band, key, "right")]
+                for band, rows, key in zip(self._sorted_keys, self._sorted_rows, keys)
+            ]
+            sorted_count = self._sorted_rows.shape[1]
+            tail = self._band_keys[sorted_count:len(self.signatures)]
+            candidates.append(sorted_count + np.flatnonzero((tail == keys).any(axis=1)))
+            rows = np.unique(np.concatenate(candidates))
+            if len(rows) == 0:
+                return []
+            similarity = (self.signatures.vectors[rows] == signature).mean(axis=1)
+            keep = similarity >= threshold
+            rows, similarity = rows[keep], similarity[keep]
+            order = np.argsort(-similarity, kind="stable")
+            return [(self.signatures.id_at(int(rows[i])), float(similarity[i])) for i in order]
+    
+    def check(self, id_: str, text: str, threshold: Optional[float] = None) -> Optional[DuplicateCheck]:
+        """
+        Sign a CV and find its near-duplicates among other indexed CVs.
+        
+        Args:
+            id_: Id the CV is (or will be) indexed under; excluded from the matches
+            text: CV text
+            threshold: Minimum estimated Jaccard similarity
+            
+        Returns:
+            The CV's signature and matches, or None if the text has no words
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return None
+        matches = [match for match in self.query(signature, threshold) if match[0] != id_]
+        return DuplicateCheck(id_, signature, matches)
+
+
+_default_index: Optional[NearDuplicateIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> Optional[NearDuplicateIndex]:
+    """Return the process-wide near-duplicate index configured in Config, None if disabled."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None and Config.NEAR_DUPLICATE_INDEX_PATH:
+            _default_index = NearDuplicateIndex(Config.NEAR_DUPLICATE_INDEX_PATH)
+        return _default_index
@@ -0,0 +1,152 @@
+"""
+Deterministic pre-screen that matches required skills in CV text locally.
+
+Runs before any LLM call so obvious non-matches can be rejected, or
+evaluated at low priority, without spending tokens on the full evaluation.
+"""
+
+import datetime
+import functools
+import re
+from typing import FrozenSet, Iterable, Optional, Set
+
+from ..core.config import Config
+from ..models.prescreen_result import PrescreenResult
+from ..models.skills import AMBIGUOUS_SKILL_TERMS, SKILL_ALIASES, normalize_skill, normalize_skills
+from .cv_sections import segment_cv
+
+# "5 years", "3+ yrs", "10 years of experience"
+_YEARS = re.compile(r"\b(\d{1,2})\s*\+?\s*(?:years?|yrs?)\b", re.I)
+# "2016 - 2021", "2019 – present"
+_DATE_RANGE = re.compile(
+    r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|today)\b", re.I
+)
+
+
+def _compile_terms(terms: Iterable[str]) -> Optional[re.Pattern]:
+    """Regex matching any of the terms as a whole token, longest first."""
+    # Longest terms first so "machine learning" wins over shorter overlaps
+    terms = sorted(terms, key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile(
+        r"(?<![\w+#])(" + "|".join(r"\s+".join(map(re.escape, t.split())) for t in terms) + r")(?![\w+#])",
+        re.I
+    )
+
+
+class SkillMatcher:
+    """Compiled regexes finding required skills and their aliases in text.
+    
+    Terms that are also ordinary words (``AMBIGUOUS_SKILL_TERMS``) are only
+    matched inside the CV's skills section.
+    """
+    
+    def __init__(self, skills: Iterable[str]):
+        """
+        Args:
+            skills: Required skill names, normalized on the way in
+        """
+        self.skills: FrozenSet[str] = normalize_skills(skills)
+        self._canonical = {skill: skill for skill in self.skills}
+        for alias, canonical in SKILL_ALIASES.items():
+            if canonical in self.skills:
+                self._canonical[alias] = canonical
+        self._pattern = _compile_terms(t for t in self._canonical if t not in AMBIGUOUS_SKILL_TERMS)
+        self._ambiguous_pattern = _compile_terms(t for t in self._canonical if t in AMBIGUOUS_SKILL_TERMS)
+    
+    def find(self, text: str) -> Set[str]:
+        """Canonical names of the skills mentioned in text."""
+        matches = self._pattern.findall(text) if self._pattern else []
+        if self._ambiguous_pattern:
+            matches += self._ambiguous_pattern.findall(segment_cv(text).get("skills", ""))
+        return {self._canonical.get(normalize_skill(match), normalize_skill(match)) for match in matches}
+
+
+@functools.lru_cache(maxsize=128)
+def get_skill_matcher(skills: FrozenSet[str]) -> SkillMatcher:
+    """Compiled matcher for a skill set, shared by every CV screened for it."""
+    return SkillMatcher(skills)
+
+
+def extract_years_of_experience(text: str) -> Optional[int]:
+    """
+    Estimate years of experience from explicit mentions and date ranges.
+    
+    Returns:
+        The largest stated number of years or the span covered by the
+        employment date ranges, whichever is greater; None if neither is found
+    """
+    stated = [int(years) for years in _YEARS.findall(text) if 0 < int(years) <= 50]
+    this_year = datetime.date.today().year
+    starts, ends = [], []
+    for start, end in _DATE_RANGE.findall(text):
+        start_year = int(start)
+        end_year = int(end) if end.isdigit() else this_year
+        if start_year <= end_year <= this_year:
+            starts.append(start_year)
+            ends.append(end_year)
+    if starts:
+        stated.append(max(ends) - min(starts))
+    return max(stated) if stated else None
+
+
+def guess_candidate_name(text: str) -> str:
+    """First short line of capitalized words, as CVs usually start with the name."""
+    for line in text.splitlines()[:10]:
+        words = line.strip().split()
+        if 1 < len(words) <= 4 and all(word[:1].isupper() and word.isalpha() for word in words):
+            return " ".join(words)
+    return "Candidate"
+
+
+def experience_level_from_years(years: Optional[int]) -> str:
+    """Map years of experience onto the evaluation's experience levels."""
+    if years is None:
+        return "Mid-Level"
+    if years < 2:
+        return "Entry-Level"
+    return "Mid-Level" if years < 5 else "Senior-Level"
+
+
+def prescreen(
+    cv_text: str,
+    required_skills: Iterable[str],
+    mode: Optional[str] = None,
+    reject_below: Optional[float] = None,
+    low_priority_below: Optional[float] = None
+) -> PrescreenResult:
+    """
+    Match a CV against the required skills and decide how to proceed.
+    
+    Args:
+        cv_text: Extracted text from candidate's CV
+        required_skills: Skills required by the job posting
+        mode: 'reject' or 'flag' (defaults to Config.PRESCREEN_MODE)
+        reject_below: Score rejected in 'reject' mode (defaults to Config.PRESCREEN_REJECT_BELOW)
+        low_priority_below: Score deprioritized (defaults to Config.PRESCREEN_LOW_PRIORITY_BELOW)
+        
+    Returns:
+        Match score, matched and missing skills, years of experience and a
+        decision: 'reject' below reject_below (only in 'reject' mode),
+        'low_priority' below low_priority_below, otherwise 'pass'
+    """
+    mode = mode or Config.PRESCREEN_MODE
+    reject_below = Config.PRESCREEN_REJECT_BELOW if reject_below is None else reject_below
+    low_priority_below = Config.PRESCREEN_LOW_PRIORITY_BELOW if low_priority_below is None else low_priority_below
+    matcher = get_skill_matcher(frozenset(normalize_skills(required_skills)))
+    matched = matcher.find(cv_text)
+    score = len(matched) / len(matcher.skills) if matcher.skills else 1.0
+    if mode == "reject" and score < reject_below:
+        decision = "reject"
+    elif score < low_priority_below:
+        decision = "low_priority"
+    else:
+        decision = "pass"
+    return PrescreenResult(
+        score=round(score, 4),
+        matched_skills=sorted(matched),
+        missing_skills=sorted(matcher.skills - matched),
+        years_experience=extract_years_of_experience(cv_text),
+        decision=decision
+    )
@@ -0,0 +1,154 @@
+"""
+Vectorized ranking of evaluated applicants for a job.
+
+Evaluation results are collected into columnar arrays once; weighted scores
+and top-k shortlists are then computed with NumPy in a single pass instead
+of looping over result dicts.
+"""
+
+from dataclasses import astuple, dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..models.batch_result import BatchResult
+
+EXPERIENCE_RANKS = {"Entry-Level": 0, "Mid-Level": 1, "Senior-Level": 2}
+SKILL_MATCH_SCORES = {"Strong Match": 1.0, "Partial Match": 0.5, "No Match": 0.0}
+
+
+@dataclass
+class RankingWeights:
+    """Relative weight of each normalized feature in the ranking score."""
+    
+    technical_score: float = 0.5
+    skill_match: float = 0.2
+    skill_overlap: float = 0.2
+    experience_fit: float = 0.1
+    
+    def as_array(self) -> np.ndarray:
+        """Weights normalized to sum to one, in feature column order."""
+        weights = np.array(astuple(self), dtype=np.float64)
+        total = weights.sum()
+        return weights / total if total else weights
+
+
+def build_feature_frame(results: Iterable[Mapping[str, Any]], ids: Optional[Iterable[Any]] = None) -> pd.DataFrame:
+    """
+    Collect evaluation results into a columnar frame of raw features.
+    
+    Args:
+        results: Workflow result dicts
+        ids: Optional identifiers (e.g. file paths), defaulting to positions
+        
+    Returns:
+        DataFrame with candidate_name, technical_score, experience_rank,
+        skill_match, skill_overlap and years_experience columns
+    """
+    records = list(results)
+    frame = pd.DataFrame.from_records(
+        [
+            (
+                r.get("candidate_name", ""),
+                r.get("technical_score"),
+                r.get("experience_level"),
+                r.get("skill_match"),
+                r.get("prescreen_score"),
+                r.get("years_experience"),
+            )
+            for r in records
+        ],
+        columns=["candidate_name", "technical_score", "experience_level", "skill_match",
+                 "skill_overlap", "years_experience"],
+    )
+    # Vectorized conversions; unparseable or missing values become neutral defaults
+    frame["technical_score"] = pd.to_numeric(frame["technical_score"], errors="coerce").clip(0, 10).fillna(0.0)
+    frame["experience_rank"] = frame.pop("experience_level").map(EXPERIENCE_RANKS).fillna(1).astype(np.int8)
+    frame["skill_match"] = frame["skill_match"].map(SKILL_MATCH_SCORES).fillna(0.5)
+    frame["skill_overlap"] = pd.to_numeric(frame["skill_overlap"], errors="coerce").fillna(1.0)
+    frame["years_experience"] = pd.to_numeric(frame["years_experience"], errors="coerce")
+    if ids is not None:
+        frame.index = pd.Index(list(ids), name="id")
+    return frame
+
+
+def collect_batch(results: Iterable[BatchResult]) -> pd.DataFrame:
+    """Feature frame of the successful items of a batch, indexed by input position."""
+    ok = [item for item in results if item.ok]
+    return build_feature_frame((item.result for item in ok), ids=(item.index for item in ok))
+
+
+def score_candidates(
+    frame: pd.DataFrame,
+    weights: Optional[RankingWeights] = None,
+    job_level: Optional[str] = None
+) -> np.ndarray:
+    """
+    Weighted score in [0, 1] of every row of a feature frame.
+    
+    Args:
+        frame: Output of build_feature_frame
+        weights: Feature weights (defaults to RankingWeights())
+        job_level: Experience level of the job; experience fit is the
+            closeness to it, or seniority when not given
+            
+    Returns:
+        Array of scores aligned with the frame rows
+    """
+    weights = weights or RankingWeights()
+    experience = frame["experience_rank"].to_numpy(dtype=np.float64)
+    if job_level in EXPERIENCE_RANKS:
+        experience_fit = 1.0 - np.abs(experience - EXPERIENCE_RANKS[job_level]) / 2.0
+    else:
+        experience_fit = experience / 2.0
+    features = np.column_stack((
+        frame["technical_score"].to_numpy(dtype=np.float64) / 10.0,
+        frame["skill_match"].to_numpy(dtype=np.float64),
+        frame["skill_overlap"].to_numpy(dtype=np.float64),
+        experience_fit,
+    ))
+    return features @ weights.as_array()
+
+
+def rank_candidates(
+    frame: pd.DataFrame,
+    top_k: Optional[int] = None,
+    weights: Optional[RankingWeights] = None,
+    job_level: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Shortlist the best candidates by weighted score.
+    
+    Only the top ``k`` rows are fully sorted (``argpartition`` selects them
+    in linear time); ties are broken by technical score.
+    
+    Args:
+        frame: Output of build_feature_frame
+        top_k: Rows to return (all when None)
+        weights: Feature weights
+        job_level: Experience level of the job
+        
+    Returns:
+        The selected rows with ``score`` and 1-based ``rank`` columns, best first
+    """
+    scores = score_candidates(frame, weights, job_level)
+    count = len(scores)
+    k = count if top_k is None else max(0, min(top_k, count))
+    candidates = np.arange(count)
+    if k < count:
+        candidates = np.argpartition(-scores, k - 1)[:k] if k else candidates[:0]
+    # lexsort sorts by the last key first: score, then technical score
+    order = candidates[np.lexsort((
+        -frame["technical_score"].to_numpy()[candidates], -scores[candidates]
+    ))]
+    shortlist = frame.iloc[order].copy()
+    shortlist["score"] = scores[order]
+    shortlist["rank"] = np.arange(1, len(order) + 1)
+    return shortlist
+
+
+def shortlist_records(shortlist: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a ranked frame to JSON-serializable records including the id."""
+    records = shortlist.reset_index().rename(columns={"index": "id"})
+    return records.astype(object).where(records.notna(), None).to_dict(orient="records")
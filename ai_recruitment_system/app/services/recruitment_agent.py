@@ -2,26 +2,77 @@
 Main recruitment agent service that orchestrates the entire process.
 """
 
-from typing import Dict, Any
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, Callable, Generator, Iterable, Iterator, Optional, Tuple, TypeVar, Union
 
-from ..agents.workflow import RecruitmentWorkflow
+from ..core.cache import CacheBackend
+from ..core.config import Config
 from ..core.exceptions import AgentWorkflowError
+from ..core.scheduler import Priority, priority_scope
+from ..core.singleflight import SingleFlight, get_single_flight
+from ..models.batch_result import BatchResult
+from ..models.job_posting import JobPosting
+from ..models.progress_event import ProgressEvent
+from ..models.stored_result import ResultKey
+from .batch_manifest import BatchManifest, get_batch_manifest
+from .near_duplicates import DuplicateCheck, NearDuplicateIndex, get_near_duplicate_index
+from .result_store import ResultStore, content_hash, get_result_store, make_result_key
+
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 class RecruitmentAgent:
     """Main service for processing job applications."""
     
-    def __init__(self):
-        """Initialize the recruitment agent with workflow."""
-        self.workflow = RecruitmentWorkflow()
+    def __init__(
+        self,
+        llm: Optional["BaseChatModel"] = None,
+        evaluation_mode: Optional[str] = None,
+        cache: Optional[CacheBackend] = None,
+        results: Optional[ResultStore] = None,
+        manifest: Optional[BatchManifest] = None,
+        cascade_llm: Optional["BaseChatModel"] = None,
+        flights: Optional[SingleFlight] = None,
+        duplicates: Optional[NearDuplicateIndex] = None
+    ):
+        """
+        Initialize the recruitment agent with workflow.
+        
+        Args:
+            llm: Chat model (defaults to the shared configured one)
+            evaluation_mode: 'parallel' or 'fused' (defaults to Config.EVALUATION_MODE)
+            cache: LLM response cache (defaults to the configured one)
+            results: Store of finished evaluations (defaults to the configured one)
+            manifest: Progress record of named batches (defaults to the configured one)
+            cascade_llm: Stronger model for borderline evaluations (defaults to Config.CASCADE_MODEL)
+            flights: Registry coalescing identical concurrent requests (defaults to the shared one)
+            duplicates: Index of previously seen CVs for near-duplicate detection
+                (defaults to the configured one)
+        """
+        # Imported here so importing this module does not load LangGraph
+        from ..agents.workflow import RecruitmentWorkflow
+        self.workflow = RecruitmentWorkflow(llm, evaluation_mode, cache, cascade_llm=cascade_llm)
+        self.results = results if results is not None else get_result_store()
+        self.manifest = manifest if manifest is not None else get_batch_manifest()
+        self.flights = flights if flights is not None else get_single_flight()
+        self.duplicates = duplicates if duplicates is not None else get_near_duplicate_index()
     
-    def process_application(self, cv_text: str, job_posting: str) -> Dict[str, Any]:
+    def process_application(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Dict[str, Any]:
         """
         Process a job application through the complete AI workflow.
         
         Args:
             cv_text: Extracted text from candidate's CV
-            job_posting: Job posting text
+            job_posting: Job posting or its text
             
         Returns:
             Dictionary containing evaluation results
@@ -29,11 +80,351 @@ class RecruitmentAgent:
         Raises:
             AgentWorkflowError: If workflow execution fails
         """
+        key = self._result_key(cv_text, job_posting)
+        stored = self._stored_result(key)
+        if stored is not None:
+            return stored
+        check, reused = self._check_duplicates(cv_text, key)
+        if reused is not None:
+            return reused
+        
+        def evaluate() -> Dict[str, Any]:
+            try:
+                result = self.workflow.process_application(cv_text, job_posting)
+            except Exception as e:
+                raise AgentWorkflowError(f"Failed to process application: {str(e)}")
+            self._record_duplicates(check, result)
+            self._store_result(key, result)
+            return result
+        
+        # Identical requests already in flight share that run instead of starting another
+        return self.flights.do(self._flight_key(cv_text, job_posting), evaluate)
+    
+    async def aprocess_application(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Dict[str, Any]:
+        """
+        Asynchronously process a job application through the complete AI workflow.
+        
+        Args:
+            cv_text: Extracted text from candidate's CV
+            job_posting: Job posting or its text
+            
+        Returns:
+            Dictionary containing evaluation results
+            
+        Raises:
+            AgentWorkflowError: If workflow execution fails
+        """
+        key = self._result_key(cv_text, job_posting)
+        stored = self._stored_result(key)
+        if stored is not None:
+            return stored
+        check, reused = self._check_duplicates(cv_text, key)
+        if reused is not None:
+            return reused
+        
+        async def evaluate() -> Dict[str, Any]:
+            try:
+                result = await self.workflow.aprocess_application(cv_text, job_posting)
+            except Exception as e:
+                raise AgentWorkflowError(f"Failed to process application: {str(e)}")
+            self._record_duplicates(check, result)
+            self._store_result(key, result)
+            return result
+        
+        return await self.flights.ado(self._flight_key(cv_text, job_posting), evaluate)
+    
+    def stream_application(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Iterator[ProgressEvent]:
+        """
+        Process a job application, yielding progress events as the workflow runs.
+        
+        Args:
+            cv_text: Extracted text from candidate's CV
+            job_posting: Job posting or its text
+            
+        Yields:
+            Node and token events followed by the ``result`` event; a stored
+            or reused result, or that of an identical request already in
+            flight, is yielded as a lone ``result`` event
+            
+        Raises:
+            AgentWorkflowError: If workflow execution fails
+        """
+        key = self._result_key(cv_text, job_posting)
+        stored = self._stored_result(key)
+        if stored is not None:
+            yield ProgressEvent("result", update=stored)
+            return
+        check, reused = self._check_duplicates(cv_text, key)
+        if reused is not None:
+            yield ProgressEvent("result", update=reused)
+            return
+        
+        def evaluate() -> Generator[ProgressEvent, None, Dict[str, Any]]:
+            result: Dict[str, Any] = {}
+            for event in self.workflow.stream_application(cv_text, job_posting):
+                if event.kind == "result":
+                    result = event.update
+                else:
+                    yield event
+            self._record_duplicates(check, result)
+            self._store_result(key, result)
+            return result
+        
+        # Requests joining one already in flight (streamed or not) only get its
+        # result; running the same checkpoint thread twice would interleave them
+        try:
+            result = yield from self.flights.stream(self.workflow.thread_id(cv_text, job_posting), evaluate)
+        except Exception as e:
+            raise AgentWorkflowError(f"Failed to process application: {str(e)}")
+        yield ProgressEvent("result", update=result)
+    
+    def _flight_key(self, cv_text: str, job_posting: Union[str, JobPosting]) -> str:
+        """Single-flight key of an application, raising AgentWorkflowError for unusable input."""
         try:
-            return self.workflow.process_application(cv_text, job_posting)
+            return self.workflow.thread_id(cv_text, job_posting)
         except Exception as e:
             raise AgentWorkflowError(f"Failed to process application: {str(e)}")
     
+    def _result_key(self, cv_text: str, job_posting: Union[str, JobPosting]) -> Optional[ResultKey]:
+        """Store key of an application, None when no result store is configured."""
+        if self.results is None:
+            return None
+        try:
+            return make_result_key(cv_text, job_posting, self.workflow.nodes.model_id, self.workflow.prompt_version)
+        except Exception as e:
+            raise AgentWorkflowError(f"Failed to process application: {str(e)}")
+    
+    def _best_effort(self, store: str, func: Callable[[], T], default: T = None) -> T:
+        """
+        Run an operation on an optional store without letting it fail the application.
+        
+        The result store, batch manifest and near-duplicate index only save
+        work; when one of them errors (a locked or corrupt database, a full
+        disk) the error is logged and counted, and processing goes on as if
+        the store were not configured.
+        
+        Args:
+            store: Name of the store, for the log message
+            func: Zero-argument callable doing the operation
+            default: Value returned when the operation fails
+            
+        Returns:
+            The operation's result, or ``default`` if it raised
+        """
+        try:
+            return func()
+        except Exception:
+            logger.warning("%s operation failed, continuing without it", store, exc_info=True)
+            self.workflow.metrics.increment("store_errors")
+            return default
+    
+    def _stored_result(self, key: Optional[ResultKey]) -> Optional[Dict[str, Any]]:
+        """Previously stored result for the key, counted in the metrics."""
+        if key is None:
+            return None
+        result = self._best_effort("Result store", lambda: self.results.get(key))
+        if result is not None:
+            self.workflow.metrics.increment("stored_results")
+        return result
+    
+    def _check_duplicates(
+        self,
+        cv_text: str,
+        key: Optional[ResultKey]
+    ) -> Tuple[Optional[DuplicateCheck], Optional[Dict[str, Any]]]:
+        """
+        Look up near-duplicates of a CV before it is evaluated.
+        
+        Args:
+            cv_text: Extracted CV text
+            key: Store key of the application, None without a result store
+            
+        Returns:
+            The duplicate check (None when detection is disabled or the CV has
+            no words) and, if a near-identical CV was already evaluated for the
+            same job, model and prompts, a copy of that result to reuse
+        """
+        if self.duplicates is None:
+            return None, None
+        check = self._best_effort("Near-duplicate index", lambda: self.duplicates.check(content_hash(cv_text), cv_text))
+        if check is None or key is None:
+            return check, None
+        for match_id, similarity in check.matches:
+            if similarity < Config.NEAR_DUPLICATE_REUSE_THRESHOLD:
+                break
+            result = self._best_effort("Result store", lambda: self.results.get(key._replace(cv_hash=match_id)))
+            if result is not None:
+                self.workflow.metrics.increment("near_duplicate_reuses")
+                self._index_cv(check)
+                result.update(duplicate_of=match_id, duplicate_similarity=similarity)
+                return check, result
+        return check, None
+    
+    def _record_duplicates(self, check: Optional[DuplicateCheck], result: Dict[str, Any]) -> None:
+        """Flag a fresh result with its closest near-duplicate and index the CV."""
+        if check is None:
+            return
+        if check.matches:
+            self.workflow.metrics.increment("near_duplicates")
+            result["duplicate_of"], result["duplicate_similarity"] = check.matches[0]
+        self._index_cv(check)
+    
+    def _index_cv(self, check: DuplicateCheck) -> None:
+        """Add a CV to the near-duplicate index unless it is already there."""
+        # Re-adding an indexed CV would re-sort the whole band index for an identical signature
+        if check.id not in self.duplicates:
+            self._best_effort("Near-duplicate index", lambda: self.duplicates.add([check.id], check.signature[None]))
+    
+    def _store_result(self, key: Optional[ResultKey], result: Dict[str, Any]) -> None:
+        """Persist a finished result unless a node had to fall back to a default answer."""
+        if key is not None and not result.get("metrics", {}).get("application", {}).get("fallback"):
+            self._best_effort("Result store", lambda: self.results.put(key, result))
+    
+    async def aprocess_batch(
+        self,
+        applications: Iterable[Tuple[str, Union[str, JobPosting]]],
+        max_concurrency: Optional[int] = None,
+        batch_id: Optional[str] = None
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Evaluate many applications with bounded concurrency.
+        
+        Results are yielded in completion order; ``BatchResult.index`` gives the
+        position of the application in the input. A failing application yields
+        a result carrying an ``AgentWorkflowError`` instead of aborting the batch.
+        Batch LLM calls are scheduled behind interactive ones.
+        
+        Args:
+            applications: Iterable of ``(cv_text, job_posting)`` pairs
+            max_concurrency: Maximum applications in flight at once
+                (defaults to ``Config.BATCH_CONCURRENCY``)
+            batch_id: Name under which item progress is recorded in the
+                batch manifest, if one is configured
+                
+        Yields:
+            One BatchResult per application as soon as it finishes
+        """
+        limit = max(1, max_concurrency or Config.BATCH_CONCURRENCY)
+        pending = enumerate(applications)
+        results: asyncio.Queue = asyncio.Queue()
+        
+        async def worker():
+            # Workers share one iterator, so applications are pulled lazily
+            # and at most ``limit`` are in flight at any time
+            try:
+                for index, (cv_text, job_posting) in pending:
+                    await results.put(await self._aprocess_item(index, cv_text, job_posting, batch_id))
+            finally:
+                await results.put(None)
+        
+        # Tasks copy the context when created, so their LLM calls run at batch priority
+        with priority_scope(Priority.BATCH):
+            workers = [asyncio.create_task(worker()) for _ in range(limit)]
+        try:
+            running = len(workers)
+            while running:
+                item = await results.get()
+                if item is None:
+                    running -= 1
+                else:
+                    yield item
+            # Surface errors raised by the input iterable itself
+            for task in workers:
+                task.result()
+        finally:
+            for task in workers:
+                task.cancel()
+    
+    def process_batch(
+        self,
+        applications: Iterable[Tuple[str, Union[str, JobPosting]]],
+        max_concurrency: Optional[int] = None,
+        batch_id: Optional[str] = None
+    ) -> Iterator[BatchResult]:
+        """
+        Synchronous wrapper around ``aprocess_batch``.
+        
+        Drives the async batch on a private event loop, so it must not be
+        called from a thread that is already running one.
+        
+        Args:
+            applications: Iterable of ``(cv_text, job_posting)`` pairs
+            max_concurrency: Maximum applications in flight at once
+            batch_id: Name under which item progress is recorded
+            
+        Yields:
+            One BatchResult per application as soon as it finishes
+        """
+        limit = max(1, max_concurrency or Config.BATCH_CONCURRENCY)
+        loop = asyncio.new_event_loop()
+        # Sync graph nodes run in the loop's default executor, so size it for
+        # every parallel branch of every application in flight
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=limit * len(self.workflow.EVALUATION_NODES))
+        )
+        batch = self.aprocess_batch(applications, limit, batch_id)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(batch.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(batch.aclose())
+            loop.close()
+    
+    async def _aprocess_item(
+        self,
+        index: int,
+        cv_text: str,
+        job_posting: Union[str, JobPosting],
+        batch_id: Optional[str] = None
+    ) -> BatchResult:
+        """Process one batch item, capturing failures and timing in the result."""
+        item_key = None
+        started = time.perf_counter()
+        try:
+            if batch_id and self.manifest is not None:
+                item_key = self._flight_key(cv_text, job_posting)
+                self._best_effort("Batch manifest", lambda: self.manifest.mark(batch_id, item_key, index, "running"))
+            item = BatchResult(index, result=await self.aprocess_application(cv_text, job_posting))
+        except AgentWorkflowError as e:
+            item = BatchResult(index, error=e)
+        except Exception as e:
+            # Whatever goes wrong with one application must not abort the batch
+            item = BatchResult(index, error=AgentWorkflowError(f"Failed to process application: {str(e)}"))
+        item.elapsed_ms = (time.perf_counter() - started) * 1000
+        if item_key is not None:
+            self._best_effort("Batch manifest", lambda: self.manifest.mark(
+                batch_id, item_key, index, "done" if item.ok else "failed",
+                error=str(item.error) if item.error else None, elapsed_ms=item.elapsed_ms
+            ))
+        return item
+    
     def get_workflow_graph(self):
         """Get the workflow graph for visualization."""
         return self.workflow.app.get_graph()
+
+
+_shared_agents: Dict[Tuple[str, str, str, str], RecruitmentAgent] = {}
+_shared_agents_lock = threading.Lock()
+
+
+def get_recruitment_agent(evaluation_mode: Optional[str] = None) -> RecruitmentAgent:
+    """
+    Return the process-wide agent for the configured provider, models and mode.
+    
+    The compiled graph and chat model hold no per-request state, so a single
+    agent safely serves every session and thread in the process.
+    
+    Args:
+        evaluation_mode: 'parallel' or 'fused' (defaults to Config.EVALUATION_MODE)
+        
+    Returns:
+        Shared recruitment agent
+    """
+    key = (Config.LLM_PROVIDER, Config.OPENAI_MODEL, evaluation_mode or Config.EVALUATION_MODE, Config.CASCADE_MODEL)
+    with _shared_agents_lock:
+        if key not in _shared_agents:
+            _shared_agents[key] = RecruitmentAgent(evaluation_mode=key[2])
+        return _shared_agents[key]
@@ -0,0 +1,203 @@
+"""
+Persistent store of evaluation results for idempotent re-screening.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+from ..core.config import Config
+from ..models.job_posting import JobPosting
+from ..models.stored_result import ResultKey, StoredResult
+
+# Result fields copied into their own columns so they can be filtered and exported
+SUMMARY_FIELDS = ("candidate_name", "experience_level", "skill_match", "technical_score", "prescreen_decision")
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of a text, the id of a CV in the result store."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_result_key(
+    cv_text: str,
+    job_posting: Union[str, JobPosting],
+    model: str,
+    prompt_version: str
+) -> ResultKey:
+    """
+    Build the store key of an application.
+    
+    Args:
+        cv_text: Extracted CV text
+        job_posting: Job posting or its text
+        model: Identifier of the chat model
+        prompt_version: Version of the prompts and evaluation settings
+        
+    Returns:
+        ResultKey hashing the CV and the job posting
+    """
+    if isinstance(job_posting, JobPosting):
+        job_hash = job_posting.content_hash
+    else:
+        job_hash = content_hash(job_posting)
+    return ResultKey(content_hash(cv_text), job_hash, model, prompt_version)
+
+
+def _score(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ResultStore:
+    """SQLite repository of evaluation results keyed by CV, job, model and prompt version.
+    
+    Each row keeps the full workflow state (including per-node metrics) as
+    JSON next to indexed summary columns used for bulk queries and export.
+    """
+    
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: Database file, ':memory:' for a process-local store
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "cv_hash TEXT NOT NULL, job_hash TEXT NOT NULL, "
+            "model TEXT NOT NULL, prompt_version TEXT NOT NULL, "
+            "candidate_name TEXT, experience_level TEXT, skill_match TEXT, "
+            "technical_score REAL, prescreen_decision TEXT, "
+            "elapsed_ms REAL NOT NULL, created_at REAL NOT NULL, result TEXT NOT NULL, "
+            "PRIMARY KEY (cv_hash, job_hash, model, prompt_version))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_job ON results (job_hash, technical_score)")
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    def get(self, key: ResultKey) -> Optional[Dict[str, Any]]:
+        """Return the stored result for a key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM results "
+                "WHERE cv_hash = ? AND job_hash = ? AND model = ? AND prompt_version = ?",
+                key
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put(self, key: ResultKey, result: Dict[str, Any]) -> None:
+        """Store a workflow result, replacing any previous one for the key."""
+        elapsed_ms = result.get("metrics", {}).get("application", {}).get("wall_ms", 0.0)
+        summary = [result.get(field) for field in SUMMARY_FIELDS]
+        summary[SUMMARY_FIELDS.index("technical_score")] = _score(result.get("technical_score"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, *summary, elapsed_ms, time.time(), json.dumps(result, default=str))
+            )
+    
+    def query(
+        self,
+        job_hash: Optional[str] = None,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+        min_score: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> List[StoredResult]:
+        """
+        Fetch stored results matching every given filter.
+        
+        Args:
+            job_hash: Only results for this job
+            model: Only results from this model
+            prompt_version: Only results from this prompt version
+            min_score: Only results with at least this technical score
+            limit: Maximum number of results
+            
+        Returns:
+            Matching results, best technical score first
+        """
+        clauses, params = [], []
+        for column, value in (("job_hash", job_hash), ("model", model), ("prompt_version", prompt_version)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_score is not None:
+            clauses.append("technical_score >= ?")
+            params.append(min_score)
+        sql = "SELECT cv_hash, job_hash, model, prompt_version, elapsed_ms, created_at, result FROM results"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY technical_score IS NULL, technical_score DESC, created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            StoredResult(ResultKey(*row[:4]), json.loads(row[6]), elapsed_ms=row[4], created_at=row[5])
+            for row in rows
+        ]
+    
+    def export(self, out: TextIO, fmt: str = "jsonl", **filters: Any) -> int:
+        """
+        Write stored results to a file.
+        
+        Args:
+            out: Text stream to write to
+            fmt: 'jsonl' (full records) or 'csv' (key and summary columns)
+            **filters: Passed to ``query``
+            
+        Returns:
+            Number of results written
+            
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if fmt not in ("jsonl", "csv"):
+            raise ValueError(f"Unknown export format '{fmt}', expected jsonl or csv")
+        results = self.query(**filters)
+        if fmt == "jsonl":
+            for item in results:
+                out.write(json.dumps(item.to_dict(), default=str) + "\n")
+        else:
+            writer = csv.writer(out)
+            writer.writerow([*ResultKey._fields, *SUMMARY_FIELDS, "elapsed_ms", "created_at"])
+            for item in results:
+                writer.writerow([
+                    *item.key, *(item.result.get(field) for field in SUMMARY_FIELDS),
+                    round(item.elapsed_ms, 1), item.created_at
+                ])
+        return len(results)
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+_default_store: Optional[ResultStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_result_store() -> Optional[ResultStore]:
+    """Return the process-wide result store configured in Config, None if disabled."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None and Config.RESULT_STORE_PATH:
+            _default_store = ResultStore(Config.RESULT_STORE_PATH)
+        return _default_store
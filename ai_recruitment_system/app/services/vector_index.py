@@ -0,0 +1,260 @@
+"""
+Memory-mapped vector index for CV/job semantic similarity.
+
+CVs and job postings are embedded once and stored as rows of a float32
+matrix on disk; "top-N candidates for a job" and "best jobs for a CV" are
+answered with batched NumPy dot products instead of pairwise LLM calls.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..core.config import Config
+from ..models.job_posting import JobPosting
+from .embeddings import Encoder, create_encoder
+
+Match = Tuple[str, float]
+
+
+class VectorIndex:
+    """Append-only matrix of vectors addressed by string ids.
+    
+    With a path, vectors live in a memory-mapped ``<path>`` file, the ids in
+    an append-only log ``<path>.ids`` (one JSON string per line) and the
+    dimension and encoder identity in ``<path>.json``, so the index survives
+    restarts and is paged in by the OS on demand. Adding a vector writes its row through the memory
+    map and appends only new ids, so inserts cost the same at any size.
+    Without a path the index is held in process memory.
+    """
+    
+    def __init__(
+        self,
+        dim: int,
+        path: Optional[str] = None,
+        initial_capacity: int = 1024,
+        dtype: np.dtype = np.float32,
+        encoder: Optional[str] = None
+    ):
+        """
+        Args:
+            dim: Vector dimension
+            path: Matrix file, or None for an in-memory index
+            initial_capacity: Rows allocated before the first growth
+            dtype: Element type of the stored vectors
+            encoder: Identity of the encoder producing the vectors; reopening
+                the index with another encoder is rejected
+        """
+        self.dim = dim
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.encoder = encoder
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._matrix: np.ndarray = np.zeros((0, dim), dtype=self.dtype)
+        if path and os.path.exists(path) and os.path.exists(self._meta_path):
+            self._load()
+        else:
+            self._resize(initial_capacity)
+            self._create()
+    
+    @property
+    def _meta_path(self) -> str:
+        return f"{self.path}.json"
+    
+    @property
+    def _ids_path(self) -> str:
+        return f"{self.path}.ids"
+    
+    def _create(self) -> None:
+        """Write an empty id log and the metadata of an on-disk index, the metadata last."""
+        if not self.path:
+            return
+        open(self._ids_path, "w", encoding="utf-8").close()
+        tmp_path = f"{self._meta_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "encoder": self.encoder}, f)
+        os.replace(tmp_path, self._meta_path)
+    
+    def _read_ids(self) -> List[str]:
+        with open(self._ids_path, "rb") as f:
+            data = f.read()
+        # A crash while appending can leave a partial last line; drop it
+        complete = data[:data.rfind(b"\n") + 1]
+        if len(complete) < len(data):
+            with open(self._ids_path, "r+b") as f:
+                f.truncate(len(complete))
+        # Each line is one JSON string, so the log reads as a single JSON array
+        return json.loads("[" + complete.decode("utf-8").rstrip("\n").replace("\n", ",") + "]")
+    
+    def _load(self) -> None:
+        with open(self._meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["dim"] != self.dim:
+            raise ValueError(f"Index {self.path} has dimension {meta['dim']}, expected {self.dim}")
+        if meta["encoder"] != self.encoder:
+            raise ValueError(f"Index {self.path} was built by encoder {meta['encoder']}, expected {self.encoder}")
+        self._ids = self._read_ids()
+        self._positions = {id_: position for position, id_ in enumerate(self._ids)}
+        capacity = os.path.getsize(self.path) // (self.dtype.itemsize * self.dim)
+        self._matrix = np.memmap(self.path, dtype=self.dtype, mode="r+", shape=(capacity, self.dim))
+    
+    def _resize(self, capacity: int) -> None:
+        """Grow the matrix to ``capacity`` rows, keeping existing vectors."""
+        if not self.path:
+            matrix = np.zeros((capacity, self.dim), dtype=self.dtype)
+            matrix[:len(self._ids)] = self._matrix[:len(self._ids)]
+            self._matrix = matrix
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+        self._matrix = None
+        # Extending the file zero-fills the new rows without copying the old ones
+        with open(self.path, "ab") as f:
+            f.truncate(capacity * self.dim * self.dtype.itemsize)
+        self._matrix = np.memmap(self.path, dtype=self.dtype, mode="r+", shape=(capacity, self.dim))
+    
+    def _append_ids(self, ids: Sequence[str]) -> None:
+        """Log newly added ids; their rows are already written through the memory map."""
+        if not self.path or not ids:
+            return
+        with open(self._ids_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(id_) + "\n" for id_ in ids)
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __contains__(self, id_: str) -> bool:
+        return id_ in self._positions
+    
+    @property
+    def ids(self) -> List[str]:
+        """Ids in row order."""
+        return list(self._ids)
+    
+    @property
+    def vectors(self) -> np.ndarray:
+        """Stored vectors in row order, as a view into the matrix."""
+        return self._matrix[:len(self._ids)]
+    
+    def id_at(self, row: int) -> str:
+        """Id stored in a row."""
+        return self._ids[row]
+    
+    def get(self, id_: str) -> np.ndarray:
+        """Copy of the vector stored for an id."""
+        return np.array(self._matrix[self._positions[id_]])
+    
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """Insert vectors, replacing those of ids already present."""
+        vectors = np.asarray(vectors, dtype=self.dtype).reshape(len(ids), self.dim)
+        with self._lock:
+            new = [id_ for id_ in dict.fromkeys(ids) if id_ not in self._positions]
+            needed = len(self._ids) + len(new)
+            if needed > len(self._matrix):
+                self._resize(max(needed, 2 * len(self._matrix)))
+            for id_ in new:
+                self._positions[id_] = len(self._ids)
+                self._ids.append(id_)
+            rows = np.fromiter((self._positions[id_] for id_ in ids), dtype=np.int64, count=len(ids))
+            self._matrix[rows] = vectors
+            # Rows are written before their ids are logged, so a crash in
+            # between loses the new ids but never exposes unwritten rows
+            self._append_ids(new)
+    
+    def search(self, queries: np.ndarray, top_n: int = 10) -> List[List[Match]]:
+        """
+        Rank stored vectors by cosine similarity to each query.
+        
+        Args:
+            queries: (dim,) or (m, dim) array of unit vectors
+            top_n: Matches returned per query
+            
+        Returns:
+            For each query, up to ``top_n`` (id, similarity) pairs, best first
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        with self._lock:
+            count = len(self._ids)
+            k = min(top_n, count)
+            if k <= 0:
+                return [[] for _ in range(len(queries))]
+            scores = queries @ self._matrix[:count].T
+            ids = list(self._ids)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        return [
+            [(ids[i], float(score)) for i, score in zip(row, row_scores)]
+            for row, row_scores in zip(top, top_scores)
+        ]
+
+
+class SemanticMatcher:
+    """Embeds CVs and job postings once and matches them in either direction."""
+    
+    def __init__(self, encoder: Optional[Encoder] = None, directory: Optional[str] = None):
+        """
+        Args:
+            encoder: Text encoder (defaults to ``create_encoder()``)
+            directory: Where the memory-mapped indexes are kept, None for memory only
+        """
+        self.encoder = encoder or create_encoder()
+        path = (lambda name: os.path.join(directory, f"{name}.f32")) if directory else (lambda name: None)
+        self.cvs = VectorIndex(self.encoder.dim, path("cvs"), encoder=self.encoder.identity)
+        self.jobs = VectorIndex(self.encoder.dim, path("jobs"), encoder=self.encoder.identity)
+    
+    def _add(self, index: VectorIndex, texts: Mapping[str, str], refresh: bool) -> int:
+        pending = {id_: text for id_, text in texts.items() if refresh or id_ not in index}
+        if pending:
+            index.add(list(pending), self.encoder.encode(list(pending.values())))
+        return len(pending)
+    
+    def add_cvs(self, cvs: Mapping[str, str], refresh: bool = False) -> int:
+        """Embed CV texts by id, skipping ids already indexed; returns the number embedded."""
+        return self._add(self.cvs, cvs, refresh)
+    
+    def add_jobs(self, jobs: Mapping[str, JobPosting], refresh: bool = False) -> int:
+        """Embed job postings by id, skipping ids already indexed; returns the number embedded."""
+        return self._add(self.jobs, {id_: job.prompt_text() for id_, job in jobs.items()}, refresh)
+    
+    def _query(self, index: VectorIndex, item: Union[str, JobPosting]) -> np.ndarray:
+        """Stored vector for a known id, otherwise the embedding of the text."""
+        if isinstance(item, JobPosting):
+            return self.encoder.encode([item.prompt_text()])[0]
+        if item in index:
+            return index.get(item)
+        return self.encoder.encode([item])[0]
+    
+    def top_candidates(self, job: Union[str, JobPosting], top_n: int = 10) -> List[Match]:
+        """Most similar indexed CVs for a job id or posting."""
+        return self.cvs.search(self._query(self.jobs, job), top_n)[0]
+    
+    def best_jobs(self, cv: str, top_n: int = 5) -> List[Match]:
+        """Most similar indexed jobs for a CV id or CV text."""
+        return self.jobs.search(self._query(self.cvs, cv), top_n)[0]
+    
+    def top_candidates_for_jobs(self, job_ids: Sequence[str], top_n: int = 10) -> Dict[str, List[Match]]:
+        """Shortlists for many indexed jobs with one matrix product."""
+        queries = np.stack([self.jobs.get(id_) for id_ in job_ids]) if job_ids else np.zeros((0, self.encoder.dim))
+        return dict(zip(job_ids, self.cvs.search(queries, top_n)))
+
+
+_default_matcher: Optional[SemanticMatcher] = None
+_default_matcher_lock = threading.Lock()
+
+
+def get_semantic_matcher() -> SemanticMatcher:
+    """Return the process-wide matcher configured in Config."""
+    global _default_matcher
+    with _default_matcher_lock:
+        if _default_matcher is None:
+            _default_matcher = SemanticMatcher(directory=Config.VECTOR_INDEX_DIR or None)
+        return _default_matcher
@@ -4,6 +4,7 @@ File upload components for CV processing.
 
 import streamlit as st
 from ...services.cv_parser import CVParser
+from ...services.document_store import get_document_store
 from ...core.exceptions import CVParseError, FileProcessingError
 
 
@@ -33,9 +34,9 @@ def render_file_upload() -> tuple[str, str]:
                 st.error(f"❌ Unsupported file type: {uploaded_file.type}")
                 return cv_text, file_type
             
-            # Extract text
-            file_content = uploaded_file.read()
-            cv_text = CVParser.extract_text_from_file(file_content, uploaded_file.type)
+            # Extract text (reruns and re-uploads are served from the document store)
+            file_content = uploaded_file.getvalue()
+            cv_text = get_document_store().parse(file_content, uploaded_file.type).text
             file_type = uploaded_file.type
             
             if cv_text:
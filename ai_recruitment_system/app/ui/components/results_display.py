@@ -3,7 +3,24 @@ Results display components for application evaluation.
 """
 
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
+
+from ...models.progress_event import ProgressEvent
+
+# Result fields shown as metrics, in display order
+METRICS = (
+    ("candidate_name", "👤 Candidate"),
+    ("experience_level", "⭐ Experience"),
+    ("skill_match", "🎯 Skill Match"),
+    ("technical_score", "📈 Technical Score"),
+)
+
+
+def _format_metric(field: str, value: Any) -> str:
+    """Display text of a metric value."""
+    if field == "technical_score":
+        return f"{value or 'N/A'}/10"
+    return value or "Unknown"
 
 
 def render_results(result: Dict[str, Any]):
@@ -11,18 +28,71 @@ def render_results(result: Dict[str, Any]):
     st.header("📊 Application Results")
     
     # Metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("👤 Candidate", result.get('candidate_name', 'Unknown'))
-    with col2:
-        st.metric("⭐ Experience", result.get('experience_level', 'Unknown'))
-    with col3:
-        st.metric("🎯 Skill Match", result.get('skill_match', 'Unknown'))
-    with col4:
-        score = result.get('technical_score', 'N/A')
-        st.metric("📈 Technical Score", f"{score}/10")
-    
-    # Decision
+    for column, (field, label) in zip(st.columns(4), METRICS):
+        with column:
+            st.metric(label, _format_metric(field, result.get(field)))
+    
+    render_duplicate_notice(result)
+    render_decision(result)
+    render_recommendations(result.get('learning_recommendations', ''))
+
+
+def render_results_stream(events: Iterable[ProgressEvent]) -> Dict[str, Any]:
+    """
+    Render application results progressively while the workflow runs.
+    
+    Each metric appears as soon as the node producing it finishes, and the
+    learning recommendations are shown token by token as they are generated.
+    
+    Args:
+        events: Progress events of one application, ending with its result
+        
+    Returns:
+        The final evaluation result
+    """
+    st.header("📊 Application Results")
+    status = st.status("Processing your application...")
+    
+    # Metrics start as placeholders and are filled in as nodes finish
+    placeholders = {}
+    for column, (field, label) in zip(st.columns(4), METRICS):
+        placeholders[field] = column.empty()
+        placeholders[field].metric(label, "…")
+    decision = st.empty()
+    recommendations = st.empty()
+    
+    result: Dict[str, Any] = {}
+    streamed = ""
+    try:
+        for event in events:
+            if event.kind == "token":
+                streamed += event.text
+                with recommendations.container():
+                    st.subheader("📚 Learning Recommendations")
+                    st.info(streamed + "▌")
+                continue
+            if event.kind == "result":
+                result = event.update
+            else:
+                status.update(label=f"Finished {event.node.replace('_', ' ')}...")
+            for field, label in METRICS:
+                if event.update.get(field):
+                    placeholders[field].metric(label, _format_metric(field, event.update[field]))
+    except Exception:
+        status.update(label="Processing failed", state="error")
+        raise
+    
+    status.update(label="Evaluation complete", state="complete")
+    with decision.container():
+        render_duplicate_notice(result)
+        render_decision(result)
+    with recommendations.container():
+        render_recommendations(result.get('learning_recommendations', ''))
+    return result
+
+
+def render_decision(result: Dict[str, Any]):
+    """Render the final hiring decision."""
     st.subheader("📋 Final Decision")
     response = result.get('response', '')
     
@@ -32,20 +102,23 @@ def render_results(result: Dict[str, Any]):
         st.warning(response)
     else:
         st.error(response)
-    
-    # Learning recommendations
-    recommendations = result.get('learning_recommendations', '')
+
+
+def render_duplicate_notice(result: Dict[str, Any]):
+    """Note that the CV closely matches one submitted before."""
+    if result.get('duplicate_of'):
+        similarity = result.get('duplicate_similarity', 0.0)
+        st.info(f"🔁 This CV is a near-duplicate ({similarity:.0%} similar) of one submitted before.")
+
+
+def render_recommendations(recommendations: str):
+    """Render learning recommendations for rejected candidates."""
     if recommendations and recommendations.strip():
         st.subheader("📚 Learning Recommendations")
         st.info(recommendations)
         st.success("💡 Don't give up! Use these recommendations to improve and apply again!")
 
 
-def render_processing_spinner():
-    """Render processing spinner context manager."""
-    return st.spinner("Processing your application...")
-
-
 def render_error_message(error_message: str):
     """Render error message."""
     st.error(f"❌ Error processing application: {error_message}")
@@ -0,0 +1,73 @@
+"""
+Benchmark of near-duplicate CV detection.
+
+Usage:
+    python -m benchmarks.bench_near_duplicates --count 100000 --queries 500
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.services.near_duplicates import NearDuplicateIndex
+from benchmarks.corpus import generate_corpus
+
+
+def edit_cv(cv_text: str, rng: random.Random) -> str:
+    """Resubmission of a CV with a changed phone number and one extra line."""
+    return cv_text.replace("0100", f"{rng.randint(1000, 9999)}", 1) + "Available immediately.\n"
+
+
+def run_benchmarks(count: int = 10000, queries: int = 200, seed: int = 0) -> Dict[str, float]:
+    """Time signing, indexing, lookups, single inserts and reloading of an on-disk index of ``count`` CVs."""
+    rng = random.Random(seed)
+    cvs = generate_corpus(count, seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "near_duplicates.u32")
+        index = NearDuplicateIndex(path)
+        started = time.perf_counter()
+        signatures = np.stack([index.signature(cv) for cv in cvs])
+        signed = time.perf_counter()
+        index.add([str(i) for i in range(count)], signatures)
+        added = time.perf_counter()
+        
+        picks = rng.sample(range(count), min(queries, count))
+        edited = [index.signature(edit_cv(cvs[i], rng)) for i in picks]
+        queried = time.perf_counter()
+        matches = [index.query(signature) for signature in edited]
+        finished = time.perf_counter()
+        # The agent indexes each evaluated CV on its own
+        for i, signature in enumerate(edited):
+            index.add([f"edited-{i}"], signature[None])
+        inserted = time.perf_counter()
+        NearDuplicateIndex(path)
+        loaded = time.perf_counter()
+    found = sum(str(i) in dict(match) for i, match in zip(picks, matches))
+    return {
+        "count": count,
+        "sign_ms_per_cv": round((signed - started) * 1000 / count, 4),
+        "add_ms": round((added - signed) * 1000, 2),
+        "query_ms": round((finished - queried) * 1000 / len(picks), 4),
+        "insert_ms": round((inserted - finished) * 1000 / len(picks), 4),
+        "load_ms": round((loaded - inserted) * 1000, 2),
+        "recall": round(found / len(picks), 4),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=10000, help="Indexed CVs")
+    parser.add_argument("--queries", type=int, default=200, help="Edited copies looked up")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmarks(args.count, args.queries, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Micro-benchmark of per-call prompt construction overhead.
+
+Compares building a template and chain on every call (parse the template,
+render it for the cache key, compose ``prompt | llm``) with formatting the
+templates that ``RecruitmentNodes`` builds once at construction.
+
+Usage:
+    python -m benchmarks.bench_prompts --iterations 2000
+"""
+
+import argparse
+import json
+import timeit
+from typing import Dict, List, Optional
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.agents.fake_llm import DeterministicChatModel
+from app.agents.nodes import RecruitmentNodes
+from app.services.job_service import JobService
+
+from .corpus import generate_corpus
+
+
+# Template text and layout used before templates were built once
+PER_CALL_TEMPLATE = """
+            Categorize experience level based on CV and job posting.
+            Reply ONLY with: 'Entry-Level', 'Mid-Level', or 'Senior-Level'
+            
+            CV: {cv_text}
+            Job: {job_posting}
+            """
+
+
+def _per_call_us(func, iterations: int) -> float:
+    """Best-of-three mean duration of ``func`` in microseconds."""
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def run_benchmarks(iterations: int = 2000) -> Dict[str, float]:
+    """
+    Time prompt preparation with and without prebuilt templates.
+    
+    Returns:
+        Microseconds per call for each scenario, plus the saving per call
+    """
+    llm = DeterministicChatModel()
+    nodes = RecruitmentNodes(llm, cache=None)
+    inputs = {
+        "cv_text": generate_corpus(1)[0][:1500],
+        "job_posting": JobService.get_sample_jobs()["Python Developer"].prompt_text(),
+    }
+    prompt = nodes.prompts["categorize_experience"]
+    
+    def per_call_prompt():
+        template = ChatPromptTemplate.from_template(PER_CALL_TEMPLATE)
+        template.pretty_repr()
+        template | llm
+        return template.invoke(inputs)
+    
+    def prebuilt_prompt():
+        return prompt.invoke(inputs)
+    
+    def per_call_chain():
+        return (ChatPromptTemplate.from_template(PER_CALL_TEMPLATE) | llm).invoke(inputs)
+    
+    def prebuilt_chain():
+        return llm.invoke(prompt.invoke(inputs))
+    
+    results = {
+        "per_call_prompt_us": _per_call_us(per_call_prompt, iterations),
+        "prebuilt_prompt_us": _per_call_us(prebuilt_prompt, iterations),
+        "per_call_llm_us": _per_call_us(per_call_chain, max(1, iterations // 10)),
+        "prebuilt_llm_us": _per_call_us(prebuilt_chain, max(1, iterations // 10)),
+    }
+    results["saved_per_call_us"] = results["per_call_prompt_us"] - results["prebuilt_prompt_us"]
+    return {name: round(value, 2) for name, value in results.items()}
+
+
+def shared_prefix_chars(job_text: str, cv_texts: List[str], name: str = "categorize_experience") -> int:
+    """Characters of prompt prefix shared by every CV screened for one job."""
+    nodes = RecruitmentNodes(DeterministicChatModel(), cache=None)
+    rendered = [
+        nodes.prompts[name].invoke({"cv_text": cv, "job_posting": job_text}).to_string()
+        for cv in cv_texts
+    ]
+    prefix = rendered[0]
+    for text in rendered[1:]:
+        while not text.startswith(prefix):
+            prefix = prefix[:-1]
+    return len(prefix)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per timing run")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmarks(args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
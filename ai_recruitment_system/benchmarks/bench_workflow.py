@@ -0,0 +1,137 @@
+"""
+End-to-end workflow benchmark against the deterministic offline chat model.
+
+Measures throughput and latency percentiles of single (sequential), batched
+(``process_batch``) and concurrent (thread pool) evaluation on a synthetic
+CV corpus, without network access or an API key.
+
+Usage:
+    python -m benchmarks.bench_workflow --count 200 --latency 0.05 --jitter 0.02
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional
+
+from app.agents.fake_llm import DeterministicChatModel
+from app.core.metrics import percentile
+from app.services.job_service import JobService
+from app.services.near_duplicates import NearDuplicateIndex
+from app.services.recruitment_agent import RecruitmentAgent
+from app.services.result_store import ResultStore
+
+from .corpus import generate_corpus
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and latency summary of one benchmark scenario."""
+    
+    scenario: str
+    count: int
+    wall_s: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    
+    def __str__(self) -> str:
+        return (
+            f"{self.scenario:<12} n={self.count:<5} wall={self.wall_s:7.2f}s "
+            f"throughput={self.throughput:8.1f}/s p50={self.p50_ms:8.1f}ms "
+            f"p95={self.p95_ms:8.1f}ms p99={self.p99_ms:8.1f}ms"
+        )
+
+
+def _summarize(scenario: str, latencies_ms: List[float], wall_s: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        scenario=scenario,
+        count=len(latencies_ms),
+        wall_s=wall_s,
+        throughput=len(latencies_ms) / wall_s if wall_s else 0.0,
+        p50_ms=percentile(latencies_ms, 50),
+        p95_ms=percentile(latencies_ms, 95),
+        p99_ms=percentile(latencies_ms, 99)
+    )
+
+
+def _timed(call: Callable[[], object]) -> float:
+    """Run call and return its duration in milliseconds."""
+    started = time.perf_counter()
+    call()
+    return (time.perf_counter() - started) * 1000
+
+
+def bench_single(agent: RecruitmentAgent, corpus: List[str], job_text: str) -> BenchmarkResult:
+    """Evaluate applications one after another."""
+    started = time.perf_counter()
+    latencies = [_timed(lambda cv=cv: agent.process_application(cv, job_text)) for cv in corpus]
+    return _summarize("single", latencies, time.perf_counter() - started)
+
+
+def bench_batch(agent: RecruitmentAgent, corpus: List[str], job_text: str, concurrency: int) -> BenchmarkResult:
+    """Evaluate applications through the async batch engine."""
+    started = time.perf_counter()
+    results = list(agent.process_batch(((cv, job_text) for cv in corpus), max_concurrency=concurrency))
+    return _summarize(f"batch[{concurrency}]", [r.elapsed_ms for r in results], time.perf_counter() - started)
+
+
+def bench_concurrent(agent: RecruitmentAgent, corpus: List[str], job_text: str, threads: int) -> BenchmarkResult:
+    """Evaluate applications from a pool of threads, as concurrent UI sessions would."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(
+            lambda cv: _timed(lambda: agent.process_application(cv, job_text)), corpus
+        ))
+    return _summarize(f"threads[{threads}]", latencies, time.perf_counter() - started)
+
+
+def run_benchmarks(
+    count: int = 50,
+    latency: float = 0.02,
+    jitter: float = 0.0,
+    concurrency: int = 8,
+    evaluation_mode: Optional[str] = None,
+    seed: int = 0
+) -> List[BenchmarkResult]:
+    """Run every scenario on a fresh synthetic corpus and return the summaries."""
+    llm = DeterministicChatModel(latency=latency, jitter=jitter, seed=seed)
+    
+    def make_agent() -> RecruitmentAgent:
+        # Empty in-memory stores, so scenarios measure the workflow itself and
+        # never read or write the configured result store and duplicate index
+        return RecruitmentAgent(llm, evaluation_mode, results=ResultStore(), duplicates=NearDuplicateIndex())
+    
+    corpus = generate_corpus(count, seed)
+    job_text = JobService.get_sample_jobs()["Python Developer"].to_text()
+    return [
+        bench_single(make_agent(), corpus, job_text),
+        bench_batch(make_agent(), corpus, job_text, concurrency),
+        bench_concurrent(make_agent(), corpus, job_text, concurrency),
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=50, help="Synthetic CVs per scenario")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated seconds per LLM call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latency jitter in seconds")
+    parser.add_argument("--concurrency", type=int, default=8, help="Batch/thread concurrency")
+    parser.add_argument("--mode", choices=["parallel", "fused"], default=None, help="Evaluation mode")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(args.count, args.latency, args.jitter, args.concurrency, args.mode, args.seed)
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        for result in results:
+            print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Synthetic CV corpus generator for benchmarks.
+"""
+
+import random
+from typing import List
+
+
+FIRST_NAMES = ["Jane", "John", "Amira", "Luca", "Mei", "Carlos", "Priya", "Tom", "Sara", "Omar"]
+LAST_NAMES = ["Doe", "Smith", "Haddad", "Rossi", "Chen", "Garcia", "Patel", "Brown", "Berg", "Khalil"]
+SKILLS = [
+    "Python", "Django", "FastAPI", "Flask", "PostgreSQL", "MongoDB", "Docker", "Kubernetes",
+    "TensorFlow", "PyTorch", "JavaScript", "React", "AWS", "GCP", "MLOps", "REST APIs"
+]
+ROLES = ["Software Engineer", "Backend Developer", "Data Scientist", "ML Engineer", "Web Developer"]
+COMPANIES = ["TechCorp", "WebSolutions", "StartupTech", "DataWorks", "CloudNine"]
+
+
+def generate_cv(rng: random.Random) -> str:
+    """Generate one synthetic CV as plain text."""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    years = rng.randint(0, 15)
+    skills = rng.sample(SKILLS, rng.randint(3, 8))
+    jobs = []
+    for _ in range(rng.randint(1, 4)):
+        span = rng.randint(1, 5)
+        jobs.append(
+            f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)} ({span} years)\n"
+            f"- Built services with {', '.join(rng.sample(skills, min(2, len(skills))))}\n"
+            f"- Improved performance and reliability of production systems"
+        )
+    return (
+        f"{name}\n{name.split()[0].lower()}@example.com | +1 555 0100\n\n"
+        f"SUMMARY\n{rng.choice(ROLES)} with {years} years of experience.\n\n"
+        f"EXPERIENCE\n" + "\n\n".join(jobs) + "\n\n"
+        f"SKILLS\n{', '.join(skills)}\n\n"
+        f"EDUCATION\nBSc Computer Science, State University\n"
+    )
+
+
+def generate_corpus(count: int, seed: int = 0) -> List[str]:
+    """Generate ``count`` reproducible synthetic CVs."""
+    rng = random.Random(seed)
+    return [generate_cv(rng) for _ in range(count)]
@@ -0,0 +1,14 @@
+"""
+Headless batch screening entry point for the AI Recruitment System.
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
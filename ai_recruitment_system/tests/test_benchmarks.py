@@ -0,0 +1,59 @@
+"""
+Performance regression checks built on the offline benchmark suite.
+"""
+
+import pytest
+from app.services.job_service import JobService
+from benchmarks.bench_prompts import run_benchmarks as run_prompt_benchmarks, shared_prefix_chars
+from benchmarks.bench_workflow import run_benchmarks
+from benchmarks.corpus import generate_corpus
+
+
+LATENCY = 0.05
+
+
+@pytest.fixture(scope="module")
+def results():
+    """Run every scenario once on a small corpus."""
+    return {r.scenario.split("[")[0]: r for r in run_benchmarks(count=8, latency=LATENCY, concurrency=8)}
+
+
+class TestBenchmarks:
+    """Coarse latency and throughput guards with a simulated LLM latency."""
+    
+    @pytest.mark.benchmark
+    def test_single_application_critical_path(self, results):
+        """Test that parallel nodes keep one application near three LLM round-trips."""
+        # Sequential nodes would need four or five round-trips per application
+        assert results["single"].p50_ms < 3.8 * LATENCY * 1000
+    
+    @pytest.mark.benchmark
+    def test_batch_throughput_scales(self, results):
+        """Test that the batch engine overlaps applications."""
+        assert results["batch"].throughput > 3 * results["single"].throughput
+    
+    @pytest.mark.benchmark
+    def test_concurrent_throughput_scales(self, results):
+        """Test that concurrent sessions overlap applications."""
+        assert results["threads"].throughput > 3 * results["single"].throughput
+    
+    def test_corpus_is_reproducible(self):
+        """Test that the synthetic corpus depends only on the seed."""
+        assert generate_corpus(5, seed=3) == generate_corpus(5, seed=3)
+        assert generate_corpus(5, seed=3) != generate_corpus(5, seed=4)
+
+
+class TestPromptBenchmarks:
+    """Guards for prompt construction overhead and prefix layout."""
+    
+    @pytest.mark.benchmark
+    def test_prebuilt_templates_are_cheaper(self):
+        """Test that formatting prebuilt templates beats building them per call."""
+        results = run_prompt_benchmarks(iterations=200)
+        assert results["prebuilt_prompt_us"] < results["per_call_prompt_us"]
+    
+    def test_job_posting_is_in_the_shared_prefix(self):
+        """Test that prompts for one job differ only after the job posting."""
+        job_text = JobService.get_sample_jobs()["Python Developer"].prompt_text()
+        for name in ("categorize_experience", "assess_skills", "evaluate_candidate"):
+            assert shared_prefix_chars(job_text, generate_corpus(5), name) > len(job_text)
@@ -0,0 +1,122 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import time
+
+import pytest
+from app.agents.workflow import RecruitmentWorkflow
+from app.core.cache import InMemoryCache, SQLiteCache, make_cache_key
+
+
+CV_TEXT = "Jane Doe\nPython developer with 6 years of Django and PostgreSQL."
+JOB_TEXT = "Title: Python Backend Developer\nRequirements: Python Django"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_backend(request, tmp_path):
+    """Factory fixture building each cache backend with the given limits."""
+    def factory(**kwargs):
+        if request.param == "memory":
+            return InMemoryCache(**kwargs)
+        return SQLiteCache(str(tmp_path / "cache.sqlite3"), **kwargs)
+    return factory
+
+
+class TestCacheBackends:
+    """Test cases shared by every cache backend."""
+    
+    def test_hit_and_miss_counters(self, make_backend):
+        """Test that lookups update the hit and miss counters."""
+        cache = make_backend()
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+        
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+    
+    def test_lru_eviction(self, make_backend):
+        """Test that the least recently used entry is evicted at max size."""
+        cache = make_backend(max_size=2)
+        cache.set("a", "1")
+        time.sleep(0.01)
+        cache.set("b", "2")
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", "3")
+        
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.stats.evictions == 1
+    
+    def test_ttl_expiry(self, make_backend):
+        """Test that entries expire after the TTL."""
+        cache = make_backend(ttl=0.05)
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+        time.sleep(0.1)
+        assert cache.get("k") is None
+    
+    def test_sqlite_evicts_in_batches_without_counting_each_insert(self, tmp_path):
+        """Test that inserts below capacity run no COUNT and a full cache drops a tenth of its entries."""
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_size=20)
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+        for i in range(20):
+            cache.set(str(i), "v")
+        assert not any("COUNT" in statement for statement in statements)
+        
+        cache.set("20", "v")
+        assert cache.stats.evictions == 3
+        assert len(cache) == 18
+        assert cache.get("0") is None and cache.get("20") == "v"
+        assert len(SQLiteCache(cache.path, max_size=20)) == 18
+    
+    def test_cache_key_depends_on_every_part(self):
+        """Test that model, template and inputs all change the key."""
+        key = make_cache_key("m", "t {x}", {"x": "1"})
+        assert key == make_cache_key("m", "t {x}", {"x": "1"})
+        assert key != make_cache_key("m2", "t {x}", {"x": "1"})
+        assert key != make_cache_key("m", "u {x}", {"x": "1"})
+        assert key != make_cache_key("m", "t {x}", {"x": "2"})
+
+
+class TestNodeCaching:
+    """Test cases for caching in front of the workflow nodes."""
+    
+    def test_repeat_evaluation_makes_no_llm_calls(self, scripted_llm):
+        """Test that re-evaluating the same application is served from cache."""
+        llm = scripted_llm(score="3")
+        cache = InMemoryCache()
+        workflow = RecruitmentWorkflow(llm, cache=cache)
+        
+        first = workflow.process_application(CV_TEXT, JOB_TEXT)
+        calls = len(llm.prompts)
+        second = workflow.process_application(CV_TEXT, JOB_TEXT)
+        
+        assert len(llm.prompts) == calls
+        assert second.pop("metrics")["application"]["cache_hits"] == calls
+        first.pop("metrics")
+        assert second == first
+        assert cache.stats.hits == calls
+    
+    def test_name_extraction_shared_across_jobs(self, scripted_llm):
+        """Test that job-independent prompts are reused for another posting."""
+        llm = scripted_llm()
+        workflow = RecruitmentWorkflow(llm, cache=InMemoryCache())
+        workflow.process_application(CV_TEXT, JOB_TEXT)
+        workflow.process_application(CV_TEXT, "Title: Data Engineer")
+        
+        name_calls = [p for p in llm.prompts if "candidate's name" in p]
+        assert len(name_calls) == 1
+    
+    def test_unparseable_fused_output_is_not_cached(self, scripted_llm):
+        """Test that responses failing schema validation are not replayed."""
+        cache = InMemoryCache()
+        workflow = RecruitmentWorkflow(scripted_llm(score="42"), evaluation_mode="fused", cache=cache)
+        workflow.process_application(CV_TEXT, JOB_TEXT)
+        
+        assert len(cache) == 1  # only the learning recommendations
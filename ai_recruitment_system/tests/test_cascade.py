@@ -0,0 +1,115 @@
+"""
+Tests for the cheap-first model cascade.
+"""
+
+import pytest
+from app.agents.routing import needs_review
+from app.agents.workflow import RecruitmentWorkflow
+from app.core.metrics import MetricsAggregator
+
+
+CV_TEXT = "Jane Doe\nPython developer with 6 years of Django and PostgreSQL."
+JOB_TEXT = "Title: Python Backend Developer\nRequirements: Python Django"
+
+
+def review_calls(llm) -> int:
+    """Number of structured evaluations the model was asked for."""
+    return sum("Evaluate this candidate" in prompt for prompt in llm.prompts)
+
+
+class TestNeedsReview:
+    """Test cases for detecting borderline first passes."""
+    
+    @pytest.mark.parametrize("score,experience,expected", [
+        ("8", "Mid-Level", False),
+        ("7", "Mid-Level", True),
+        ("6", "Mid-Level", True),
+        ("5", "Mid-Level", False),
+        ("5", "Senior-Level", True),
+        ("3", "Senior-Level", False),
+        ("n/a", "Mid-Level", True),
+    ])
+    def test_scores_near_thresholds(self, score, experience, expected):
+        """Test that scores within the margin of an applicable threshold are borderline."""
+        state = {"technical_score": score, "experience_level": experience, "metrics": {}}
+        assert needs_review(state, margin=1.0) is expected
+    
+    def test_fallback_triggers_review(self):
+        """Test that a node serving its default answer escalates."""
+        state = {
+            "technical_score": "9",
+            "experience_level": "Mid-Level",
+            "metrics": {"assess_skills": {"fallback": True}}
+        }
+        assert needs_review(state, margin=1.0)
+
+
+class TestCascadeWorkflow:
+    """Test cases for escalating to the stronger model."""
+    
+    def test_clear_result_skips_strong_model(self, scripted_llm):
+        """Test that a confident first pass is not re-evaluated."""
+        strong = scripted_llm(score="9")
+        workflow = RecruitmentWorkflow(scripted_llm(score="9"), cache=None, cascade_llm=strong)
+        result = workflow.process_application(CV_TEXT, JOB_TEXT)
+        assert not strong.prompts
+        assert "review_evaluation" not in result["metrics"]
+        assert "Congratulations" in result["response"]
+    
+    def test_borderline_result_is_escalated(self, scripted_llm):
+        """Test that the stronger model's evaluation replaces a borderline one."""
+        aggregator = MetricsAggregator()
+        strong = scripted_llm(score="9")
+        workflow = RecruitmentWorkflow(
+            scripted_llm(score="7"), cache=None, metrics=aggregator, cascade_llm=strong
+        )
+        result = workflow.process_application(CV_TEXT, JOB_TEXT)
+        
+        assert review_calls(strong) == 1
+        assert result["technical_score"] == "9"
+        assert result["metrics"]["review_evaluation"]["llm_calls"] == 1
+        assert aggregator.snapshot()["rates"]["cascade_escalation_rate"] == 1.0
+    
+    def test_parse_failure_is_escalated(self, scripted_llm):
+        """Test that a successful review clears the first pass's fallback."""
+        strong = scripted_llm(score="3")
+        workflow = RecruitmentWorkflow(
+            scripted_llm(score="excellent"), evaluation_mode="fused", cache=None, cascade_llm=strong
+        )
+        result = workflow.process_application(CV_TEXT, JOB_TEXT)
+        
+        assert result["metrics"]["evaluate_candidate"]["fallback"] is True
+        assert result["metrics"]["application"]["fallback"] is False
+        assert result["technical_score"] == "3"
+    
+    def test_failed_review_keeps_first_pass(self, scripted_llm):
+        """Test that an unusable strong answer leaves the first pass in place."""
+        workflow = RecruitmentWorkflow(
+            scripted_llm(score="7"), cache=None, cascade_llm=scripted_llm(score="excellent")
+        )
+        result = workflow.process_application(CV_TEXT, JOB_TEXT)
+        assert result["technical_score"] == "7"
+        assert result["metrics"]["application"]["fallback"] is True
+    
+    def test_escalation_rate(self, scripted_llm):
+        """Test that the rate counts escalations among evaluated applications."""
+        aggregator = MetricsAggregator()
+        workflow = RecruitmentWorkflow(
+            scripted_llm(score="9"), cache=None, metrics=aggregator, cascade_llm=scripted_llm()
+        )
+        for i in range(4):
+            workflow.process_application(f"{CV_TEXT}\nProject {i}", JOB_TEXT)
+        borderline = RecruitmentWorkflow(
+            scripted_llm(score="7"), cache=None, metrics=aggregator, cascade_llm=scripted_llm()
+        )
+        borderline.process_application(CV_TEXT, JOB_TEXT)
+        
+        assert aggregator.counters["cascade_evaluations"] == 5
+        assert aggregator.snapshot()["rates"]["cascade_escalation_rate"] == 0.2
+    
+    def test_cascade_changes_prompt_version(self, scripted_llm):
+        """Test that cascaded results are not confused with single-model ones."""
+        plain = RecruitmentWorkflow(scripted_llm(), cache=None)
+        cascaded = RecruitmentWorkflow(scripted_llm(), cache=None, cascade_llm=scripted_llm())
+        assert plain.prompt_version != cascaded.prompt_version
+        assert "review_evaluation" not in plain.app.get_graph().nodes
@@ -0,0 +1,109 @@
+"""
+Tests for durable workflow checkpointing and the batch manifest.
+"""
+
+import asyncio
+
+import pytest
+from app.agents.checkpoint import SQLiteCheckpointSaver
+from app.agents.workflow import RecruitmentWorkflow
+from app.services.batch_manifest import BatchManifest
+from app.services.job_service import JobService
+from app.services.recruitment_agent import RecruitmentAgent
+from app.services.result_store import ResultStore
+
+
+JOB = JobService.get_sample_jobs()["Python Developer"]
+CV_TEXT = "Jane Doe\nPython developer with 5 years of Django, REST APIs, PostgreSQL and Git."
+
+
+class WorkerCrash(BaseException):
+    """Simulated process death, not caught by the nodes' fallbacks."""
+
+
+def crash_on(llm, phrase):
+    """Make the model die on prompts containing ``phrase`` until disarmed."""
+    armed = {"on": True}
+    original = llm.invoke
+    
+    def invoke(prompt, *args, **kwargs):
+        if armed["on"] and phrase in prompt.to_string():
+            raise WorkerCrash()
+        return original(prompt, *args, **kwargs)
+    
+    object.__setattr__(llm, "invoke", invoke)
+    return armed
+
+
+class TestCheckpointResume:
+    """Test cases for resuming interrupted applications."""
+    
+    def test_resume_skips_completed_nodes(self, scripted_llm, tmp_path):
+        """Test that a restarted worker only re-runs the node that was interrupted."""
+        path = str(tmp_path / "checkpoints.sqlite3")
+        llm = scripted_llm()
+        armed = crash_on(llm, "Rate technical competency")
+        with pytest.raises(WorkerCrash):
+            RecruitmentWorkflow(llm, cache=None, checkpointer=SQLiteCheckpointSaver(path)).process_application(
+                CV_TEXT, JOB
+            )
+        assert len(llm.prompts) == 3
+        
+        armed["on"] = False
+        restarted = RecruitmentWorkflow(llm, cache=None, checkpointer=SQLiteCheckpointSaver(path))
+        result = restarted.process_application(CV_TEXT, JOB)
+        
+        assert len(llm.prompts) == 4 and "Rate technical competency" in llm.prompts[-1]
+        assert result["candidate_name"] == "Jane Doe"
+        assert "Congratulations Jane Doe" in result["response"]
+        assert set(result["metrics"]) >= {"extract_info", "technical_evaluation", "application"}
+    
+    def test_finished_threads_are_removed(self, scripted_llm, tmp_path):
+        """Test that completed applications leave no checkpoints behind."""
+        path = str(tmp_path / "checkpoints.sqlite3")
+        workflow = RecruitmentWorkflow(scripted_llm(), cache=None, checkpointer=SQLiteCheckpointSaver(path))
+        workflow.process_application(CV_TEXT, JOB)
+        assert list(workflow.checkpointer.list(None)) == []
+        assert list(SQLiteCheckpointSaver(path).list(None)) == []
+    
+    def test_async_runs_are_checkpointed(self, scripted_llm, tmp_path):
+        """Test that applications run on an event loop checkpoint and clean up too."""
+        path = str(tmp_path / "checkpoints.sqlite3")
+        workflow = RecruitmentWorkflow(scripted_llm(), cache=None, checkpointer=SQLiteCheckpointSaver(path))
+        result = asyncio.run(workflow.aprocess_application(CV_TEXT, JOB))
+        assert "Congratulations Jane Doe" in result["response"]
+        assert list(workflow.checkpointer.list(None)) == []
+    
+    def test_thread_id_is_stable(self, scripted_llm):
+        """Test that the same application maps to the same thread across workflows."""
+        first = RecruitmentWorkflow(scripted_llm(), cache=None, checkpointer=SQLiteCheckpointSaver(":memory:"))
+        second = RecruitmentWorkflow(scripted_llm(), cache=None, checkpointer=SQLiteCheckpointSaver(":memory:"))
+        assert first.thread_id(CV_TEXT, JOB) == second.thread_id(CV_TEXT, JOB)
+        assert first.thread_id(CV_TEXT, JOB) != first.thread_id(CV_TEXT + "\nGo", JOB)
+
+
+class TestBatchManifest:
+    """Test cases for batch progress tracking."""
+    
+    def test_mark_and_summarize(self):
+        """Test status bookkeeping per batch."""
+        manifest = BatchManifest()
+        manifest.mark("run-1", "a", 0, "done", elapsed_ms=5.0)
+        manifest.mark("run-1", "b", 1, "running")
+        manifest.mark("run-1", "c", 2, "failed", error="timeout")
+        manifest.mark("run-2", "a", 0, "running")
+        
+        assert manifest.summary("run-1") == {"running": 1, "done": 1, "failed": 1}
+        assert manifest.unfinished("run-1") == [1, 2]
+        assert manifest.status("run-2") == {"a": "running"}
+        with pytest.raises(ValueError):
+            manifest.mark("run-1", "a", 0, "lost")
+    
+    def test_batch_records_progress(self, scripted_llm):
+        """Test that a named batch marks every application done."""
+        manifest = BatchManifest()
+        agent = RecruitmentAgent(scripted_llm(), results=ResultStore(), manifest=manifest)
+        applications = [(f"{CV_TEXT}\nProject {i}", JOB) for i in range(3)]
+        assert all(item.ok for item in agent.process_batch(applications, batch_id="nightly"))
+        assert manifest.summary("nightly")["done"] == 3
+        assert manifest.unfinished("nightly") == []
@@ -0,0 +1,86 @@
+"""
+Tests for the headless batch command-line interface.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from app.cli import main, resolve_inputs
+from app.services.recruitment_agent import RecruitmentAgent
+
+
+@pytest.fixture
+def cv_dir(tmp_path):
+    """Directory with two text CVs, one broken PDF and an unsupported file."""
+    (tmp_path / "jane.txt").write_text("Jane Doe\nPython developer")
+    (tmp_path / "john.txt").write_text("John Roe\nDjango developer")
+    (tmp_path / "broken.pdf").write_bytes(b"not a pdf")
+    (tmp_path / "notes.md").write_text("ignored")
+    return tmp_path
+
+
+class TestCLI:
+    """Test cases for the batch CLI."""
+    
+    def test_resolve_inputs_filters_supported_types(self, cv_dir):
+        """Test that directories and globs expand to supported CV files only."""
+        assert [p.rsplit("/", 1)[1] for p in resolve_inputs([str(cv_dir)])] == ["broken.pdf", "jane.txt", "john.txt"]
+        assert len(resolve_inputs([str(cv_dir / "*.txt")])) == 2
+    
+    def test_writes_jsonl_with_timings(self, cv_dir, tmp_path, scripted_llm):
+        """Test that every CV produces one record with per-stage timings."""
+        output = tmp_path / "results.jsonl"
+        code = main(
+            [str(cv_dir), "--job", "Python Developer", "-o", str(output), "--parse-workers", "2"],
+            agent=RecruitmentAgent(scripted_llm())
+        )
+        records = {r["file"].rsplit("/", 1)[1]: r for r in map(json.loads, output.read_text().splitlines())}
+        
+        assert code == 1
+        assert records["broken.pdf"]["status"] == "error"
+        assert "parse_ms" in records["broken.pdf"]["timings"]
+        jane = records["jane.txt"]
+        assert jane["status"] == "ok"
+        assert "Congratulations" in jane["response"]
+        assert "cv_text" not in jane
+        assert set(jane["timings"]) == {"parse_ms", "evaluate_ms"}
+    
+    def test_job_file(self, cv_dir, tmp_path, scripted_llm):
+        """Test that a JSON job posting can replace a sample job key."""
+        job_file = tmp_path / "job.json"
+        job_file.write_text(json.dumps({
+            "title": "Data Engineer", "company": "Acme", "description": "Pipelines",
+            "requirements": ["Spark"], "experience_level": "Mid-Level",
+            "skills_required": ["Spark"], "location": "Remote",
+            "salary_range": "n/a", "job_type": "Full-time"
+        }))
+        output = tmp_path / "results.jsonl"
+        code = main(
+            [str(cv_dir / "*.txt"), "--job-file", str(job_file), "-o", str(output)],
+            agent=RecruitmentAgent(scripted_llm())
+        )
+        
+        assert code == 0
+        assert all(json.loads(line)["job"] == "Data Engineer at Acme" for line in output.read_text().splitlines())
+    
+    def test_shortlist(self, cv_dir, tmp_path, scripted_llm, capsys):
+        """Test that --shortlist prints the ranked best candidates."""
+        code = main(
+            [str(cv_dir / "*.txt"), "--job", "Python Developer", "-o", str(tmp_path / "out.jsonl"),
+             "--shortlist", "1"],
+            agent=RecruitmentAgent(scripted_llm())
+        )
+        lines = capsys.readouterr().err.splitlines()
+        
+        assert code == 0
+        assert lines[0] == "Top 1 candidates for Python Backend Developer at StartupTech:"
+        assert lines[1].startswith("  1. ")
+        assert len([line for line in lines if line.strip().startswith(("1.", "2."))]) == 1
+    
+    def test_does_not_import_streamlit(self):
+        """Test that the CLI module loads without Streamlit."""
+        probe = "import sys, app.cli; print('streamlit' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,118 @@
+"""
+Tests for the CV parsing service.
+"""
+
+from io import BytesIO
+
+import docx
+import pytest
+from app.core.exceptions import CVParseError
+from app.core.config import Config
+from app.services.cv_parser import CVParser
+
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def page_texts(count: int):
+    """Build distinct page texts of 40 characters each."""
+    return [f"Page {i:02d} experience and skills summary".ljust(40, ".") for i in range(count)]
+
+
+class TestPDFExtraction:
+    """Test cases for budgeted PDF extraction."""
+    
+    def test_extracts_all_pages_in_order(self, make_pdf):
+        """Test that a small PDF is extracted completely and in order."""
+        pages = page_texts(3)
+        text = CVParser.extract_text_from_file(make_pdf(pages), PDF_TYPE)
+        assert text.split("\n") == pages
+    
+    def test_stops_at_page_budget(self, make_pdf):
+        """Test that pages beyond the page budget are not read."""
+        text = CVParser._extract_from_pdf(make_pdf(page_texts(6)), max_pages=2)
+        assert "Page 01" in text
+        assert "Page 02" not in text
+    
+    def test_stops_at_character_budget(self, make_pdf):
+        """Test that extraction stops once the character budget is met."""
+        text = CVParser._extract_from_pdf(make_pdf(page_texts(6)), max_chars=100)
+        assert len(text) == 100
+        assert "Page 03" not in text
+    
+    def test_parallel_extraction_matches_serial(self, make_pdf, monkeypatch):
+        """Test that the process pool path returns the same text as the serial one."""
+        content = make_pdf(page_texts(10))
+        serial = CVParser._extract_from_pdf(content)
+        
+        monkeypatch.setattr(Config, "PDF_PARALLEL_MIN_PAGES", 2)
+        monkeypatch.setattr(Config, "PDF_PAGES_PER_TASK", 3)
+        assert CVParser._extract_from_pdf(content) == serial
+        assert CVParser._extract_from_pdf(content, max_chars=130) == serial[:130]
+
+
+class TestOtherFormats:
+    """Test cases for DOCX and plain text extraction."""
+    
+    def test_docx_paragraphs_are_joined(self):
+        """Test DOCX paragraph extraction."""
+        document = docx.Document()
+        document.add_paragraph("Jane Doe")
+        document.add_paragraph("Python developer")
+        buffer = BytesIO()
+        document.save(buffer)
+        
+        text = CVParser.extract_text_from_file(buffer.getvalue(), DOCX_TYPE)
+        assert text == "Jane Doe\nPython developer"
+    
+    def test_unsupported_type_raises(self):
+        """Test that unsupported MIME types raise CVParseError."""
+        with pytest.raises(CVParseError):
+            CVParser.extract_text_from_file(b"", "image/png")
+
+
+class TestStreamingExtraction:
+    """Test cases for chunked CV text extraction."""
+    
+    def test_pdf_yields_one_chunk_per_page(self, make_pdf):
+        """Test that PDF chunks follow page boundaries."""
+        pages = page_texts(3)
+        chunks = list(CVParser.iter_text_chunks(BytesIO(make_pdf(pages)), PDF_TYPE))
+        assert chunks == [page + "\n" for page in pages]
+    
+    def test_text_file_path_yields_paragraphs(self, tmp_path):
+        """Test that text files are read from a path paragraph by paragraph."""
+        path = tmp_path / "cv.txt"
+        path.write_text("Jane Doe\nEngineer\n\nSkills: Python\n")
+        
+        chunks = list(CVParser.iter_text_chunks(path))
+        assert chunks == ["Jane Doe\nEngineer\n\n", "Skills: Python\n"]
+    
+    def test_docx_type_guessed_from_stream_name(self, tmp_path):
+        """Test DOCX streaming with the type inferred from the file name."""
+        document = docx.Document()
+        document.add_paragraph("Jane Doe")
+        document.add_paragraph("Python developer")
+        path = tmp_path / "cv.docx"
+        document.save(path)
+        
+        with open(path, "rb") as stream:
+            chunks = list(CVParser.iter_text_chunks(stream))
+            assert not stream.closed
+        assert "".join(chunks) == "Jane Doe\nPython developer\n"
+    
+    def test_max_chars_cutoff(self, make_pdf):
+        """Test that iteration stops at max_chars and truncates the last chunk."""
+        content = BytesIO(make_pdf(page_texts(5)))
+        chunks = list(CVParser.iter_text_chunks(content, PDF_TYPE, max_chars=50))
+        
+        assert len(chunks) == 2
+        assert len("".join(chunks)) == 50
+    
+    def test_unknown_type_raises(self, tmp_path):
+        """Test that files without a supported extension are rejected."""
+        path = tmp_path / "cv.rtf"
+        path.write_text("{\\rtf1}")
+        with pytest.raises(CVParseError):
+            list(CVParser.iter_text_chunks(path))
@@ -0,0 +1,89 @@
+"""
+Tests for CV segmentation and token-budgeted node contexts.
+"""
+
+from app.agents.workflow import RecruitmentWorkflow
+from app.core.tokens import count_tokens, truncate_to_tokens
+from app.services.cv_sections import build_context, build_node_contexts, segment_cv
+from app.services.job_service import JobService
+
+
+JOB = JobService.get_sample_jobs()["Python Developer"]
+CV_TEXT = """Jane Doe
+jane@example.com
+
+Summary
+Backend engineer focused on web APIs.
+
+Experience
+Senior Developer at Acme (2018-2024)
+Built Django services and REST APIs.
+
+Skills: Python, Django, PostgreSQL, Docker
+
+Education
+BSc Computer Science
+"""
+
+
+def long_cv() -> str:
+    """CV whose experience section alone exceeds every budget, with skills last."""
+    jobs = "\n".join(
+        f"Developer at Company {i} (20{i:02d}): maintained billing, reporting and internal tooling systems."
+        for i in range(40)
+    )
+    return f"Jane Doe\n\nExperience\n{jobs}\n\nSkills\nPython, Django, Kubernetes, Terraform\n"
+
+
+class TestSegmentation:
+    """Test cases for splitting a CV into sections."""
+    
+    def test_sections_and_inline_headings(self):
+        """Test that standalone and 'Title: content' headings start sections."""
+        sections = segment_cv(CV_TEXT)
+        assert list(sections) == ["header", "summary", "experience", "skills", "education"]
+        assert sections["header"] == "Jane Doe\njane@example.com"
+        assert sections["skills"] == "Python, Django, PostgreSQL, Docker"
+        assert "Acme" in sections["experience"]
+    
+    def test_heading_words_inside_text_are_ignored(self):
+        """Test that section names used in sentences do not split the CV."""
+        sections = segment_cv("Jane Doe\nExperience\nI gained experience with skills in Python.")
+        assert list(sections) == ["header", "experience"]
+
+
+class TestNodeContexts:
+    """Test cases for the per-node CV contexts."""
+    
+    def test_contexts_hold_relevant_sections(self):
+        """Test that each node receives the sections it needs."""
+        contexts = build_node_contexts(CV_TEXT)
+        assert contexts["extract_info"].startswith("Jane Doe")
+        assert "SKILLS:" in contexts["assess_skills"] and "EDUCATION:" not in contexts["assess_skills"]
+        assert "EDUCATION:" in contexts["categorize_experience"]
+    
+    def test_budget_is_respected(self):
+        """Test that every context fits its token budget."""
+        contexts = build_node_contexts(long_cv(), max_tokens=120)
+        assert all(count_tokens(context) <= 120 for context in contexts.values())
+    
+    def test_long_cv_keeps_skills(self):
+        """Test that skills listed after a long history reach the skill assessment."""
+        cv_text = long_cv()
+        assert "Kubernetes" not in cv_text[:1500]
+        contexts = build_node_contexts(cv_text)
+        assert "Kubernetes" in contexts["assess_skills"]
+        assert "Kubernetes" in contexts["evaluate_candidate"]
+    
+    def test_unstructured_cv_falls_back_to_prefix(self):
+        """Test that a CV without headings is cut at the budget."""
+        cv_text = "Jane Doe, Python developer. " * 200
+        context = build_context(segment_cv(cv_text), ("skills", "experience"), 50, cv_text)
+        assert context == truncate_to_tokens(cv_text, 50)
+    
+    def test_workflow_state_carries_contexts(self, scripted_llm):
+        """Test that the workflow segments the CV once and prompts with the contexts."""
+        llm = scripted_llm()
+        result = RecruitmentWorkflow(llm, cache=None).process_application(long_cv(), JOB)
+        assert set(result["cv_context"]) >= {"extract_info", "assess_skills", "technical_evaluation"}
+        assert any("Assess skill match" in prompt and "Kubernetes" in prompt for prompt in llm.prompts)
@@ -0,0 +1,72 @@
+"""
+Tests for the parsed CV document store.
+"""
+
+from app.core.config import Config
+from app.services.cv_parser import CVParser
+from app.services.document_store import DocumentStore
+
+
+class TestDocumentStore:
+    """Test cases for DocumentStore."""
+    
+    def test_parse_records_document_statistics(self, make_pdf):
+        """Test that parsed documents carry text length and page count."""
+        document = DocumentStore().parse(make_pdf(["Jane Doe", "Python"]), "application/pdf")
+        
+        assert document.text == "Jane Doe\nPython"
+        assert document.char_count == len(document.text)
+        assert document.page_count == 2
+        assert document.content_hash == DocumentStore.content_hash(
+            make_pdf(["Jane Doe", "Python"]), "application/pdf"
+        )
+    
+    def test_repeat_upload_is_not_reparsed(self, monkeypatch):
+        """Test that identical bytes are parsed once and then served from memory."""
+        calls = []
+        original = CVParser.parse_document
+        
+        def counting(*args):
+            calls.append(args)
+            return original(*args)
+        
+        monkeypatch.setattr(CVParser, "parse_document", staticmethod(counting))
+        store = DocumentStore()
+        first = store.parse(b"Jane Doe", "text/plain")
+        second = store.parse(b"Jane Doe", "text/plain")
+        
+        assert first == second
+        assert len(calls) == 1
+        assert store.memory.stats.hits == 1
+    
+    def test_hash_includes_file_type(self):
+        """Test that the same bytes under another type are a different document."""
+        assert DocumentStore.content_hash(b"x", "text/plain") != DocumentStore.content_hash(b"x", "application/pdf")
+    
+    def test_disk_tier_survives_new_store(self, tmp_path):
+        """Test that a new process-level store finds documents on disk."""
+        path = str(tmp_path / "documents.sqlite3")
+        DocumentStore(disk_path=path).parse(b"Jane Doe", "text/plain")
+        
+        store = DocumentStore(disk_path=path)
+        document = store.get(DocumentStore.content_hash(b"Jane Doe", "text/plain"))
+        assert document.text == "Jane Doe"
+        assert store.disk.stats.hits == 1
+    
+    def test_budget_change_reparses(self, make_pdf, monkeypatch, tmp_path):
+        """Test that text extracted under an earlier page budget is not served after a change."""
+        path = str(tmp_path / "documents.sqlite3")
+        pdf = make_pdf(["Jane Doe", "Python"])
+        assert DocumentStore(disk_path=path).parse(pdf, "application/pdf").text == "Jane Doe\nPython"
+        
+        monkeypatch.setattr(Config, "PDF_MAX_PAGES", 1)
+        assert DocumentStore(disk_path=path).parse(pdf, "application/pdf").text == "Jane Doe"
+    
+    def test_memory_tier_evicts_by_size(self):
+        """Test that the memory tier keeps at most memory_size documents."""
+        store = DocumentStore(memory_size=2)
+        for name in (b"a", b"b", b"c"):
+            store.parse(name, "text/plain")
+        
+        assert len(store.memory) == 2
+        assert store.get(DocumentStore.content_hash(b"a", "text/plain")) is None
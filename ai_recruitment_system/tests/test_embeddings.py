@@ -0,0 +1,139 @@
+"""
+Tests for text encoders and the semantic vector index.
+"""
+
+import numpy as np
+import pytest
+from app.core.exceptions import ConfigurationError
+from app.services.embeddings import HashedTfidfEncoder, create_encoder
+from app.services.job_service import JobService
+from app.services.vector_index import SemanticMatcher, VectorIndex
+
+
+PYTHON_CV = "Jane Doe\nPython developer building Django REST APIs with PostgreSQL and Docker."
+ML_CV = "John Smith\nMachine learning engineer: PyTorch, TensorFlow, scikit-learn and Python."
+CHEF_CV = "Ana Lopez\nPastry chef specialising in sourdough bread and French desserts."
+
+
+class TestHashedTfidfEncoder:
+    """Test cases for the local hashed TF-IDF encoder."""
+    
+    def test_vectors_are_deterministic_unit_rows(self):
+        """Test that encoding is stable across instances and normalized."""
+        first = HashedTfidfEncoder(dim=256).encode([PYTHON_CV, ML_CV])
+        second = HashedTfidfEncoder(dim=256).encode([PYTHON_CV, ML_CV])
+        
+        assert first.shape == (2, 256) and first.dtype == np.float32
+        np.testing.assert_array_equal(first, second)
+        np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+    
+    def test_empty_text_is_zero_vector(self):
+        """Test that texts without terms do not produce NaNs."""
+        assert not HashedTfidfEncoder(dim=64).encode([""]).any()
+    
+    def test_related_texts_are_closer(self):
+        """Test that shared vocabulary yields higher cosine similarity."""
+        encoder = HashedTfidfEncoder(dim=1024).fit([PYTHON_CV, ML_CV, CHEF_CV])
+        query, python, chef = encoder.encode(["Django and PostgreSQL developer", PYTHON_CV, CHEF_CV])
+        assert query @ python > query @ chef
+    
+    def test_unknown_encoder(self):
+        """Test that unknown encoder names are rejected."""
+        with pytest.raises(ConfigurationError):
+            create_encoder("word2vec")
+
+
+class TestVectorIndex:
+    """Test cases for the memory-mapped vector index."""
+    
+    def test_search_orders_by_similarity(self):
+        """Test batched top-N search over stored vectors."""
+        index = VectorIndex(dim=3)
+        index.add(["x", "y", "z"], np.eye(3, dtype=np.float32))
+        results = index.search(np.array([[0.8, 0.6, 0.0], [0.0, 0.0, 1.0]]), top_n=2)
+        
+        assert [id_ for id_, _ in results[0]] == ["x", "y"]
+        assert results[0][0][1] == pytest.approx(0.8)
+        assert results[1][0] == ("z", pytest.approx(1.0))
+    
+    def test_readding_an_id_replaces_its_vector(self):
+        """Test that ids are unique rows."""
+        index = VectorIndex(dim=2)
+        index.add(["a"], np.array([[1.0, 0.0]]))
+        index.add(["a"], np.array([[0.0, 1.0]]))
+        assert len(index) == 1
+        np.testing.assert_array_equal(index.get("a"), [0.0, 1.0])
+    
+    def test_grows_and_persists(self, tmp_path):
+        """Test that the file-backed index grows past its capacity and reopens."""
+        path = str(tmp_path / "vectors.f32")
+        vectors = np.random.default_rng(0).random((10, 4), dtype=np.float32)
+        index = VectorIndex(dim=4, path=path, initial_capacity=3)
+        index.add([f"id{i}" for i in range(10)], vectors)
+        
+        reopened = VectorIndex(dim=4, path=path)
+        assert reopened.ids == [f"id{i}" for i in range(10)]
+        np.testing.assert_array_equal(reopened.get("id7"), vectors[7])
+        
+        with pytest.raises(ValueError):
+            VectorIndex(dim=8, path=path)
+    
+    def test_inserts_append_to_the_id_log(self, tmp_path):
+        """Test that single inserts and replacements persist without rewriting earlier ids."""
+        path = str(tmp_path / "vectors.f32")
+        index = VectorIndex(dim=2, path=path)
+        for i in range(3):
+            index.add([f"id{i}"], np.array([[i, 1.0]]))
+        index.add(["id1"], np.array([[9.0, 9.0]]))
+        with open(f"{path}.ids", encoding="utf-8") as f:
+            assert f.read() == '"id0"\n"id1"\n"id2"\n'
+        
+        # A partial line left by a crash mid-append is dropped on load
+        with open(f"{path}.ids", "a", encoding="utf-8") as f:
+            f.write('"id')
+        reopened = VectorIndex(dim=2, path=path)
+        assert reopened.ids == ["id0", "id1", "id2"]
+        np.testing.assert_array_equal(reopened.get("id1"), [9.0, 9.0])
+        reopened.add(["id3"], np.array([[3.0, 1.0]]))
+        assert VectorIndex(dim=2, path=path).ids == ["id0", "id1", "id2", "id3"]
+    
+    def test_empty_index(self):
+        """Test that searching an empty index returns no matches."""
+        assert VectorIndex(dim=4).search(np.ones(4), top_n=3) == [[]]
+
+
+class TestSemanticMatcher:
+    """Test cases for CV/job matching in both directions."""
+    
+    @pytest.fixture
+    def matcher(self):
+        """Matcher over the sample jobs and three CVs."""
+        matcher = SemanticMatcher(encoder=HashedTfidfEncoder(dim=1024))
+        matcher.add_jobs(JobService.get_sample_jobs())
+        matcher.add_cvs({"python": PYTHON_CV, "ml": ML_CV, "chef": CHEF_CV})
+        return matcher
+    
+    def test_top_candidates_for_job(self, matcher):
+        """Test that the closest CV to a job is returned first."""
+        assert matcher.top_candidates("Machine Learning Engineer", top_n=1)[0][0] == "ml"
+        assert matcher.top_candidates_for_jobs(["Django Developer"], top_n=1)["Django Developer"][0][0] == "python"
+    
+    def test_best_jobs_for_cv(self, matcher):
+        """Test matching a CV, by id or raw text, against every job."""
+        assert matcher.best_jobs("ml", top_n=1)[0][0] == "Machine Learning Engineer"
+        assert len(matcher.best_jobs("Django REST developer", top_n=2)) == 2
+    
+    def test_texts_are_embedded_once(self, matcher):
+        """Test that already indexed ids are not re-encoded."""
+        assert matcher.add_cvs({"python": PYTHON_CV, "new": CHEF_CV}) == 1
+        assert matcher.add_jobs(JobService.get_sample_jobs()) == 0
+    
+    def test_index_of_another_encoder_is_rejected(self, tmp_path):
+        """Test that an index is only reopened with the encoder that built it."""
+        directory = str(tmp_path / "vectors")
+        SemanticMatcher(encoder=HashedTfidfEncoder(dim=64), directory=directory).add_cvs({"python": PYTHON_CV})
+        assert SemanticMatcher(encoder=HashedTfidfEncoder(dim=64), directory=directory).cvs.ids == ["python"]
+        
+        fitted = HashedTfidfEncoder(dim=64).fit([PYTHON_CV, ML_CV, CHEF_CV])
+        with pytest.raises(ValueError):
+            SemanticMatcher(encoder=fitted, directory=directory)
@@ -0,0 +1,73 @@
+"""
+Import-time benchmark for the core pipeline modules.
+
+Each module is imported in a fresh interpreter so the measurement is a cold
+import. Which packages get loaded is always checked; the time budget only
+with --benchmarks, and can be tuned for slow machines with
+IMPORT_BUDGET_SECONDS.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "1.0"))
+
+# Modules that must stay importable without the UI or the LLM stack
+CORE_MODULES = [
+    "app.core.config",
+    "app.models.job_posting",
+    "app.agents.routing",
+    "app.services.cv_parser",
+    "app.services.job_service",
+    "app.services.document_store",
+    "app.services.recruitment_agent",
+    "app.cli",
+]
+
+HEAVY_PACKAGES = ["streamlit", "langgraph", "langchain_openai", "openai"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [p for p in {heavy!r} if p in sys.modules]}}))
+"""
+
+
+def cold_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and report time and heavy packages."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_PACKAGES)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("module", CORE_MODULES)
+class TestColdImport:
+    """Cold-import checks for core modules."""
+    
+    def test_does_not_load_heavy_packages(self, module):
+        """Test that importing the module does not pull in Streamlit or the LLM stack."""
+        assert cold_import(module)["loaded"] == []
+    
+    @pytest.mark.benchmark
+    def test_within_import_budget(self, module):
+        """Test that the cold import stays within the time budget."""
+        assert cold_import(module)["seconds"] < IMPORT_BUDGET_SECONDS
+
+
+class TestLazyClient:
+    """Test cases for lazy LLM client creation."""
+    
+    def test_workflow_builds_without_creating_client(self):
+        """Test that building the graph does not construct the chat model."""
+        from app.agents.workflow import RecruitmentWorkflow
+        workflow = RecruitmentWorkflow()
+        assert workflow.nodes._llm is None
@@ -0,0 +1,91 @@
+"""
+Tests for chat model provider selection and the deterministic offline model.
+"""
+
+import threading
+import time
+
+import pytest
+from app.agents.fake_llm import DeterministicChatModel
+from app.agents.llm_provider import create_chat_model, get_chat_model
+from app.agents.workflow import RecruitmentWorkflow
+from app.core.config import Config
+from app.core.exceptions import ConfigurationError
+
+
+CV_TEXT = "Jane Doe\nPython developer with 6 years of Django and PostgreSQL."
+JOB_TEXT = "Title: Python Backend Developer\nRequirements: Python Django"
+
+
+class TestProviderSelection:
+    """Test cases for create_chat_model."""
+    
+    def test_fake_provider_uses_config(self, monkeypatch):
+        """Test that the fake provider picks up latency settings from Config."""
+        monkeypatch.setattr(Config, "FAKE_LLM_LATENCY", 0.25)
+        llm = create_chat_model("fake")
+        assert isinstance(llm, DeterministicChatModel)
+        assert llm.latency == 0.25
+    
+    def test_workflow_uses_configured_provider(self, monkeypatch):
+        """Test that nodes build their model from Config.LLM_PROVIDER."""
+        monkeypatch.setattr(Config, "LLM_PROVIDER", "fake")
+        assert isinstance(RecruitmentWorkflow().nodes.llm, DeterministicChatModel)
+        assert Config.validate_config()
+    
+    def test_unknown_provider_raises(self):
+        """Test that unknown providers raise a configuration error."""
+        with pytest.raises(ConfigurationError):
+            create_chat_model("carrier-pigeon")
+
+    
+    def test_shared_model_is_reused_per_provider_and_model(self):
+        """Test that one client instance is shared for each provider/model pair."""
+        assert get_chat_model("fake", "a") is get_chat_model("fake", "a")
+        assert get_chat_model("fake", "a") is not get_chat_model("fake", "b")
+    
+    def test_shared_model_is_created_once_across_threads(self):
+        """Test that concurrent first use creates a single instance."""
+        models = []
+        threads = [
+            threading.Thread(target=lambda: models.append(get_chat_model("fake", "threaded")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(model) for model in models}) == 1
+
+
+class TestDeterministicChatModel:
+    """Test cases for the offline chat model."""
+    
+    @pytest.mark.parametrize("mode", ["parallel", "fused"])
+    def test_results_are_deterministic_and_valid(self, mode):
+        """Test that identical runs give identical, well-formed evaluations."""
+        workflow = RecruitmentWorkflow(DeterministicChatModel(), evaluation_mode=mode, cache=None)
+        first = workflow.process_application(CV_TEXT, JOB_TEXT)
+        second = workflow.process_application(CV_TEXT, JOB_TEXT)
+        
+        fields = ("candidate_name", "experience_level", "skill_match", "technical_score", "response")
+        assert [first[f] for f in fields] == [second[f] for f in fields]
+        assert first["candidate_name"] == "Jane Doe"
+        assert first["experience_level"] in ("Entry-Level", "Mid-Level", "Senior-Level")
+        assert first["skill_match"] in ("Strong Match", "Partial Match", "No Match")
+        assert 1 <= int(first["technical_score"]) <= 10
+        assert not any(m["fallback"] for m in first["metrics"].values())
+    
+    def test_latency_and_jitter(self):
+        """Test that calls take the configured latency within the jitter."""
+        llm = DeterministicChatModel(latency=0.05, jitter=0.02)
+        started = time.perf_counter()
+        llm.invoke("Rate technical competency 1-10.")
+        assert 0.03 <= time.perf_counter() - started < 0.2
+    
+    def test_seed_changes_answers(self):
+        """Test that different seeds give independent answer streams."""
+        prompts = [f"Rate technical competency 1-10. CV: candidate {i}" for i in range(20)]
+        answers = lambda seed: [DeterministicChatModel(seed=seed).invoke(p).content for p in prompts]
+        assert answers(1) == answers(1)
+        assert answers(1) != answers(2)
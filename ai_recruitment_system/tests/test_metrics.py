@@ -0,0 +1,66 @@
+"""
+Tests for workflow instrumentation.
+"""
+
+import pytest
+from app.agents.workflow import RecruitmentWorkflow
+from app.core.metrics import MetricsAggregator, NodeMetrics, estimate_cost
+
+
+CV_TEXT = "Jane Doe\nPython developer with 6 years of Django and PostgreSQL."
+JOB_TEXT = "Title: Python Backend Developer\nRequirements: Python Django"
+
+
+class TestWorkflowMetrics:
+    """Test cases for per-node metrics on the workflow state."""
+    
+    def test_every_executed_node_is_measured(self, scripted_llm):
+        """Test that each node reports wall time and LLM calls."""
+        aggregator = MetricsAggregator()
+        workflow = RecruitmentWorkflow(scripted_llm(score="3"), cache=None, metrics=aggregator)
+        result = workflow.process_application(CV_TEXT, JOB_TEXT)
+        metrics = result["metrics"]
+        
+        assert set(metrics) == {
+            "segment_cv", "prescreen", "extract_info", "categorize_experience", "assess_skills",
+            "technical_evaluation", "reject_with_feedback", "application"
+        }
+        assert all(m["wall_ms"] >= 0 and not m["fallback"] for m in metrics.values())
+        assert metrics["reject_with_feedback"]["llm_calls"] == 1
+        assert metrics["application"]["llm_calls"] == 5
+        assert metrics["application"]["prompt_tokens"] == sum(
+            m["prompt_tokens"] for name, m in metrics.items() if name != "application"
+        ) > 0
+        assert aggregator.counters["applications"] == 1
+    
+    def test_fallback_is_recorded(self, scripted_llm):
+        """Test that nodes serving default answers are flagged."""
+        aggregator = MetricsAggregator()
+        workflow = RecruitmentWorkflow(scripted_llm(score="42"), evaluation_mode="fused", metrics=aggregator)
+        result = workflow.process_application(CV_TEXT, JOB_TEXT)
+        
+        assert result["metrics"]["evaluate_candidate"]["fallback"] is True
+        assert result["metrics"]["application"]["fallback"] is True
+        assert aggregator.snapshot()["nodes"]["evaluate_candidate"]["fallback_rate"] == 1.0
+
+
+class TestMetricsAggregator:
+    """Test cases for the in-process aggregator."""
+    
+    def test_percentiles_and_totals(self):
+        """Test p50/p95 and summed counters over recorded executions."""
+        aggregator = MetricsAggregator()
+        for ms in range(1, 101):
+            aggregator.record(NodeMetrics(node="assess_skills", wall_ms=ms, prompt_tokens=10, fallback=ms > 90))
+        summary = aggregator.snapshot()["nodes"]["assess_skills"]
+        
+        assert summary["count"] == 100
+        assert summary["p50_ms"] == 50
+        assert summary["p95_ms"] == 95
+        assert summary["prompt_tokens"] == 1000
+        assert summary["fallback_rate"] == 0.1
+    
+    def test_cost_estimate(self):
+        """Test token cost estimation for priced and unknown models."""
+        assert estimate_cost("gpt-4o-mini", 1_000_000, 1_000_000) == pytest.approx(0.75)
+        assert estimate_cost("unknown-model", 1000, 1000) == 0.0
@@ -3,7 +3,9 @@ Tests for data models.
 """
 
 import pytest
+from app.core.tokens import estimate_tokens
 from app.models.job_posting import JobPosting
+from app.models.skills import normalize_skill
 
 
 class TestJobPosting:
@@ -45,3 +47,56 @@ class TestJobPosting:
         assert "Test Developer" in text
         assert "Test Corp" in text
         assert "Python" in text
+    
+    def test_derived_values_are_cached(self):
+        """Test that prompt text and skill set are computed once per posting."""
+        job = make_job()
+        assert job.to_text() is job.to_text()
+        assert job.prompt_text() is job.prompt_text()
+        assert job.skill_set is job.skill_set
+    
+    def test_cache_is_invalidated_when_fields_change(self):
+        """Test that reassigned and mutated fields refresh derived values."""
+        job = make_job()
+        text, skills, content_hash = job.to_text(), job.skill_set, job.content_hash
+        job.title = "Staff Developer"
+        assert "Staff Developer" in job.to_text() and job.to_text() != text
+        assert job.content_hash != content_hash
+        job.skills_required.append("Kubernetes")
+        assert job.skill_set == skills | {"kubernetes"}
+    
+    def test_prompt_text_drops_whole_requirements(self):
+        """Test that the token budget removes complete requirements only."""
+        requirements = [f"Requirement number {i} with some detail" for i in range(40)]
+        job = make_job(requirements=requirements)
+        full = job.prompt_text(max_tokens=10000)
+        short = job.prompt_text(max_tokens=120)
+        assert all(f"- {r}" in full for r in requirements)
+        assert estimate_tokens(short) <= 120
+        kept = [line[2:] for line in short.splitlines() if line.startswith("- ")]
+        assert 0 < len(kept) < len(requirements)
+        assert kept == requirements[:len(kept)]
+    
+    def test_skill_set_is_normalized(self):
+        """Test that skills are lowercased and aliases folded."""
+        job = make_job(skills_required=["Python", " postgres ", "REST APIs", "JS", "K8s"])
+        assert job.skill_set == {"python", "postgresql", "rest api", "javascript", "kubernetes"}
+        assert normalize_skill("Node JS") == "node js"
+        assert normalize_skill("NodeJS") == "node.js"
+
+
+def make_job(**overrides) -> JobPosting:
+    """Build a test posting, overriding selected fields."""
+    fields = dict(
+        title="Test Developer",
+        company="Test Corp",
+        description="A test job",
+        requirements=["Python", "Testing"],
+        experience_level="Mid-Level",
+        skills_required=["Python", "Testing"],
+        location="Remote",
+        salary_range="$50,000 - $70,000",
+        job_type="Full-time"
+    )
+    fields.update(overrides)
+    return JobPosting(**fields)
@@ -0,0 +1,176 @@
+"""
+Tests for near-duplicate CV detection.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from app.services import near_duplicates
+from app.services.job_service import JobService
+from app.services.near_duplicates import NearDuplicateIndex, shingle_hashes
+from app.services.recruitment_agent import RecruitmentAgent
+from app.services.result_store import ResultStore, content_hash
+from benchmarks.corpus import generate_corpus
+
+
+JOBS = JobService.get_sample_jobs()
+CV_TEXT = (
+    "Jane Doe\njane@example.com | +1 555 0100\n\n"
+    "SUMMARY\nBackend developer with 6 years of experience building Python services.\n\n"
+    "EXPERIENCE\nSenior Backend Developer at TechCorp (4 years)\n"
+    "- Designed REST APIs with Django and FastAPI serving millions of requests\n"
+    "- Migrated reporting jobs from cron scripts to Celery and Redis\n"
+    "Backend Developer at WebSolutions (2 years)\n"
+    "- Maintained PostgreSQL schemas and wrote data migrations\n\n"
+    "SKILLS\nPython, Django, FastAPI, PostgreSQL, Redis, Docker, Git\n\n"
+    "EDUCATION\nBSc Computer Science, State University\n"
+)
+EDITED_CV = CV_TEXT.replace("0100", "0199") + "Available immediately.\n"
+OTHER_CV = (
+    "John Smith\nData scientist with 3 years of experience in forecasting.\n"
+    "Built TensorFlow models for demand planning at DataWorks and presented results to stakeholders."
+)
+
+
+class TestNearDuplicateIndex:
+    """Test cases for MinHash signatures and the LSH index."""
+    
+    def test_shingles_ignore_case_and_punctuation(self):
+        """Test that shingles are built from lower-cased words only."""
+        assert np.array_equal(shingle_hashes("Python, Django; REST!"), shingle_hashes("python django rest"))
+        assert len(shingle_hashes("one two three four")) == 2
+        assert len(shingle_hashes("short")) == 1
+        assert len(shingle_hashes("  ...  ")) == 0
+    
+    def test_similar_cv_is_found(self):
+        """Test that a lightly edited CV matches and an unrelated one does not."""
+        index = NearDuplicateIndex()
+        index.add(["original"], index.signature(CV_TEXT)[None])
+        
+        matches = index.query(index.signature(EDITED_CV))
+        assert [id_ for id_, _ in matches] == ["original"]
+        assert matches[0][1] >= 0.85
+        assert index.query(index.signature(OTHER_CV)) == []
+        assert index.query(index.signature(CV_TEXT)) == [("original", 1.0)]
+    
+    def test_check_excludes_own_id(self):
+        """Test that a CV is not reported as a duplicate of itself."""
+        index = NearDuplicateIndex()
+        index.add(["original"], index.signature(CV_TEXT)[None])
+        assert index.check("original", CV_TEXT).matches == []
+        assert index.check("copy", CV_TEXT).matches == [("original", 1.0)]
+        assert index.check("empty", "") is None
+    
+    def test_bands_must_divide_signature(self):
+        """Test that an uneven band split is rejected."""
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(num_perm=100, bands=16)
+    
+    def test_index_persists(self, tmp_path):
+        """Test that signatures are reloaded and searchable after a restart."""
+        path = str(tmp_path / "near_duplicates.u32")
+        index = NearDuplicateIndex(path)
+        index.add(["original"], index.signature(CV_TEXT)[None])
+        
+        reloaded = NearDuplicateIndex(path)
+        assert len(reloaded) == 1
+        assert reloaded.query(reloaded.signature(EDITED_CV))[0][0] == "original"
+    
+    def test_unsorted_tail_and_replacement(self, monkeypatch):
+        """Test lookups across sorted rows, the unsorted tail and replaced ids."""
+        monkeypatch.setattr(near_duplicates, "_MAX_UNSORTED", 4)
+        cvs = generate_corpus(22, seed=3)
+        index = NearDuplicateIndex()
+        for i, cv in enumerate(cvs):
+            index.add([str(i)], index.signature(cv)[None])
+        assert index._sorted_rows.shape[1] < len(index)
+        for i, cv in enumerate(cvs):
+            assert str(i) in dict(index.query(index.signature(cv)))
+        
+        index.add(["0"], index.signature(OTHER_CV)[None])
+        assert len(index) == 22
+        assert "0" in dict(index.query(index.signature(OTHER_CV)))
+        assert "0" not in dict(index.query(index.signature(cvs[0]), threshold=1.0))
+    
+    def test_lookup_is_fast_at_scale(self):
+        """Test that a lookup stays around a millisecond over many indexed CVs."""
+        rng = np.random.default_rng(0)
+        index = NearDuplicateIndex()
+        count = 50000
+        index.add([str(i) for i in range(count)], rng.integers(0, 2 ** 32, (count, index.num_perm), dtype=np.uint32))
+        index.add(["original"], index.signature(CV_TEXT)[None])
+        query = index.signature(EDITED_CV)
+        
+        index.query(query)
+        started = time.perf_counter()
+        for _ in range(100):
+            matches = index.query(query)
+        elapsed_ms = (time.perf_counter() - started) * 1000 / 100
+        assert matches[0][0] == "original"
+        assert elapsed_ms < 5
+
+
+class TestAgentNearDuplicates:
+    """Test cases for near-duplicate handling in the recruitment agent."""
+    
+    def test_edited_cv_reuses_evaluation(self, scripted_llm):
+        """Test that a lightly edited resubmission reuses the stored result."""
+        llm = scripted_llm()
+        agent = RecruitmentAgent(llm, results=ResultStore(), duplicates=NearDuplicateIndex())
+        first = agent.process_application(CV_TEXT, JOBS["Python Developer"])
+        calls = len(llm.prompts)
+        reuses = agent.workflow.metrics.counters["near_duplicate_reuses"]
+        
+        second = agent.process_application(EDITED_CV, JOBS["Python Developer"])
+        assert len(llm.prompts) == calls
+        assert second["response"] == first["response"]
+        assert second["duplicate_of"] == content_hash(CV_TEXT)
+        assert agent.workflow.metrics.counters["near_duplicate_reuses"] == reuses + 1
+    
+    def test_reuse_threshold(self, scripted_llm, monkeypatch):
+        """Test that matches below the reuse threshold are flagged but re-evaluated."""
+        monkeypatch.setattr("app.core.config.Config.NEAR_DUPLICATE_REUSE_THRESHOLD", 1.0)
+        llm = scripted_llm()
+        agent = RecruitmentAgent(llm, results=ResultStore(), duplicates=NearDuplicateIndex())
+        agent.process_application(CV_TEXT, JOBS["Python Developer"])
+        calls = len(llm.prompts)
+        
+        second = agent.process_application(EDITED_CV, JOBS["Python Developer"])
+        assert len(llm.prompts) > calls
+        assert second["duplicate_of"] == content_hash(CV_TEXT)
+    
+    def test_other_job_is_flagged_not_reused(self, scripted_llm):
+        """Test that a near-duplicate sent to another job is evaluated and flagged."""
+        llm = scripted_llm()
+        agent = RecruitmentAgent(llm, results=ResultStore(), duplicates=NearDuplicateIndex())
+        first = agent.process_application(CV_TEXT, JOBS["Python Developer"])
+        assert "duplicate_of" not in first
+        calls = len(llm.prompts)
+        flagged = agent.workflow.metrics.counters["near_duplicates"]
+        
+        second = agent.process_application(EDITED_CV, JOBS["Django Developer"])
+        assert len(llm.prompts) > calls
+        assert second["duplicate_of"] == content_hash(CV_TEXT)
+        assert second["duplicate_similarity"] >= 0.85
+        assert agent.workflow.metrics.counters["near_duplicates"] == flagged + 1
+    
+    def test_stream_replays_reused_result(self, scripted_llm):
+        """Test that a reused evaluation is streamed as a lone result event."""
+        agent = RecruitmentAgent(scripted_llm(), results=ResultStore(), duplicates=NearDuplicateIndex())
+        list(agent.stream_application(CV_TEXT, JOBS["Python Developer"]))
+        
+        events = list(agent.stream_application(EDITED_CV, JOBS["Python Developer"]))
+        assert [event.kind for event in events] == ["result"]
+        assert events[0].update["duplicate_of"] == content_hash(CV_TEXT)
+    
+    def test_index_errors_do_not_fail_the_application(self, scripted_llm):
+        """Test that a failing near-duplicate index is skipped."""
+        class BrokenIndex(NearDuplicateIndex):
+            def check(self, id_, text, threshold=None):
+                raise OSError("index file is corrupt")
+        
+        agent = RecruitmentAgent(scripted_llm(), results=ResultStore(), duplicates=BrokenIndex())
+        result = agent.process_application(CV_TEXT, JOBS["Python Developer"])
+        assert "Congratulations" in result["response"]
+        assert "duplicate_of" not in result
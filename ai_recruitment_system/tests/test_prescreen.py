@@ -0,0 +1,152 @@
+"""
+Tests for the deterministic pre-screen stage.
+"""
+
+import pytest
+from app.agents.workflow import RecruitmentWorkflow
+from app.core.config import Config
+from app.core.scheduler import Priority, get_priority
+from app.models.job_posting import JobPosting
+from app.services.prescreen import (
+    SkillMatcher, extract_years_of_experience, guess_candidate_name, prescreen
+)
+
+
+JOB = JobPosting(
+    title="Python Backend Developer",
+    company="StartupTech",
+    description="Build backend APIs.",
+    requirements=["2+ years of Python", "PostgreSQL"],
+    experience_level="Mid-Level",
+    skills_required=["Python", "PostgreSQL", "Docker", "REST APIs"],
+    location="Remote",
+    salary_range="$70,000 - $100,000",
+    job_type="Full-time"
+)
+MATCHING_CV = "Jane Doe\nBackend engineer, 6 years of Python3, Postgres, Docker and RESTful APIs."
+WEAK_CV = "Jane Doe\nFrontend developer with Python scripting."
+UNRELATED_CV = "John Smith\nPastry chef since 2012 - 2020, specialising in sourdough."
+
+
+class TestSkillMatcher:
+    """Test cases for local skill matching."""
+    
+    def test_aliases_are_folded(self):
+        """Test that alias spellings count as the canonical skill."""
+        matcher = SkillMatcher(["Python", "PostgreSQL", "REST APIs", "Kubernetes"])
+        assert matcher.find("python3, postgres, restful apis and k8s") == {
+            "python", "postgresql", "rest api", "kubernetes"
+        }
+    
+    def test_whole_terms_only(self):
+        """Test that skills embedded in longer words do not match."""
+        matcher = SkillMatcher(["Java", "Go", "C++"])
+        assert matcher.find("JavaScript, Google and C#") == set()
+        assert matcher.find("Skills: Java, Go and C++") == {"java", "go", "c++"}
+    
+    def test_ambiguous_terms_only_in_skills_section(self):
+        """Test that skills spelled like ordinary words only count when listed as skills."""
+        matcher = SkillMatcher(["Go", "REST APIs", "Computer Vision"])
+        prose = "Ready to go the extra mile; my CV covers the rest."
+        assert matcher.find(prose) == set()
+        assert matcher.find(prose + "\n\nSKILLS\nGo, REST, CV") == {"go", "rest api", "computer vision"}
+    
+    def test_multi_word_skills_tolerate_whitespace(self):
+        """Test that multi-word skills match across line breaks."""
+        assert SkillMatcher(["Machine Learning"]).find("machine\n  learning") == {"machine learning"}
+    
+    @pytest.mark.parametrize("text, years", [
+        ("6 years of Python", 6),
+        ("3+ yrs experience; 10 years in industry", 10),
+        ("Acme 2012 - 2020", 8),
+        ("No dates here", None),
+    ])
+    def test_years_of_experience(self, text, years):
+        """Test extraction of stated years and employment date ranges."""
+        assert extract_years_of_experience(text) == years
+    
+    def test_guess_candidate_name(self):
+        """Test that the leading name line is used."""
+        assert guess_candidate_name("\nJane Doe\nEngineer") == "Jane Doe"
+        assert guess_candidate_name("curriculum vitae") == "Candidate"
+
+
+class TestPrescreenDecision:
+    """Test cases for pre-screen decisions."""
+    
+    def test_decisions(self, monkeypatch):
+        """Test pass, low priority and reject thresholds."""
+        monkeypatch.setattr(Config, "PRESCREEN_MODE", "reject")
+        assert prescreen(MATCHING_CV, JOB.skill_set).decision == "pass"
+        assert prescreen(WEAK_CV, JOB.skill_set).decision == "low_priority"
+        result = prescreen(UNRELATED_CV, JOB.skill_set)
+        assert result.decision == "reject" and result.score == 0
+        assert result.missing_skills == sorted(JOB.skill_set)
+    
+    def test_flag_mode_never_rejects(self, monkeypatch):
+        """Test that flag mode only deprioritizes non-matches."""
+        monkeypatch.setattr(Config, "PRESCREEN_MODE", "flag")
+        assert prescreen(UNRELATED_CV, JOB.skill_set).decision == "low_priority"
+    
+    def test_no_required_skills_passes(self):
+        """Test that postings without skills are not screened."""
+        assert prescreen(UNRELATED_CV, []).decision == "pass"
+
+
+class TestPrescreenWorkflow:
+    """Test cases for the pre-screen graph stage."""
+    
+    def test_non_match_skips_llm_evaluation(self, scripted_llm, monkeypatch):
+        """Test that a rejected CV only costs the feedback call."""
+        monkeypatch.setattr(Config, "PRESCREEN_MODE", "reject")
+        llm = scripted_llm()
+        result = RecruitmentWorkflow(llm, cache=None).process_application(UNRELATED_CV, JOB)
+        
+        assert result["prescreen_decision"] == "reject"
+        assert result["candidate_name"] == "John Smith"
+        assert result["skill_match"] == "No Match"
+        assert "Thank you for your interest, John Smith" in result["response"]
+        assert len(llm.prompts) == 1 and "learning recommendations" in llm.prompts[0]
+    
+    @pytest.mark.parametrize("mode", ["parallel", "fused"])
+    def test_match_runs_full_evaluation(self, scripted_llm, mode):
+        """Test that matching CVs continue to the LLM evaluation."""
+        result = RecruitmentWorkflow(scripted_llm(), evaluation_mode=mode, cache=None).process_application(
+            MATCHING_CV, JOB
+        )
+        assert result["prescreen_decision"] == "pass"
+        assert result["matched_skills"] == ["docker", "postgresql", "python", "rest api"]
+        assert result["years_experience"] == 6
+        assert "Congratulations Jane Doe" in result["response"]
+    
+    def test_weak_match_runs_at_batch_priority(self, scripted_llm):
+        """Test that low-priority applications schedule their LLM calls as batch work."""
+        seen = set()
+        llm = scripted_llm()
+        original = llm.invoke
+        
+        def invoke(*args, **kwargs):
+            seen.add(get_priority())
+            return original(*args, **kwargs)
+        
+        object.__setattr__(llm, "invoke", invoke)
+        RecruitmentWorkflow(llm, cache=None).process_application(WEAK_CV, JOB)
+        assert seen == {Priority.BATCH}
+    
+    def test_settings_are_fixed_at_construction(self, scripted_llm, monkeypatch):
+        """Test that later Config changes affect neither decisions nor the prompt version."""
+        monkeypatch.setattr(Config, "PRESCREEN_MODE", "reject")
+        workflow = RecruitmentWorkflow(scripted_llm(), cache=None)
+        prompt_version = workflow.prompt_version
+        monkeypatch.setattr(Config, "PRESCREEN_MODE", "flag")
+        monkeypatch.setattr(Config, "PRESCREEN_REJECT_BELOW", 0.0)
+        
+        assert workflow.process_application(UNRELATED_CV, JOB)["prescreen_decision"] == "reject"
+        assert workflow.prompt_version == prompt_version
+    
+    def test_off_mode_removes_stage(self, scripted_llm, monkeypatch):
+        """Test that the stage can be disabled."""
+        monkeypatch.setattr(Config, "PRESCREEN_MODE", "off")
+        workflow = RecruitmentWorkflow(scripted_llm(), cache=None)
+        assert "prescreen" not in workflow.app.get_graph().nodes
+        assert workflow.process_application(UNRELATED_CV, JOB)["prescreen_decision"] == ""
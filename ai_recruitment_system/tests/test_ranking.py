@@ -0,0 +1,93 @@
+"""
+Tests for vectorized applicant ranking.
+"""
+
+import json
+import time
+
+import numpy as np
+from app.core.exceptions import AgentWorkflowError
+from app.models.batch_result import BatchResult
+from app.services.ranking import (
+    RankingWeights, build_feature_frame, collect_batch, rank_candidates, score_candidates, shortlist_records
+)
+from benchmarks.bench_ranking import generate_results
+
+
+def result(name, score, experience="Mid-Level", skills="Strong Match", overlap=1.0):
+    return {
+        "candidate_name": name,
+        "technical_score": score,
+        "experience_level": experience,
+        "skill_match": skills,
+        "prescreen_score": overlap,
+    }
+
+
+class TestFeatureFrame:
+    """Test cases for collecting results into columns."""
+    
+    def test_unparseable_values_get_defaults(self):
+        """Test that bad scores and unknown labels do not break ranking."""
+        frame = build_feature_frame([result("A", "n/a", "Guru", "Maybe", None)])
+        row = frame.iloc[0]
+        assert row["technical_score"] == 0.0
+        assert row["experience_rank"] == 1
+        assert row["skill_match"] == 0.5
+        assert row["skill_overlap"] == 1.0
+    
+    def test_collect_batch_skips_failures(self):
+        """Test that failed batch items are excluded and ids kept."""
+        items = [
+            BatchResult(0, result=result("A", "7")),
+            BatchResult(1, error=AgentWorkflowError("boom")),
+            BatchResult(2, result=result("C", "9")),
+        ]
+        assert list(collect_batch(items).index) == [0, 2]
+
+
+class TestRanking:
+    """Test cases for weighted scores and shortlists."""
+    
+    def test_weighted_order(self):
+        """Test that candidates are ordered by the weighted score."""
+        frame = build_feature_frame([
+            result("Low", "3", skills="No Match", overlap=0.2),
+            result("High", "9"),
+            result("Mid", "6", skills="Partial Match", overlap=0.5),
+        ])
+        shortlist = rank_candidates(frame)
+        assert list(shortlist["candidate_name"]) == ["High", "Mid", "Low"]
+        assert list(shortlist["rank"]) == [1, 2, 3]
+        assert shortlist["score"].between(0, 1).all()
+    
+    def test_job_level_prefers_matching_experience(self):
+        """Test that experience fit rewards closeness to the job's level."""
+        frame = build_feature_frame([result("Senior", "8", "Senior-Level"), result("Entry", "8", "Entry-Level")])
+        weights = RankingWeights(technical_score=0, skill_match=0, skill_overlap=0, experience_fit=1)
+        assert rank_candidates(frame, weights=weights, job_level="Entry-Level").iloc[0]["candidate_name"] == "Entry"
+        assert rank_candidates(frame, weights=weights).iloc[0]["candidate_name"] == "Senior"
+    
+    def test_top_k_matches_full_sort(self):
+        """Test that the partitioned top-k equals the head of a full ranking."""
+        frame = build_feature_frame(generate_results(2000, seed=1))
+        scores = score_candidates(frame)
+        top = rank_candidates(frame, top_k=25)
+        assert len(top) == 25
+        assert np.allclose(top["score"].to_numpy(), np.sort(scores)[::-1][:25])
+        assert rank_candidates(frame, top_k=0).empty
+    
+    def test_records_are_json_serializable(self):
+        """Test that shortlists can be exported as JSON."""
+        frame = build_feature_frame([result("A", "7")], ids=["cvs/a.pdf"])
+        records = shortlist_records(rank_candidates(frame))
+        assert records[0]["id"] == "cvs/a.pdf"
+        assert records[0]["years_experience"] is None
+        json.dumps(records, allow_nan=False)
+    
+    def test_ten_thousand_applicants_rank_in_milliseconds(self):
+        """Test that ranking a large pool stays vectorized."""
+        frame = build_feature_frame(generate_results(10000))
+        started = time.perf_counter()
+        rank_candidates(frame, top_k=50, job_level="Mid-Level")
+        assert time.perf_counter() - started < 0.1
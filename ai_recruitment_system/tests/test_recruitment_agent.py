@@ -0,0 +1,123 @@
+"""
+Tests for the recruitment agent service.
+"""
+
+import asyncio
+
+import pytest
+from app.core.config import Config
+from app.core.exceptions import AgentWorkflowError
+from app.services.recruitment_agent import RecruitmentAgent, get_recruitment_agent
+
+
+JOB_TEXT = "Title: Python Backend Developer\nRequirements: Python Django"
+
+
+def make_batch(count: int):
+    """Build ``count`` distinct applications for the same job."""
+    return [(f"Candidate {i}\nPython developer", JOB_TEXT) for i in range(count)]
+
+
+class TestBatchProcessing:
+    """Test cases for batch application processing."""
+    
+    def test_process_batch_returns_every_item(self, scripted_llm):
+        """Test that every application yields exactly one successful result."""
+        agent = RecruitmentAgent(scripted_llm())
+        results = list(agent.process_batch(make_batch(5), max_concurrency=2))
+        
+        assert sorted(r.index for r in results) == list(range(5))
+        assert all(r.ok and "Congratulations" in r.result["response"] for r in results)
+    
+    def test_failures_are_isolated(self, scripted_llm, monkeypatch):
+        """Test that one failing application does not abort the batch."""
+        agent = RecruitmentAgent(scripted_llm())
+        original = agent.workflow.aprocess_application
+        
+        async def flaky(cv_text, job_posting):
+            if cv_text.startswith("Candidate 2"):
+                raise RuntimeError("provider timeout")
+            return await original(cv_text, job_posting)
+        
+        monkeypatch.setattr(agent.workflow, "aprocess_application", flaky)
+        results = {r.index: r for r in agent.process_batch(make_batch(4), max_concurrency=2)}
+        
+        assert len(results) == 4
+        assert isinstance(results[2].error, AgentWorkflowError)
+        assert "provider timeout" in str(results[2].error)
+        assert all(results[i].ok for i in (0, 1, 3))
+    
+    def test_invalid_items_are_isolated(self, scripted_llm):
+        """Test that an item failing before the workflow starts only fails itself."""
+        agent = RecruitmentAgent(scripted_llm(), results=None)
+        batch = [(None, JOB_TEXT)] + make_batch(2)
+        results = {r.index: r for r in agent.process_batch(batch, max_concurrency=1, batch_id="invalid")}
+        
+        assert len(results) == 3
+        assert isinstance(results[0].error, AgentWorkflowError)
+        assert results[1].ok and results[2].ok
+    
+    def test_invalid_input_raises_workflow_error(self, scripted_llm):
+        """Test that unusable input surfaces as AgentWorkflowError."""
+        agent = RecruitmentAgent(scripted_llm(), results=None)
+        with pytest.raises(AgentWorkflowError):
+            agent.process_application(None, JOB_TEXT)
+        with pytest.raises(AgentWorkflowError):
+            asyncio.run(agent.aprocess_application(None, JOB_TEXT))
+    
+    def test_concurrency_is_bounded(self, scripted_llm, monkeypatch):
+        """Test that no more than max_concurrency applications run at once."""
+        agent = RecruitmentAgent(scripted_llm(delay=0.01))
+        original = agent.workflow.aprocess_application
+        in_flight = {"now": 0, "peak": 0}
+        
+        async def tracked(cv_text, job_posting):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            try:
+                return await original(cv_text, job_posting)
+            finally:
+                in_flight["now"] -= 1
+        
+        monkeypatch.setattr(agent.workflow, "aprocess_application", tracked)
+        list(agent.process_batch(make_batch(9), max_concurrency=3))
+        
+        assert in_flight["peak"] == 3
+    
+    def test_aprocess_batch_streams_in_completion_order(self, scripted_llm, monkeypatch):
+        """Test that fast applications are yielded before slow ones finish."""
+        agent = RecruitmentAgent(scripted_llm())
+        original = agent.workflow.aprocess_application
+        
+        async def slow_first(cv_text, job_posting):
+            if cv_text.startswith("Candidate 0"):
+                await asyncio.sleep(0.2)
+            return await original(cv_text, job_posting)
+        
+        monkeypatch.setattr(agent.workflow, "aprocess_application", slow_first)
+        
+        async def collect():
+            return [r.index async for r in agent.aprocess_batch(make_batch(3), max_concurrency=3)]
+        
+        order = asyncio.run(collect())
+        assert order[-1] == 0
+
+
+class TestSharedAgent:
+    """Test cases for the process-wide agent registry."""
+    
+    def test_agent_and_graph_are_shared(self, monkeypatch):
+        """Test that repeated lookups return one agent with one compiled graph."""
+        monkeypatch.setattr(Config, "LLM_PROVIDER", "fake")
+        first = get_recruitment_agent("fused")
+        second = get_recruitment_agent("fused")
+        assert first is second
+        assert first.workflow.app is second.workflow.app
+        assert get_recruitment_agent("parallel") is not first
+    
+    def test_shared_agents_share_the_llm_client(self, monkeypatch):
+        """Test that agents for different modes use the same pooled client."""
+        monkeypatch.setattr(Config, "LLM_PROVIDER", "fake")
+        fused = get_recruitment_agent("fused").workflow.nodes.llm
+        parallel = get_recruitment_agent("parallel").workflow.nodes.llm
+        assert fused is parallel
@@ -0,0 +1,173 @@
+"""
+Tests for the persistent evaluation result store.
+"""
+
+import csv
+import io
+import json
+import sqlite3
+
+import pytest
+from app.services.batch_manifest import BatchManifest
+from app.services.job_service import JobService
+from app.services.recruitment_agent import RecruitmentAgent
+from app.services.result_store import ResultStore, make_result_key
+
+
+JOB = JobService.get_sample_jobs()["Python Developer"]
+CV_TEXT = "Jane Doe\nPython developer with 5 years of Django, REST APIs, PostgreSQL and Git."
+
+
+def make_result(name: str, score: str):
+    """Minimal workflow result with application metrics."""
+    return {
+        "candidate_name": name,
+        "technical_score": score,
+        "skill_match": "Strong Match",
+        "metrics": {"application": {"wall_ms": 12.5}},
+    }
+
+
+class LockedStore(ResultStore):
+    """Result store whose database is always locked."""
+    
+    def get(self, key):
+        raise sqlite3.OperationalError("database is locked")
+    
+    def put(self, key, result):
+        raise sqlite3.OperationalError("database is locked")
+
+
+class LockedManifest(BatchManifest):
+    """Batch manifest whose database is always locked."""
+    
+    def mark(self, *args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+
+class TestResultStore:
+    """Test cases for storing and querying results."""
+    
+    def test_key_depends_on_every_component(self):
+        """Test that CV, job, model and prompt version all change the key."""
+        key = make_result_key(CV_TEXT, JOB, "gpt", "v1")
+        assert key.job_hash == JOB.content_hash
+        assert key != make_result_key(CV_TEXT + " ", JOB, "gpt", "v1")
+        assert key != make_result_key(CV_TEXT, JOB.to_text(), "gpt", "v1")
+        assert key != make_result_key(CV_TEXT, JOB, "gpt-mini", "v1")
+        assert key != make_result_key(CV_TEXT, JOB, "gpt", "v2")
+    
+    def test_put_get_and_persist(self, tmp_path):
+        """Test that results survive reopening the database."""
+        path = str(tmp_path / "results.sqlite3")
+        key = make_result_key(CV_TEXT, JOB, "gpt", "v1")
+        ResultStore(path).put(key, make_result("Jane Doe", "8"))
+        
+        store = ResultStore(path)
+        assert len(store) == 1
+        assert store.get(key)["candidate_name"] == "Jane Doe"
+        assert store.get(key._replace(model="other")) is None
+    
+    def test_query_filters_and_orders(self):
+        """Test bulk queries by job and minimum score."""
+        store = ResultStore()
+        for i, score in enumerate(["6", "9", "n/a", "7"]):
+            store.put(make_result_key(f"cv {i}", JOB, "gpt", "v1"), make_result(f"C{i}", score))
+        store.put(make_result_key("cv 0", "Other job", "gpt", "v1"), make_result("X", "10"))
+        
+        ranked = store.query(job_hash=JOB.content_hash)
+        assert [r.result["candidate_name"] for r in ranked] == ["C1", "C3", "C0", "C2"]
+        assert [r.result["candidate_name"] for r in store.query(job_hash=JOB.content_hash, min_score=7)] == ["C1", "C3"]
+        assert len(store.query(limit=2)) == 2
+        assert ranked[0].elapsed_ms == 12.5
+    
+    def test_export(self):
+        """Test JSON lines and CSV export."""
+        store = ResultStore()
+        store.put(make_result_key(CV_TEXT, JOB, "gpt", "v1"), make_result("Jane Doe", "8"))
+        
+        out = io.StringIO()
+        assert store.export(out) == 1
+        assert json.loads(out.getvalue())["result"]["candidate_name"] == "Jane Doe"
+        
+        out = io.StringIO()
+        store.export(out, fmt="csv")
+        row = next(csv.DictReader(io.StringIO(out.getvalue())))
+        assert row["candidate_name"] == "Jane Doe" and row["technical_score"] == "8"
+        
+        with pytest.raises(ValueError):
+            store.export(out, fmt="xml")
+
+
+class TestAgentReuse:
+    """Test cases for idempotent re-evaluation through the agent."""
+    
+    def test_stored_result_skips_workflow(self, scripted_llm):
+        """Test that a repeated application is served from the store."""
+        store = ResultStore()
+        llm = scripted_llm()
+        agent = RecruitmentAgent(llm, results=store)
+        first = agent.process_application(CV_TEXT, JOB)
+        calls = len(llm.prompts)
+        
+        second = RecruitmentAgent(llm, results=store).process_application(CV_TEXT, JOB)
+        assert len(llm.prompts) == calls
+        assert second["response"] == first["response"]
+        assert len(store) == 1
+    
+    def test_prompt_change_invalidates(self, scripted_llm):
+        """Test that a different evaluation mode does not reuse results."""
+        store = ResultStore()
+        llm = scripted_llm()
+        RecruitmentAgent(llm, evaluation_mode="parallel", results=store).process_application(CV_TEXT, JOB)
+        calls = len(llm.prompts)
+        RecruitmentAgent(llm, evaluation_mode="fused", results=store).process_application(CV_TEXT, JOB)
+        assert len(llm.prompts) > calls
+        assert len(store) == 2
+    
+    def test_fallback_results_are_not_stored(self, scripted_llm):
+        """Test that results built from default answers are re-evaluated later."""
+        store = ResultStore()
+        RecruitmentAgent(scripted_llm(score="excellent"), evaluation_mode="fused", results=store).process_application(CV_TEXT, JOB)
+        assert len(store) == 0
+    
+    def test_batch_is_incremental(self, scripted_llm):
+        """Test that a re-run batch only evaluates new applications."""
+        store = ResultStore()
+        llm = scripted_llm()
+        agent = RecruitmentAgent(llm, results=store)
+        list(agent.process_batch([(CV_TEXT, JOB)]))
+        calls = len(llm.prompts)
+        
+        results = list(agent.process_batch([(CV_TEXT, JOB), (CV_TEXT + "\nDocker", JOB)]))
+        assert all(r.ok for r in results)
+        assert len(llm.prompts) - calls == calls
+        assert len(store) == 2
+    
+    def test_stream_stores_and_reuses(self, scripted_llm):
+        """Test that streamed evaluations are stored and replayed as a lone result event."""
+        store = ResultStore()
+        agent = RecruitmentAgent(scripted_llm(), results=store)
+        streamed = list(agent.stream_application(CV_TEXT, JOB))
+        assert len(store) == 1
+        
+        replayed = list(agent.stream_application(CV_TEXT, JOB))
+        assert [event.kind for event in replayed] == ["result"]
+        assert replayed[0].update["response"] == streamed[-1].update["response"]
+    
+    def test_store_errors_do_not_fail_the_application(self, scripted_llm):
+        """Test that a failing result store is skipped and counted."""
+        agent = RecruitmentAgent(scripted_llm(), results=LockedStore())
+        errors = agent.workflow.metrics.counters["store_errors"]
+        
+        result = agent.process_application(CV_TEXT, JOB)
+        streamed = list(agent.stream_application(CV_TEXT, JOB))
+        assert "Congratulations" in result["response"]
+        assert streamed[-1].update["response"] == result["response"]
+        assert agent.workflow.metrics.counters["store_errors"] == errors + 4
+    
+    def test_manifest_errors_do_not_fail_the_batch(self, scripted_llm):
+        """Test that a failing batch manifest leaves every item's result intact."""
+        agent = RecruitmentAgent(scripted_llm(), results=LockedStore(), manifest=LockedManifest())
+        applications = [(f"{CV_TEXT}\nProject {i}", JOB) for i in range(3)]
+        assert all(item.ok for item in agent.process_batch(applications, max_concurrency=1, batch_id="nightly"))
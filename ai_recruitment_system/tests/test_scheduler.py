@@ -0,0 +1,180 @@
+"""
+Tests for the rate-limit-aware LLM scheduler.
+"""
+
+import threading
+import time
+
+import pytest
+from app.agents.nodes import RecruitmentNodes
+from app.core.metrics import NodeMetrics, _current_node
+from app.core.scheduler import LLMScheduler, Priority, TokenBucket, get_priority, is_retryable, priority_scope
+
+
+class RateLimitError(Exception):
+    """Stand-in for the provider's 429 error."""
+    
+    status_code = 429
+
+
+class Flaky:
+    """Callable failing with the given errors before succeeding."""
+    
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestTokenBucket:
+    """Test cases for the token bucket."""
+    
+    def test_refill_and_wait_time(self):
+        """Test that an empty bucket reports when it will have capacity again."""
+        bucket = TokenBucket(capacity=10, rate=5)
+        bucket.consume(10)
+        assert bucket.wait_time(5) == pytest.approx(1.0, abs=0.05)
+        bucket.refill(bucket.updated + 2)
+        assert bucket.tokens == pytest.approx(10)
+        assert bucket.wait_time(5) == 0.0
+    
+    def test_oversized_request_is_clamped_to_capacity(self):
+        """Test that a request larger than the bucket cannot wait forever."""
+        bucket = TokenBucket(capacity=10, rate=1)
+        assert bucket.wait_time(50) == 0.0
+
+
+class TestLLMScheduler:
+    """Test cases for admission control, retries and priorities."""
+    
+    def test_requests_per_minute_budget_is_enforced(self):
+        """Test that calls beyond the burst wait for the bucket to refill."""
+        scheduler = LLMScheduler(requests_per_minute=600, burst_seconds=0.2)  # 2 burst, 10/s
+        started = time.perf_counter()
+        for _ in range(4):
+            scheduler.call(lambda: None)
+        assert time.perf_counter() - started >= 0.15
+        snapshot = scheduler.snapshot()
+        assert snapshot["completed"] == 4 and snapshot["queue_depth"] == 0
+        assert snapshot["wait_p95_ms"] > 0
+    
+    def test_retries_rate_limits_with_backoff(self):
+        """Test that 429s are retried and counted until the call succeeds."""
+        scheduler = LLMScheduler(max_retries=3, backoff_base=0.001)
+        func = Flaky(RateLimitError(), RateLimitError())
+        metrics = NodeMetrics(node="test")
+        token = _current_node.set(metrics)
+        try:
+            assert scheduler.call(func) == "ok"
+        finally:
+            _current_node.reset(token)
+        assert func.calls == 3
+        assert metrics.retries == 2
+        assert scheduler.snapshot()["rate_limited"] == 2
+    
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error surfaces once retries are exhausted."""
+        scheduler = LLMScheduler(max_retries=1, backoff_base=0.001)
+        func = Flaky(RateLimitError(), RateLimitError(), RateLimitError())
+        with pytest.raises(RateLimitError):
+            scheduler.call(func)
+        assert func.calls == 2
+        assert scheduler.snapshot()["failed"] == 1
+    
+    def test_non_retryable_errors_are_raised_immediately(self):
+        """Test that permanent failures are not retried."""
+        scheduler = LLMScheduler(max_retries=3, backoff_base=0.001)
+        func = Flaky(ValueError("bad request"))
+        with pytest.raises(ValueError):
+            scheduler.call(func)
+        assert func.calls == 1
+    
+    def test_is_retryable(self):
+        """Test classification of transient errors."""
+        class APITimeoutError(Exception):
+            pass
+        
+        assert is_retryable(RateLimitError())
+        assert is_retryable(APITimeoutError())
+        assert not is_retryable(ValueError())
+    
+    def test_interactive_calls_are_served_before_batch(self):
+        """Test that queued interactive calls overtake queued batch calls."""
+        scheduler = LLMScheduler(requests_per_minute=60, burst_seconds=1)  # 1 burst, 1/s
+        scheduler.call(lambda: None)  # drain the bucket
+        served = []
+        
+        def submit(priority, label):
+            scheduler.call(lambda: served.append(label), priority=priority)
+        
+        batch = threading.Thread(target=submit, args=(Priority.BATCH, "batch"))
+        batch.start()
+        while scheduler.queue_depth < 1:
+            time.sleep(0.001)
+        interactive = threading.Thread(target=submit, args=(Priority.INTERACTIVE, "interactive"))
+        interactive.start()
+        while scheduler.queue_depth < 2:
+            time.sleep(0.001)
+        # Refill enough for exactly one call; the interactive one must win
+        with scheduler._condition:
+            scheduler._buckets["requests"].tokens = 1.0
+            scheduler._buckets["requests"].updated = time.monotonic()
+            scheduler._condition.notify_all()
+        interactive.join(timeout=5)
+        batch.join(timeout=5)
+        assert served == ["interactive", "batch"]
+        assert scheduler.snapshot()["max_queue_depth"] == 2
+    
+    def test_priority_scope(self):
+        """Test that the context priority defaults to interactive."""
+        assert get_priority() is Priority.INTERACTIVE
+        with priority_scope(Priority.BATCH):
+            assert get_priority() is Priority.BATCH
+        assert get_priority() is Priority.INTERACTIVE
+
+
+class TestNodeScheduling:
+    """Test cases for node LLM calls going through the scheduler."""
+    
+    def test_nodes_retry_instead_of_falling_back(self, scripted_llm):
+        """Test that a rate-limited call is retried rather than defaulted."""
+        scheduler = LLMScheduler(max_retries=2, backoff_base=0.001)
+        llm = scripted_llm(name="Jane Doe")
+        original = llm.invoke
+        failures = [RateLimitError()]
+        
+        def invoke(*args, **kwargs):
+            if failures:
+                raise failures.pop()
+            return original(*args, **kwargs)
+        
+        object.__setattr__(llm, "invoke", invoke)
+        nodes = RecruitmentNodes(llm, cache=None, scheduler=scheduler)
+        assert nodes.extract_candidate_info({"cv_text": "Jane Doe\nEngineer"}) == {"candidate_name": "Jane Doe"}
+        snapshot = scheduler.snapshot()
+        assert snapshot["retries"] == 1 and snapshot["completed"] == 1
+    
+    def test_batch_calls_run_at_batch_priority(self, scripted_llm):
+        """Test that the batch engine marks its LLM calls as batch work."""
+        from app.services.recruitment_agent import RecruitmentAgent
+        
+        seen = set()
+        llm = scripted_llm(score="3")
+        original = llm.invoke
+        
+        def invoke(*args, **kwargs):
+            seen.add(get_priority())
+            return original(*args, **kwargs)
+        
+        object.__setattr__(llm, "invoke", invoke)
+        agent = RecruitmentAgent(llm, cache=None)
+        agent.process_application("Jane Doe\nEngineer", "Python")
+        assert seen == {Priority.INTERACTIVE}
+        seen.clear()
+        list(agent.process_batch([("Jane Doe\nEngineer", "Python")] * 2, max_concurrency=2))
+        assert seen == {Priority.BATCH}
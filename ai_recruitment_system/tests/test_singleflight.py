@@ -0,0 +1,231 @@
+"""
+Tests for coalescing identical in-flight requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from app.core.config import Config
+from app.core.exceptions import AgentWorkflowError
+from app.core.metrics import MetricsAggregator
+from app.core.singleflight import SingleFlight
+from app.services.recruitment_agent import RecruitmentAgent
+
+
+CV_TEXT = "Jane Doe\nPython developer with 6 years of Django and PostgreSQL."
+JOB_TEXT = "Title: Python Backend Developer\nRequirements: Python Django"
+
+
+class TestSingleFlight:
+    """Test cases for the single-flight registry."""
+    
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers arriving while a call runs reuse its result."""
+        flights = SingleFlight(MetricsAggregator())
+        calls = []
+        
+        def work():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"score": 8}
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: flights.do("key", work), range(4)))
+        
+        assert len(calls) == 1
+        assert results == [{"score": 8}] * 4
+        assert len({id(result) for result in results}) == 4
+        assert flights.metrics.counters["coalesced_requests"] == 3
+        assert len(flights) == 0
+    
+    def test_different_keys_run_separately(self):
+        """Test that only identical keys are coalesced."""
+        flights = SingleFlight(MetricsAggregator())
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda key: flights.do(key, lambda: key), ["a", "b"]))
+        assert results == ["a", "b"]
+    
+    def test_errors_reach_every_waiter(self):
+        """Test that a failing call fails its waiters too, then frees the key."""
+        flights = SingleFlight(MetricsAggregator())
+        started = threading.Event()
+        
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flights.do, "key", fail)
+            started.wait()
+            follower = pool.submit(flights.do, "key", lambda: "unused")
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+        assert flights.do("key", lambda: "fresh") == "fresh"
+    
+    def test_async_callers_share_one_execution(self):
+        """Test coalescing of coroutines on an event loop."""
+        flights = SingleFlight(MetricsAggregator())
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+        
+        async def run():
+            return await asyncio.gather(*(flights.ado("key", work) for _ in range(5)))
+        
+        assert asyncio.run(run()) == ["done"] * 5
+        assert len(calls) == 1
+    
+    def test_cancelled_call_is_taken_over(self):
+        """Test that a waiter runs the work itself when the running call is cancelled."""
+        flights = SingleFlight(MetricsAggregator())
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+        
+        async def run():
+            leader = asyncio.create_task(flights.ado("key", work))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(flights.ado("key", work))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower
+        
+        assert asyncio.run(run()) == "done"
+        assert len(calls) == 2
+    
+    def test_cancelled_waiter_leaves_the_call_running(self):
+        """Test that a waiter giving up does not affect the running call or other waiters."""
+        flights = SingleFlight(MetricsAggregator())
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+        
+        async def run():
+            leader = asyncio.create_task(flights.ado("key", work))
+            await asyncio.sleep(0.01)
+            waiters = [asyncio.create_task(flights.ado("key", work)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            waiters[0].cancel()
+            return await asyncio.gather(leader, *waiters, return_exceptions=True)
+        
+        leader, cancelled, waiter = asyncio.run(run())
+        assert (leader, waiter) == ("done", "done")
+        assert isinstance(cancelled, asyncio.CancelledError)
+        assert len(calls) == 1
+        assert len(flights) == 0
+    
+    def test_stream_waiters_get_the_return_value(self):
+        """Test that only the running caller sees streamed items; every caller gets the result."""
+        flights = SingleFlight(MetricsAggregator())
+        started = threading.Event()
+        
+        def work():
+            started.set()
+            yield "progress"
+            time.sleep(0.1)
+            yield "more progress"
+            return "done"
+        
+        def consume():
+            stream = flights.stream("key", work)
+            items = []
+            while True:
+                try:
+                    items.append(next(stream))
+                except StopIteration as stop:
+                    return items, stop.value
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(consume)
+            started.wait()
+            follower = pool.submit(consume)
+            assert leader.result() == (["progress", "more progress"], "done")
+            assert follower.result() == ([], "done")
+    
+    def test_closed_stream_is_taken_over(self):
+        """Test that a waiter runs the work itself when the running stream is closed early."""
+        flights = SingleFlight(MetricsAggregator())
+        
+        def work():
+            yield "progress"
+            return "done"
+        
+        stream = flights.stream("key", work)
+        next(stream)
+        stream.close()
+        assert len(flights) == 0
+        assert list(flights.stream("key", work)) == ["progress"]
+
+
+class TestAgentCoalescing:
+    """Test cases for coalesced application processing."""
+    
+    def test_duplicate_submissions_run_the_graph_once(self, scripted_llm):
+        """Test that identical concurrent applications share one workflow run."""
+        llm = scripted_llm(delay=0.05)
+        agent = RecruitmentAgent(llm, results=None, flights=SingleFlight(MetricsAggregator()))
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: agent.process_application(CV_TEXT, JOB_TEXT), range(4)))
+        
+        assert sum("Rate technical competency" in prompt for prompt in llm.prompts) == 1
+        assert all(result["response"] == results[0]["response"] for result in results)
+        assert agent.flights.metrics.counters["coalesced_requests"] == 3
+    
+    def test_batch_duplicates_are_coalesced(self, scripted_llm):
+        """Test that async batch workers share in-flight duplicates."""
+        llm = scripted_llm(delay=0.05)
+        agent = RecruitmentAgent(llm, results=None, flights=SingleFlight(MetricsAggregator()))
+        
+        results = list(agent.process_batch([(CV_TEXT, JOB_TEXT)] * 3 + [(CV_TEXT + "\nGo", JOB_TEXT)]))
+        
+        assert all(item.ok for item in results)
+        assert sum("Rate technical competency" in prompt for prompt in llm.prompts) == 2
+    
+    def test_duplicate_streams_share_one_checkpoint_thread(self, scripted_llm, monkeypatch, tmp_path):
+        """Test that identical streamed uploads run the graph once instead of resuming each other."""
+        monkeypatch.setattr(Config, "CHECKPOINT_PATH", str(tmp_path / "checkpoints.sqlite3"))
+        llm = scripted_llm(delay=0.05)
+        agent = RecruitmentAgent(llm, results=None, flights=SingleFlight(MetricsAggregator()))
+        
+        def stream():
+            return [event.kind for event in agent.stream_application(CV_TEXT, JOB_TEXT)]
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(stream)
+            time.sleep(0.02)
+            second = pool.submit(stream)
+            kinds = sorted([first.result(), second.result()], key=len)
+        
+        assert sum("Rate technical competency" in prompt for prompt in llm.prompts) == 1
+        assert kinds[0] == ["result"]
+        assert kinds[1][-1] == "result" and "node" in kinds[1]
+    
+    def test_failures_are_shared(self, scripted_llm, monkeypatch):
+        """Test that waiters see the same workflow error as the running request."""
+        agent = RecruitmentAgent(scripted_llm(), results=None, flights=SingleFlight(MetricsAggregator()))
+        
+        def broken(*args):
+            time.sleep(0.05)
+            raise RuntimeError("graph failed")
+        
+        monkeypatch.setattr(agent.workflow, "process_application", broken)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(agent.process_application, CV_TEXT, JOB_TEXT) for _ in range(2)]
+            for future in futures:
+                with pytest.raises(AgentWorkflowError):
+                    future.result()
@@ -0,0 +1,165 @@
+"""
+Tests for the recruitment workflow graph.
+"""
+
+import time
+
+import pytest
+from app.agents.fake_llm import DeterministicChatModel
+from app.agents.workflow import RecruitmentWorkflow
+from app.core.exceptions import ConfigurationError
+from app.services.job_service import JobService
+
+
+CV_TEXT = "Jane Doe\nPython developer with 6 years of Django and PostgreSQL."
+JOB_TEXT = "Title: Python Backend Developer\nRequirements: Python Django"
+
+
+class TestRecruitmentWorkflow:
+    """Test cases for RecruitmentWorkflow routing and parallelism."""
+    
+    @pytest.mark.parametrize("experience, score, expected", [
+        ("Mid-Level", "8", "Congratulations"),
+        ("Senior-Level", "6", "senior recruitment team"),
+        ("Mid-Level", "6", "Thank you for your interest"),
+        ("Entry-Level", "not a number", "Thank you for your interest"),
+    ])
+    def test_routing_decisions(self, scripted_llm, experience, score, expected):
+        """Test that the parallel graph routes like the sequential one did."""
+        llm = scripted_llm(experience=experience, score=score)
+        result = RecruitmentWorkflow(llm).process_application(CV_TEXT, JOB_TEXT)
+        
+        assert result["candidate_name"] == "Jane Doe"
+        assert result["experience_level"] == experience
+        assert result["skill_match"] == "Strong Match"
+        assert expected in result["response"]
+        if expected == "Thank you for your interest":
+            assert result["learning_recommendations"]
+    
+    def test_evaluation_nodes_run_concurrently(self, scripted_llm):
+        """Test that independent evaluation nodes overlap in time."""
+        llm = scripted_llm(delay=0.2)
+        RecruitmentWorkflow(llm).process_application(CV_TEXT, JOB_TEXT)
+        
+        assert llm.max_concurrency == len(RecruitmentWorkflow.EVALUATION_NODES)
+    
+    def test_technical_evaluation_sees_joined_state(self, scripted_llm):
+        """Test that technical evaluation runs after both inputs are available."""
+        llm = scripted_llm(experience="Senior-Level", skills="Partial Match")
+        RecruitmentWorkflow(llm).process_application(CV_TEXT, JOB_TEXT)
+        
+        technical_prompt = next(p for p in llm.prompts if "Rate technical competency" in p)
+        assert "Senior-Level" in technical_prompt
+        assert "Partial Match" in technical_prompt
+    
+    def test_accepts_job_posting(self, scripted_llm):
+        """Test that a JobPosting is sent to the model as its budgeted summary."""
+        job = JobService.get_sample_jobs()["Python Developer"]
+        llm = scripted_llm()
+        result = RecruitmentWorkflow(llm).process_application(CV_TEXT, job)
+        
+        assert result["job_posting"] == job.prompt_text()
+        skills_prompt = next(p for p in llm.prompts if "Assess skill match" in p)
+        assert job.requirements[-1] in skills_prompt
+
+
+class TestStreaming:
+    """Test cases for streamed progress events."""
+    
+    def test_events_arrive_before_the_result(self, scripted_llm):
+        """Test that fields are reported as their nodes finish, before the final result."""
+        events = list(RecruitmentWorkflow(scripted_llm(score="3")).stream_application(CV_TEXT, JOB_TEXT))
+        kinds = [event.kind for event in events]
+        nodes = [event.node for event in events if event.kind == "node"]
+        
+        assert kinds[-1] == "result" and kinds.count("result") == 1
+        assert nodes.index("extract_info") < nodes.index("technical_evaluation") < nodes.index("reject_with_feedback")
+        update = next(event.update for event in events if event.node == "extract_info")
+        assert update["candidate_name"] == "Jane Doe"
+    
+    def test_result_matches_process_application(self, scripted_llm):
+        """Test that the streamed result equals the blocking one."""
+        workflow = RecruitmentWorkflow(scripted_llm(score="3"))
+        expected = workflow.process_application(CV_TEXT, JOB_TEXT)
+        result = list(workflow.stream_application(CV_TEXT, JOB_TEXT))[-1].update
+        
+        for field in ("candidate_name", "technical_score", "response", "learning_recommendations"):
+            assert result[field] == expected[field]
+        assert set(result["metrics"]) == set(expected["metrics"])
+    
+    def test_recommendations_stream_token_by_token(self):
+        """Test that learning recommendations arrive in several chunks adding up to the final text."""
+        llm = DeterministicChatModel()
+        events = list(RecruitmentWorkflow(llm, cache=None).stream_application(CV_TEXT, JOB_TEXT))
+        result = events[-1].update
+        tokens = [event.text for event in events if event.kind == "token"]
+        
+        assert len(tokens) > 1
+        assert "".join(tokens) == result["learning_recommendations"]
+        assert all(event.node == "reject_with_feedback" for event in events if event.kind == "token")
+    
+    def test_interrupted_stream_is_not_replayed(self):
+        """Test that a stream failing after its first chunk is not retried into duplicate tokens."""
+        class ServiceUnavailableError(Exception):
+            status_code = 503
+        
+        streams = []
+        
+        class InterruptedChatModel(DeterministicChatModel):
+            def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+                streams.append(messages)
+                yield next(super()._stream(messages, stop, run_manager, **kwargs))
+                raise ServiceUnavailableError()
+        
+        events = list(RecruitmentWorkflow(InterruptedChatModel(), cache=None).stream_application(CV_TEXT, JOB_TEXT))
+        assert len(streams) == 1
+        assert len([event for event in events if event.kind == "token"]) == 1
+        assert events[-1].update["learning_recommendations"].startswith("Focus on building")
+    
+    def test_first_content_precedes_completion(self, scripted_llm):
+        """Test that the first evaluated field is available well before the run ends."""
+        started = time.perf_counter()
+        first_field = None
+        for event in RecruitmentWorkflow(scripted_llm(delay=0.1, score="3")).stream_application(CV_TEXT, JOB_TEXT):
+            if first_field is None and event.kind == "node" and event.update.get("candidate_name"):
+                first_field = time.perf_counter() - started
+        total = time.perf_counter() - started
+        
+        assert first_field < total - 0.15
+
+
+class TestFusedEvaluation:
+    """Test cases for the single-call fused evaluation mode."""
+    
+    @pytest.mark.parametrize("experience, score, expected", [
+        ("Mid-Level", "9", "Congratulations"),
+        ("Senior-Level", "6", "senior recruitment team"),
+        ("Entry-Level", "3", "Thank you for your interest"),
+    ])
+    def test_fused_mode_matches_parallel_fields(self, scripted_llm, experience, score, expected):
+        """Test that fused mode fills the same state fields with one evaluation call."""
+        llm = scripted_llm(experience=experience, score=score)
+        workflow = RecruitmentWorkflow(llm, evaluation_mode="fused")
+        result = workflow.process_application(CV_TEXT, JOB_TEXT)
+        
+        assert result["candidate_name"] == "Jane Doe"
+        assert result["experience_level"] == experience
+        assert result["skill_match"] == "Strong Match"
+        assert result["technical_score"] == score
+        assert expected in result["response"]
+        evaluation_calls = [p for p in llm.prompts if "learning recommendations" not in p]
+        assert len(evaluation_calls) == 1
+    
+    def test_fused_mode_falls_back_on_invalid_schema(self, scripted_llm):
+        """Test that output failing schema validation uses the default fields."""
+        llm = scripted_llm(score="42")
+        result = RecruitmentWorkflow(llm, evaluation_mode="fused").process_application(CV_TEXT, JOB_TEXT)
+        
+        assert result["candidate_name"] == "Unknown Candidate"
+        assert result["technical_score"] == "5"
+        assert "Thank you for your interest" in result["response"]
+    
+    def test_unknown_mode_is_rejected(self, scripted_llm):
+        """Test that an unknown evaluation mode raises a configuration error."""
+        with pytest.raises(ConfigurationError):
+            RecruitmentWorkflow(scripted_llm(), evaluation_mode="serial")